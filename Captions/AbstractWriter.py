@@ -13,8 +13,11 @@ sys.path.append("~/Documents/GitHub/Voices-Now-SRT-Generator/ProTools")
 sys.path.append("~/Documents/GitHub/Voices-Now-SRT-Generator/Scripts")
 sys.path.append("~/Documents/GitHub/Voices-Now-SRT-Generator/Captions")
 
-from Captions.TimeFormats.LinkedList import LinkedList
-from ProTools.Session import Session
+from Captions.TimeFormats.Timeline import Timeline
+from Captions.TimeFormats.TimelineBuilder import TimelineBuilder, get_track
+from ProTools.LazySession import LazySession
+from ProTools.SessionCache import SessionCache
+from ProTools.Timecode import Timecode
 from Scripts.Parser import Parser
 import logging, sys
 
@@ -23,34 +26,81 @@ logging.basicConfig(stream=sys.stderr, level=logging.DEBUG)
 # Error Messages
 INVALID_DATA_TYPE = "Error: Invalid data type: {0}"
 NO_TIMECODE_FILE = "Error: No timecode file provided and no timecodes found in script file"
+INVALID_OFFSET_COUNT = "Error: {0} timecode offsets were given for {1} timecode files"
+
+# Defaults
+DEFAULT_EDL_TRACK = 0 # The first track is used when no track name is given
 
 class AbstractWriter:
     def __init__(self, script_filename: str, timecode_filename: str,
-                 final_filename: str, data_type: str = "MRK"):
+                 final_filename: str, data_type: str = "MRK",
+                 sample_accurate: bool = False, session_cache: SessionCache = None,
+                 tail_duration: Timecode = None, timecode_offsets: list[Timecode] = None,
+                 columnar: bool = False, edl_track: str = None):
         
         self.script_parser = Parser()
         self.script = self.script_parser.parse_script(script_filename)
 
         self.final_filename = final_filename
         self.data_type = data_type
+        self.sample_accurate = sample_accurate
+        self.columnar = columnar
+        self.edl_track = edl_track if edl_track is not None else DEFAULT_EDL_TRACK
+        self.session_cache = session_cache
+        self.tail_duration = tail_duration
+        self.timecode_offsets = timecode_offsets
+        self.provenance = {}
 
         self.data_manager = self.create_data_manager(data_type, timecode_filename)
 
         
+    def load_session(self, timecode_filename: str):
+        if self.session_cache is not None:
+            return self.session_cache.load(timecode_filename, self.sample_accurate, self.columnar)
+
+        return LazySession.from_file(timecode_filename, self.sample_accurate, self.columnar)
+
+
+    # Merge several exports, such as one per reel, into a single timeline
+    def merge_sessions(self, data_type: str, timecode_filenames: list[str]) -> Timeline:
+        builder = TimelineBuilder(data_type)
+        offsets = (self.timecode_offsets if self.timecode_offsets is not None
+                   else [None] * len(timecode_filenames))
+
+        assert len(offsets) == len(timecode_filenames), \
+            INVALID_OFFSET_COUNT.format(len(offsets), len(timecode_filenames))
+
+        for timecode_filename, offset in zip(timecode_filenames, offsets):
+            builder.add_session(timecode_filename, self.load_session(timecode_filename), offset,
+                                track=self.edl_track)
+
+        data_manager = builder.build(self.tail_duration)
+        self.provenance = builder.provenance
+
+        return data_manager
+
+
     def create_data_manager(self, data_type: str, timecode_filename: str = None):
-        data_manager = LinkedList(data_type)
+        data_manager = Timeline(data_type)
         session = None
 
         if data_type == "SPT":
             data_manager.append_list_to_end(self.script.loops)
+            data_manager.finalize(self.tail_duration)
             return data_manager
+
+        if isinstance(timecode_filename, (list, tuple)):
+            return self.merge_sessions(data_type, timecode_filename)
         
-        session = Session.from_file(timecode_filename)
+        session = self.load_session(timecode_filename)
 
         if data_type == "MRK":
             data_manager.append_list_to_end(session.markers)
         elif data_type == "EDL":
-            data_manager.append_list_to_end(session.tracks[0].channels[0])
+            data_manager.append_list_to_end(get_track(session, self.edl_track).channels[0])
+
+        # Work out every end time once so reading through the data only looks them up
+        data_manager.finalize(self.tail_duration)
 
         return data_manager
 
@@ -8,12 +8,17 @@ from Captions.SRTManager import SRTManager
 from Captions.TimeFormats.Nodes import INode
 from Languages.LanguageSpecificSRTManagers import LANG_SPECIFIC_SRT_INIT
 from ProTools.Timecode import Timecode, OffsetType
+from ProTools.SessionCache import SessionCache
 
 
 class CaptionMaker(AbstractWriter):
     def __init__(self, script_filename: str, timecode_filename: str, data_type: str, lang_code: str,
-                 srt_filename: str, max_line_len: int,  split: bool = True):
-        super().__init__(script_filename, timecode_filename, srt_filename, data_type)
+                 srt_filename: str, max_line_len: int,  split: bool = True,
+                 sample_accurate: bool = False, session_cache: SessionCache = None,
+                 tail_duration: Timecode = None, timecode_offsets: list[Timecode] = None,
+                 columnar: bool = False, edl_track: str = None):
+        super().__init__(script_filename, timecode_filename, srt_filename, data_type, sample_accurate,
+                         session_cache, tail_duration, timecode_offsets, columnar, edl_track)
 
         self.split = split
 
@@ -1,6 +1,8 @@
 import re
 import codecs
 from ProTools.Timecode import Timecode, OffsetType
+from ProTools.SampleTime import SampleTime
+from ProTools.Retime import Retimer
 from Languages.LanguageSpecificPunctuationPriority import PRIORITY_BY_LANGUAGE as LANGUAGE, PRIORITY_BY_SCRIPT as SCRIPT_TYPES
 from Languages.LanguageDatabase import LanguageDatabase
 from Captions.TextFormats.SRT import SRT
@@ -13,8 +15,8 @@ DEFAULT_SCRIPT_TYPE = "Latin"  # Default script type
 class SRTManager:
     def __init__(self, srt_filename: str, max_line_len: int = MAX_LINE_LEN,
                  lang_code: str = "ENG", sentence_d = '', word_d = '',
-                 timecode_offset: Timecode = None, timecode_offset_type: OffsetType = None,
-                 srtID_offset: int = 1):
+                 timecode_offset: Timecode = None, timecode_offset_type: OffsetType = OffsetType.DELAY,
+                 srtID_offset: int = 1, retimer: Retimer = None):
         self.lang_manager = LanguageDatabase()
 
         self.current_srt_id = srtID_offset
@@ -37,6 +39,10 @@ class SRTManager:
         self.timecode_offset = timecode_offset
         self.timecode_offset_type = timecode_offset_type
 
+        if retimer is None and timecode_offset is not None:
+            retimer = Retimer.from_offset(timecode_offset, timecode_offset_type)
+        self.retimer = retimer
+
 
     def create_caption(self, translation: str, in_time: Timecode, out_time: Timecode, split: bool = True) -> None:
         translation = translation.replace("(R)", "")
@@ -84,11 +90,14 @@ class SRTManager:
 
 
     def weighted_average(self, in_time: Timecode, out_time: Timecode, n: int, index: int) -> Timecode:
+        if isinstance(in_time, SampleTime):
+            return in_time.interpolate(out_time, index, n)
+
         in_frame = in_time.get_total_frames()
         out_frame = out_time.get_total_frames()
         average_frame = int((in_frame * (n - index) + out_frame * index) / n)
 
-        return Timecode.from_total_frames(average_frame, in_time.frame_rate)
+        return Timecode.from_total_frames(average_frame, in_time.frame_rate, in_time.drop_frame)
 
 
     def find_split_index(self, text: str, prioritize: bool = True) -> int:
@@ -135,9 +144,16 @@ class SRTManager:
 
 
     def offset_timecode(self, timecode: Timecode) -> Timecode:
-        if self.timecode_offset is None:
+        if self.retimer is None:
             return timecode
-        elif self.timecode_offset_type == OffsetType.ADVANCE:
-            return timecode - self.timecode_offset
-        elif self.timecode_offset_type == OffsetType.DELAY:
-            return timecode + self.timecode_offset
\ No newline at end of file
+
+        return self.retimer.apply(timecode)
+
+
+    def retime_captions(self, retimer: Retimer) -> None:
+        """Retime every caption created so far in one sorted sweep
+
+        Keyword arguments:
+        retimer: Retimer -- the piecewise offsets to apply
+        """
+        retimer.retime_captions(self.srt_blocks)
\ No newline at end of file
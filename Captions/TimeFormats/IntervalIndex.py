@@ -0,0 +1,195 @@
+import heapq
+import sys
+from itertools import chain
+from typing import Callable, Iterable
+
+from Captions.TimeFormats.Nodes.INode import INode
+from ProTools.EDL import EDL
+from ProTools.Timecode import Timecode
+from ProTools.Track import Track
+
+# Bounds
+OPEN_END = sys.maxsize # End frame of an interval with no end time
+
+# Error Messages
+INVALID_RANGE = "The end of a range must not be before its start"
+
+# ----------------------------------------------------------------------
+
+def get_frames(time, default: int = OPEN_END) -> int:
+    """Get the frame count of a Timecode or SampleTime, or a default for None"""
+
+    return time.get_total_frames() if time is not None else default
+
+
+class IntervalIndex:
+    """A static interval tree over the start and end frames of timed items
+
+    The intervals are half open, [start, end), and are kept in lists sorted by
+    start frame. The tree is implicit: the middle of every range of the lists
+    is the root of that range, and max_ends holds the latest end frame under
+    each root, so a query skips any subtree that ends before it. Stabbing and
+    range queries cost O(log n + k) for k results. Items without an end time,
+    such as the last marker on a timeline, are treated as never ending.
+    """
+
+    def __init__(self, items: Iterable, get_start: Callable, get_end: Callable):
+        """Constructor for the IntervalIndex class
+
+        Keyword arguments:
+        items: Iterable -- the items to index
+        get_start: Callable -- gets the start Timecode of an item
+        get_end: Callable -- gets the end Timecode of an item, or None if it has no end
+        """
+
+        intervals = sorted(((get_frames(get_start(item)), get_frames(get_end(item)), item)
+                            for item in items), key=lambda interval: interval[0])
+
+        self.starts = [start for start, _, _ in intervals]
+        self.ends = [max(start, end) for start, end, _ in intervals]
+        self.items = [item for _, _, item in intervals]
+        self.max_ends = [0] * len(intervals)
+
+        self.__build(0, len(intervals))
+
+
+    @classmethod
+    def from_nodes(cls, nodes: Iterable[INode]) -> 'IntervalIndex':
+        """Constructor for the IntervalIndex class based on MarkerNodes or EDLNodes
+
+        Keyword arguments:
+        nodes: Iterable[INode] -- the nodes, such as a Timeline
+        """
+
+        return cls(nodes, lambda node: node.get_start_time(), lambda node: node.get_end_time())
+
+
+    @classmethod
+    def from_edls(cls, edls: Iterable[EDL]) -> 'IntervalIndex':
+        """Constructor for the IntervalIndex class based on EDLs or EDLTable rows
+
+        Keyword arguments:
+        edls: Iterable[EDL] -- the EDLs
+        """
+
+        return cls(edls, lambda edl: edl.start_time, lambda edl: edl.end_time)
+
+
+    @classmethod
+    def from_track(cls, track: Track) -> 'IntervalIndex':
+        """Constructor for the IntervalIndex class based on every channel of a Track
+
+        Keyword arguments:
+        track: Track -- the track, with channels as lists or EDLTables
+        """
+
+        return cls.from_edls(chain.from_iterable(track.channels))
+
+
+    # Private -----------------------------------------------------------------
+    def __build(self, low: int, high: int) -> int:
+        """Fill max_ends for the subtree rooted in the middle of [low, high)"""
+
+        if low >= high:
+            return -1
+
+        middle = (low + high) // 2
+        self.max_ends[middle] = max(self.ends[middle], self.__build(low, middle),
+                                    self.__build(middle + 1, high))
+
+        return self.max_ends[middle]
+
+
+    def __collect(self, low: int, high: int, start: int, end: int, found: list[int]) -> None:
+        """Add the indices in [low, high) that overlap [start, end) in start order"""
+
+        if low >= high:
+            return
+
+        middle = (low + high) // 2
+        if self.max_ends[middle] <= start:
+            return
+
+        self.__collect(low, middle, start, end, found)
+
+        if self.starts[middle] < end:
+            if self.ends[middle] > start:
+                found.append(middle)
+            self.__collect(middle + 1, high, start, end, found)
+
+
+    def __query(self, start: int, end: int) -> list:
+        found = []
+        self.__collect(0, len(self.items), start, end, found)
+
+        return [self.items[index] for index in found]
+
+
+    # Public ------------------------------------------------------------------
+    def stab(self, time: Timecode) -> list:
+        """Get the items active at a point in time, in start order
+
+        Keyword arguments:
+        time: Timecode -- the point in time
+        """
+
+        frames = get_frames(time)
+
+        return self.__query(frames, frames + 1)
+
+
+    def get_range(self, start: Timecode, end: Timecode) -> list:
+        """Get the items that overlap the range [start, end), in start order
+
+        Keyword arguments:
+        start: Timecode -- the start of the range
+        end: Timecode -- the end of the range
+        """
+
+        start, end = get_frames(start), get_frames(end)
+        assert start <= end, INVALID_RANGE
+
+        return self.__query(start, end)
+
+
+    def get_overlaps(self) -> list[tuple]:
+        """Get every pair of items that overlap, in one sweep by start time
+
+        The earlier item of each pair comes first.
+        """
+
+        overlaps = []
+        active = [] # Heap of (end, index)
+
+        for index, (start, item) in enumerate(zip(self.starts, self.items)):
+            while len(active) > 0 and active[0][0] <= start:
+                heapq.heappop(active)
+
+            overlaps.extend((self.items[other], item)
+                            for other in sorted(other for _, other in active))
+            heapq.heappush(active, (self.ends[index], index))
+
+        return overlaps
+
+
+    def get_gaps(self) -> list[tuple]:
+        """Get the gaps in coverage between the first start and the last end
+
+        Each gap is given as the pair of items around it: the item with the
+        latest end before the gap and the first item after it.
+        """
+
+        gaps = []
+        latest = None
+
+        for index, start in enumerate(self.starts):
+            if latest is not None and self.ends[latest] < start:
+                gaps.append((self.items[latest], self.items[index]))
+            if latest is None or self.ends[index] > self.ends[latest]:
+                latest = index
+
+        return gaps
+
+
+    def __len__(self):
+        return len(self.items)
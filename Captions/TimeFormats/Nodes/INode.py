@@ -8,4 +8,7 @@ class INode:
         pass
 
     def get_end_time(self) -> Timecode:
+        pass
+
+    def set_end_time(self, end_time: Timecode) -> None:
         pass
\ No newline at end of file
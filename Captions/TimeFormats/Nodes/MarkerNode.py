@@ -9,6 +9,7 @@ class MarkerNode(INode):
     def __init__(self, marker: Marker):
         self.__start_marker : Marker = marker
         self.__end_marker : Marker = None
+        self.__end_time : Timecode = None
         self._next : MarkerNode = None
         self._previous : MarkerNode = None
 
@@ -19,15 +20,21 @@ class MarkerNode(INode):
         return self.__start_marker.location
 
     def get_end_time(self) -> Timecode:
-        # If there is no end marker, return the next marker
+        # If there is no end marker, use the end time set when the timeline
+        # was finalized, or else the start of the next marker
         end = None
 
         if self.__end_marker != None:
             end = self.__end_marker.location
+        elif self.__end_time != None:
+            end = self.__end_time
         elif self._next != None:
-            end = self._next.__start_marker.location
+            end = self._next.get_start_time()
         
         return end
+
+    def set_end_time(self, end_time: Timecode) -> None:
+        self.__end_time = end_time
     
     @classmethod
     def from_loop(cls, loop: Loop) -> 'MarkerNode':
@@ -0,0 +1,320 @@
+import numpy as np
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator
+
+from Captions.TimeFormats.Nodes.INode import INode
+from Captions.TimeFormats.Nodes.AbstractNodeFactory import initialize_node_factory
+from ProTools.Timecode import Timecode
+
+STARTING_INDEX = 0
+ENDING_INDEX = -1
+MISSING_FRAMES = -1 # Frame count stored for a node with no start or end time
+
+INVALID_INDEX_ERROR = "Index out of bounds"
+INVALID_LENGTH_ERROR = "Length must be greater than or equal to 0"
+INVALD_LOOP_ID_ERROR = "Loop ID not found"
+
+def get_start_key(node: INode, sequence: int) -> tuple:
+    """Get the key a node is ordered by on the timeline
+
+    Nodes without a start time sort after every timed node. Nodes with the
+    same start time are ordered by the sequence number they were added with,
+    so every key is unique.
+
+    Keyword arguments:
+    node: INode -- the node to order
+    sequence: int -- the number of nodes added to the timeline before this one
+    """
+
+    start_time = node.get_start_time()
+
+    return (start_time is None, start_time, sequence)
+
+
+def get_frames(time) -> int:
+    """Get the frame count of a Timecode or SampleTime, or MISSING_FRAMES for None"""
+
+    return time.get_total_frames() if time is not None else MISSING_FRAMES
+
+
+class Timeline:
+    """Nodes kept in a list sorted by start time
+
+    Indexing is O(1) and a node is inserted by binary search on its start
+    time, so nodes that arrive in order are simply appended. Nodes with the
+    same start time keep the order they were added in. The _next and
+    _previous links of the nodes are kept up to date so nodes can still read
+    their neighbours.
+
+    A dictionary from loop ID to the nodes with that ID is kept alongside the
+    list. Keys are unique, so a node's position is found again by one binary
+    search on its key, and looking up or removing a loop by ID does not walk
+    the timeline even when many nodes start at the same time.
+    The same loop ID can appear more than once, for example on several EDL
+    channels.
+
+    Like LinkedList, the timeline can be walked with should_continue and
+    iterate_current_node, or iterated over directly.
+
+    finalize works out the end time of every marker in one sweep and stores
+    the start and end frames of every node in start_frames and end_frames.
+    Inserting or removing a node clears them until the next finalize.
+    """
+
+    def __init__(self, data_type: str):
+        """Constructor for the Timeline class
+
+        Keyword arguments:
+        data_type: str -- the type of data the nodes hold (MRK, EDL or SPT)
+        """
+
+        self.__nodes: list[INode] = []
+        self.__keys: list[tuple] = []
+        self.__loops: dict[str, list[tuple[tuple, INode]]] = {}
+        self.__current = 0
+        self.__sequence = 0
+
+        self.start_frames: np.ndarray = None
+        self.end_frames: np.ndarray = None
+
+        self.node_factory = initialize_node_factory(data_type)
+
+
+    # Private -----------------------------------------------------------------
+    def __validate_index(self, index: int) -> int:
+        if index < 0:
+            index += len(self.__nodes)
+
+        assert 0 <= index < len(self.__nodes), INVALID_INDEX_ERROR
+
+        return index
+
+
+    def __validate_not_empty(self) -> None:
+        assert len(self.__nodes) > 0, INVALID_LENGTH_ERROR
+
+
+    def __get_neighbour(self, index: int) -> INode:
+        return self.__nodes[index] if 0 <= index < len(self.__nodes) else None
+
+
+    def __link(self, index: int) -> None:
+        """Point the node at an index and its neighbours at each other"""
+
+        node = self.__nodes[index]
+        previous = self.__get_neighbour(index - 1)
+        next = self.__get_neighbour(index + 1)
+
+        node._previous = previous
+        node._next = next
+
+        if previous is not None:
+            previous._next = node
+        if next is not None:
+            next._previous = node
+
+
+    def __invalidate(self, index: int) -> None:
+        """Clear the finalized end time of the node before an index"""
+
+        previous = self.__get_neighbour(index - 1)
+        if previous is not None:
+            previous.set_end_time(None)
+
+        self.start_frames = None
+        self.end_frames = None
+
+
+    def __find_index(self, key: tuple) -> int:
+        """Get the position of the node inserted with a start key"""
+
+        return bisect_left(self.__keys, key)
+
+
+    def __unlink(self, index: int) -> None:
+        """Point the neighbours of the node at an index at each other"""
+
+        previous = self.__get_neighbour(index - 1)
+        next = self.__get_neighbour(index + 1)
+
+        if previous is not None:
+            previous._next = next
+        if next is not None:
+            next._previous = previous
+
+
+    # Public ------------------------------------------------------------------
+    def insert(self, data) -> INode:
+        """Create a node and insert it after every node that starts at or before it
+
+        Keyword arguments:
+        data: Marker, EDL or Loop -- the data to create the node from
+
+        Returns the new node.
+        """
+
+        node = self.node_factory.create_node(data)
+        key = get_start_key(node, self.__sequence)
+        self.__sequence += 1
+
+        if len(self.__keys) == 0 or not key < self.__keys[ENDING_INDEX]:
+            index = len(self.__nodes)
+        else:
+            index = bisect_right(self.__keys, key)
+
+        self.__nodes.insert(index, node)
+        self.__keys.insert(index, key)
+        self.__link(index)
+        self.__invalidate(index)
+        self.__loops.setdefault(node.get_loop_id(), []).append((key, node))
+
+        if index < self.__current:
+            self.__current += 1
+
+        return node
+
+
+    def append_list_to_end(self, data: Iterable) -> None:
+        """Insert every item of a list in start time order
+
+        Keyword arguments:
+        data: Iterable -- the Markers, EDLs or Loops to add
+        """
+
+        for item in data:
+            self.insert(item)
+
+
+    def finalize(self, tail_duration: Timecode = None) -> None:
+        """Work out the end time of every node and store the start and end frames
+
+        Markers without an end marker end where the next node starts. The
+        last marker ends tail_duration after it starts, or has no end time if
+        tail_duration is None. EDLs keep their own end times.
+
+        Keyword arguments:
+        tail_duration: Timecode -- how long the last marker lasts (default None)
+        """
+
+        for node, next in zip(self.__nodes, self.__nodes[1:]):
+            node.set_end_time(next.get_start_time())
+
+        if len(self.__nodes) > 0:
+            last = self.__nodes[ENDING_INDEX]
+            start_time = last.get_start_time()
+            last.set_end_time(start_time + tail_duration
+                              if tail_duration is not None and start_time is not None else None)
+
+        self.start_frames = np.fromiter((get_frames(node.get_start_time()) for node in self.__nodes),
+                                        dtype=np.int64, count=len(self.__nodes))
+        self.end_frames = np.fromiter((get_frames(node.get_end_time()) for node in self.__nodes),
+                                      dtype=np.int64, count=len(self.__nodes))
+
+
+    def is_finalized(self) -> bool:
+        return self.start_frames is not None
+
+
+    def should_continue(self) -> bool:
+        return self.__current < len(self.__nodes)
+
+
+    def iterate_current_node(self) -> INode:
+        if not self.should_continue():
+            return None
+
+        current = self.__nodes[self.__current]
+        self.__current += 1
+
+        return current
+
+
+    def reset(self) -> None:
+        self.__current = STARTING_INDEX
+
+
+    def get_node_at_index(self, index: int) -> INode:
+        return self.__nodes[self.__validate_index(index)]
+
+
+    def remove_node_at_index(self, index: int) -> None:
+        index = self.__validate_index(index)
+
+        self.__unlink(index)
+        self.__invalidate(index)
+        node = self.__nodes.pop(index)
+        del self.__keys[index]
+        node._next = None
+        node._previous = None
+        node.set_end_time(None)
+
+        loop_id = node.get_loop_id()
+        nodes = self.__loops[loop_id]
+        nodes.pop(next(position for position, (_, other) in enumerate(nodes) if other is node))
+        if len(nodes) == 0:
+            del self.__loops[loop_id]
+
+        if index < self.__current:
+            self.__current -= 1
+
+
+    def remove_node_at_start(self) -> None:
+        self.__validate_not_empty()
+        self.remove_node_at_index(STARTING_INDEX)
+
+
+    def remove_node_at_end(self) -> None:
+        self.__validate_not_empty()
+        self.remove_node_at_index(ENDING_INDEX)
+
+
+    def remove_node_with_loop_id(self, loop_id: str) -> None:
+        """Remove the first node with a loop ID"""
+
+        self.remove_node_at_index(self.get_index_from_loop_id(loop_id))
+
+
+    def remove_nodes_with_loop_id(self, loop_id: str) -> None:
+        """Remove every node with a loop ID"""
+
+        for index in reversed(self.get_indices_from_loop_id(loop_id)):
+            self.remove_node_at_index(index)
+
+
+    def has_loop_id(self, loop_id: str) -> bool:
+        return loop_id in self.__loops
+
+
+    def get_indices_from_loop_id(self, loop_id: str) -> list[int]:
+        """Get the positions of every node with a loop ID in timeline order"""
+
+        if loop_id not in self.__loops:
+            raise ValueError(INVALD_LOOP_ID_ERROR)
+
+        return sorted(self.__find_index(key) for key, _ in self.__loops[loop_id])
+
+
+    def get_index_from_loop_id(self, loop_id: str) -> int:
+        """Get the position of the first node with a loop ID"""
+
+        return self.get_indices_from_loop_id(loop_id)[STARTING_INDEX]
+
+
+    def get_nodes_with_loop_id(self, loop_id: str) -> list[INode]:
+        """Get every node with a loop ID in timeline order"""
+
+        return [self.__nodes[index] for index in self.get_indices_from_loop_id(loop_id)]
+
+
+    def __len__(self):
+        return len(self.__nodes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.__nodes[index]
+
+        return self.get_node_at_index(index)
+
+    def __iter__(self) -> Iterator[INode]:
+        for node in self.__nodes:
+            yield node
@@ -0,0 +1,247 @@
+import heapq
+from typing import Iterable, Iterator
+
+from Captions.TimeFormats.Timeline import Timeline
+from ProTools.EDL import EDL
+from ProTools.EDLTable import EDLRow
+from ProTools.Marker import Marker
+from ProTools.Retime import Retimer
+from ProTools.Timecode import Timecode, OffsetType
+
+# Data Types
+MARKER_DATA_TYPES = ("MRK", "SPT")
+EDL_DATA_TYPE = "EDL"
+
+# Defaults
+FIRST_ID = 1
+
+# Error Messages
+INVALID_DATA_TYPE = "Invalid data type: {0}"
+INVALID_ITEM = "Source {0} contains an item that is not a Marker or EDL"
+INVALID_FIRST_ID = "The first ID must be greater than or equal to 0"
+
+# ----------------------------------------------------------------------
+
+def get_start_time(item):
+    """Get the start time of a Marker or EDL"""
+
+    return item.location if isinstance(item, Marker) else item.start_time
+
+
+def get_track(session, track: int | str):
+    """Get a track of a Session by its index or its name"""
+
+    return session.get_track(track) if isinstance(track, str) else session.tracks[track]
+
+
+def copy_item(item):
+    """Copy a Marker or EDL without running its constructor checks again"""
+
+    clone = object.__new__(type(item))
+    clone.__dict__.update(item.__dict__)
+
+    return clone
+
+
+class Provenance:
+    """Where an item of a merged timeline came from"""
+
+    __slots__ = ("source", "index", "original_id")
+
+    def __init__(self, source: str, index: int, original_id: int):
+        """Constructor for the Provenance class
+
+        Keyword arguments:
+        source: str -- the name of the source
+        index: int -- the position of the item in its source
+        original_id: int -- the marker ID or EDL event number in the source
+        """
+
+        self.source = source
+        self.index = index
+        self.original_id = original_id
+
+
+    def __eq__(self, other):
+        if isinstance(other, Provenance):
+            return (self.source == other.source and
+                    self.index == other.index and
+                    self.original_id == other.original_id)
+
+        return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return f"Provenance({self.source!r}, {self.index}, {self.original_id})"
+
+
+class TimelineSource:
+    """A named list of Markers or EDLs in start order with an offset"""
+
+    def __init__(self, name: str, items: Iterable, offset: Timecode = None,
+                 offset_type: OffsetType = OffsetType.DELAY):
+        """Constructor for the TimelineSource class
+
+        Keyword arguments:
+        name: str -- the name the merged items are traced back to, such as a filename
+        items: Iterable -- the Markers, EDLs or EDLTable rows, in start order
+        offset: Timecode -- the amount to move every item by (default None)
+        offset_type: OffsetType -- whether to advance or delay the items (default DELAY)
+        """
+
+        self.name = name
+        self.items = items
+        self.retimer = Retimer.from_offset(offset, offset_type) if offset is not None else None
+
+
+    @classmethod
+    def from_session(cls, name: str, session, data_type: str = "MRK", offset: Timecode = None,
+                     offset_type: OffsetType = OffsetType.DELAY, track: int | str = 0,
+                     channel: int = 0) -> 'TimelineSource':
+        """Constructor for the TimelineSource class based on a Session
+
+        Keyword arguments:
+        name: str -- the name the merged items are traced back to
+        session: Session -- the parsed Pro Tools session
+        data_type: str -- MRK to read the markers or EDL to read a channel (default MRK)
+        offset: Timecode -- the amount to move every item by (default None)
+        offset_type: OffsetType -- whether to advance or delay the items (default DELAY)
+        track: int | str -- the index or name of the track to read EDLs from (default 0)
+        channel: int -- the index of the channel to read EDLs from (default 0)
+        """
+
+        if data_type in MARKER_DATA_TYPES:
+            items = session.markers
+        elif data_type == EDL_DATA_TYPE:
+            items = get_track(session, track).channels[channel]
+        else:
+            raise ValueError(INVALID_DATA_TYPE.format(data_type))
+
+        return cls(name, items, offset, offset_type)
+
+
+    def iterate(self) -> Iterator[tuple]:
+        """Yield a retimed copy of each item with its provenance in start order
+
+        The items of the source are left unchanged. Sources are usually
+        already in start order, so the stable sort is cheap and keeps the
+        order of items that start together.
+        """
+
+        retimed = []
+
+        for index, item in enumerate(self.items):
+            if isinstance(item, EDLRow):
+                item = item.to_edl()
+            else:
+                item = copy_item(item)
+
+            if isinstance(item, Marker):
+                original_id = item.id
+                if self.retimer is not None:
+                    item.location = self.retimer.apply(item.location)
+            elif isinstance(item, EDL):
+                original_id = item.event
+                if self.retimer is not None:
+                    item.start_time = self.retimer.apply(item.start_time)
+                    item.end_time = self.retimer.apply(item.end_time)
+            else:
+                raise TypeError(INVALID_ITEM.format(self.name))
+
+            retimed.append((item, Provenance(self.name, index, original_id)))
+
+        retimed.sort(key=lambda pair: get_start_time(pair[0]))
+
+        yield from retimed
+
+
+class TimelineBuilder:
+    """Merge several sources into one Timeline in a single pass
+
+    Each source is sorted by start time, so the sources are k-way merged
+    with a heap holding one item per source, costing O(n log k) for n items
+    from k sources. The merged items reach the Timeline in order and are
+    appended without searching. Marker IDs or EDL event numbers are
+    renumbered in merged order, and the provenance of every item is kept by
+    its new ID.
+    """
+
+    def __init__(self, data_type: str = "MRK"):
+        """Constructor for the TimelineBuilder class
+
+        Keyword arguments:
+        data_type: str -- the type of data to merge (MRK, EDL or SPT)
+        """
+
+        assert (data_type in MARKER_DATA_TYPES or
+                data_type == EDL_DATA_TYPE), INVALID_DATA_TYPE.format(data_type)
+
+        self.data_type = data_type
+        self.sources: list[TimelineSource] = []
+        self.provenance: dict[int, Provenance] = {}
+
+
+    def add_source(self, source: TimelineSource) -> 'TimelineBuilder':
+        self.sources.append(source)
+
+        return self
+
+
+    def add_session(self, name: str, session, offset: Timecode = None,
+                    offset_type: OffsetType = OffsetType.DELAY, track: int | str = 0,
+                    channel: int = 0) -> 'TimelineBuilder':
+        return self.add_source(TimelineSource.from_session(name, session, self.data_type, offset,
+                                                           offset_type, track, channel))
+
+
+    def add_items(self, name: str, items: Iterable, offset: Timecode = None,
+                  offset_type: OffsetType = OffsetType.DELAY) -> 'TimelineBuilder':
+        """Add a marker list or an EDL channel as a source"""
+
+        return self.add_source(TimelineSource(name, items, offset, offset_type))
+
+
+    def merge(self) -> Iterator[tuple]:
+        """Yield every retimed item with its provenance in start order
+
+        Items that start at the same time keep the order their sources were
+        added in.
+        """
+
+        return heapq.merge(*(source.iterate() for source in self.sources),
+                           key=lambda pair: get_start_time(pair[0]))
+
+
+    def build(self, tail_duration: Timecode = None, first_id: int = FIRST_ID) -> Timeline:
+        """Merge the sources into a finalized Timeline with renumbered IDs
+
+        Keyword arguments:
+        tail_duration: Timecode -- how long the last marker lasts (default None)
+        first_id: int -- the ID given to the first merged item (default 1)
+        """
+
+        assert first_id >= 0, INVALID_FIRST_ID
+
+        timeline = Timeline(self.data_type)
+        self.provenance = {}
+
+        for new_id, (item, provenance) in enumerate(self.merge(), first_id):
+            if isinstance(item, Marker):
+                item.id = new_id
+            else:
+                item.event = new_id
+
+            self.provenance[new_id] = provenance
+            timeline.insert(item)
+
+        timeline.finalize(tail_duration)
+
+        return timeline
+
+
+    def get_provenance(self, id: int) -> Provenance:
+        """Get where the item with a renumbered ID came from"""
+
+        return self.provenance[id]
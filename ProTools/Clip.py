@@ -7,19 +7,138 @@ Andre_01                                    	Andre_01.wav    [1]
 
 from enum import Enum
 
+import ProTools.lib as lib
+
+# Delimiters
+CHANNEL_START = "["
+CHANNEL_END = "]"
+
+# Defaults
+DEFAULT_CHANNEL = 1
+
+# Error Messages
+INVALID_CLIP_NAME = "Clip name cannot be empty"
+INVALID_CHANNEL = "Clip {clip_name}: Channel must be greater than 0"
+
 class ColumnHeaders(Enum):
     CLIP_NAME = "CLIP NAME"
     SOURCE_FILE = "Source File"
 
 class Clip:
-    def __init__(self, clip_name: str, source_file: str, channel: int = 1):
+    def __init__(self, clip_name: str, source_file: str, channel: int = DEFAULT_CHANNEL):
         """Constructor for the Clip class
         
         Keyword arguments:
         clip_name: str -- the name of the clip
         source_file: str -- the source file of the clip
+        channel: int -- the channel of the source file the clip plays (default 1)
         """
 
+        assert clip_name != None and clip_name != "", INVALID_CLIP_NAME
+        assert channel > 0, INVALID_CHANNEL.format(clip_name=clip_name)
+
         self.clip_name = clip_name
         self.source_file = source_file
-        self.channel = channel
\ No newline at end of file
+        self.channel = channel
+
+    @classmethod
+    def from_row(cls, column_headers: dict, row: str):
+        """Create a new Clip object from a line of Pro Tools clip data
+        
+        Keyword arguments:
+        column_headers: dict -- the column headers of the clip data
+        row: str -- the line of text containing the clip data
+        """
+
+        return cls.create_row_parser(column_headers)(row)
+
+    @classmethod
+    def create_row_parser(cls, column_headers: dict) -> callable:
+        """Create a function that constructs a Clip object from each row of a
+           section, checking the column headers only once
+        
+        Keyword arguments:
+        column_headers: dict -- the column headers of the clip data
+        """
+
+        split_row = lib.compile_row_splitter(column_headers, ColumnHeaders,
+                                             ColumnHeaders.CLIP_NAME, ColumnHeaders.SOURCE_FILE)
+        split_channel = cls.split_channel
+
+        def parse_row(row: str) -> 'Clip':
+            clip_name, source_file = split_row(row)
+            return cls(clip_name, *split_channel(source_file))
+
+        return parse_row
+
+    @staticmethod
+    def split_channel(source_file: str) -> tuple[str, int]:
+        """Split a source file such as "Andre_01.wav    [1]" into its file name
+           and channel
+
+        Keyword arguments:
+        source_file: str -- the source file column of a clip row
+        """
+
+        if not source_file.endswith(CHANNEL_END):
+            return source_file, DEFAULT_CHANNEL
+
+        name, _, channel = source_file[:-len(CHANNEL_END)].rpartition(CHANNEL_START)
+        if not channel.isdigit():
+            return source_file, DEFAULT_CHANNEL
+
+        return name.rstrip(), int(channel)
+
+    def __eq__(self, other):
+        if isinstance(other, Clip):
+            return (self.clip_name == other.clip_name and
+                    self.source_file == other.source_file and
+                    self.channel == other.channel)
+
+        return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+
+class ClipIndex:
+    """Look up clips by name or by source file, and resolve clips to files"""
+
+    def __init__(self, clips: list[Clip], files: list = None):
+        """Constructor for the ClipIndex class
+
+        Keyword arguments:
+        clips: list[Clip] -- the clips to index
+        files: list[File] -- the session files used to resolve source files (default none)
+        """
+
+        self.by_name: dict[str, list[Clip]] = {}
+        self.by_source_file: dict[str, list[Clip]] = {}
+        self.files = {file.filename: file for file in files or []}
+
+        for clip in clips:
+            self.by_name.setdefault(clip.clip_name, []).append(clip)
+            self.by_source_file.setdefault(clip.source_file, []).append(clip)
+
+    def get_clips(self, clip_name: str) -> list[Clip]:
+        """Get the clips with a name, one per channel"""
+
+        return self.by_name.get(clip_name, [])
+
+    def get_clips_from_file(self, source_file: str) -> list[Clip]:
+        """Get the clips that play a source file"""
+
+        return self.by_source_file.get(source_file, [])
+
+    def get_source_files(self, clip_name: str) -> list[str]:
+        """Get the source files a clip plays, in channel order"""
+
+        clips = sorted(self.get_clips(clip_name), key=lambda clip: clip.channel)
+
+        return list(dict.fromkeys(clip.source_file for clip in clips))
+
+    def get_files(self, clip_name: str) -> list:
+        """Get the session files a clip plays, skipping files that are not listed"""
+
+        return [self.files[source_file] for source_file in self.get_source_files(clip_name)
+                if source_file in self.files]
@@ -15,8 +15,6 @@ import ProTools.lib as lib
 ROW_DELIMITER = r"\t"
 
 # Error Messages
-INVALID_COLUMN = f"Column {0} does not exist"
-
 INVALID_EVENT = "EDL {event}: Event cannot be less than 0"
 INVALID_CLIP_NAME = "EDL {event}: Name cannot be empty"
 
@@ -61,33 +59,47 @@ class EDL:
 
 
     @classmethod
-    def from_row(cls, column_headers: dict, row: str):
+    def from_row(cls, column_headers: dict, row: str, frame_rate: float = None):
         """Construct a new EDL object from a row of Pro Tools EDL data
         
         Keyword arguments:
         column_headers: dict -- the column headers of the EDL data
         row: str -- the line of text containing the marker data
+        frame_rate: float -- the frame rate of the session (default None, which
+                             uses the default rate for the timecode format)
         """
 
-        for header in column_headers.keys():
-            assert header in ColumnHeaders, INVALID_COLUMN.format(header)
+        return cls.create_row_parser(column_headers, frame_rate)(row)
+
 
-        row_values = lib.split_row(row)
+    @classmethod
+    def create_row_parser(cls, column_headers: dict, frame_rate: float = None) -> callable:
+        """Create a function that constructs an EDL object from each row of a
+           section, checking the column headers only once
+        
+        Keyword arguments:
+        column_headers: dict -- the column headers of the EDL data
+        frame_rate: float -- the frame rate of the session (default None, which
+                             uses the default rate for the timecode format)
+        """
 
-        get_row_value = lambda header: row_values[column_headers[header]]
-        create_timecode = lambda header: Timecode.from_string(get_row_value(header))
+        split_row = lib.compile_row_splitter(column_headers, ColumnHeaders,
+                                             ColumnHeaders.CHANNEL, ColumnHeaders.EVENT,
+                                             ColumnHeaders.CLIP_NAME, ColumnHeaders.START_TIME,
+                                             ColumnHeaders.END_TIME, ColumnHeaders.DURATION,
+                                             ColumnHeaders.STATE)
+        create_timecode = Timecode.create_section_parser()
 
-        channel = int(get_row_value(ColumnHeaders.CHANNEL))
-        event = int(get_row_value(ColumnHeaders.EVENT))
-        clip_name = get_row_value(ColumnHeaders.CLIP_NAME)
-        state = States(get_row_value(ColumnHeaders.STATE))
+        def parse_row(row: str) -> 'EDL':
+            channel, event, clip_name, start_time, end_time, duration, state = split_row(row)
 
-        start_time = create_timecode(ColumnHeaders.START_TIME)
-        end_time = create_timecode(ColumnHeaders.END_TIME)
-        duration = create_timecode(ColumnHeaders.DURATION)
+            return cls(int(channel), int(event), clip_name,
+                       create_timecode(start_time, frame_rate),
+                       create_timecode(end_time, frame_rate),
+                       create_timecode(duration, frame_rate),
+                       States(state))
 
-        return cls(channel, event, clip_name, start_time, end_time, duration,
-                   state)
+        return parse_row
 
 
     def __eq__(self, other):
@@ -101,8 +113,9 @@ class EDL:
                     self.duration == other.duration and
                     self.state == other.state)
         
-        return False
+        # Lets an EDLTable row compare itself with this EDL
+        return NotImplemented
     
     def __ne__(self, other):
         """Compare two EDL objects to determine if they are not equal"""
-        return not self.__eq__(other)
\ No newline at end of file
+        return not self == other
\ No newline at end of file
@@ -0,0 +1,314 @@
+import numpy as np
+from typing import Iterable
+
+from ProTools.EDL import EDL, States, ColumnHeaders
+from ProTools.Timecode import Timecode, FrameRate
+from ProTools.TimecodeArray import TimecodeArray
+import ProTools.lib as lib
+
+# State Bits
+STATE_BITS = {States.UNMUTED: 0, States.MUTED: 1}
+STATES_BY_BITS = {bits: state for state, bits in STATE_BITS.items()}
+
+# Error Messages
+INVALID_FRAME_RATE_MATCH = "EDLs must share the same frame rate"
+INVALID_LENGTHS = "EDL columns must all be the same length"
+
+# ----------------------------------------------------------------------
+
+class EDLRow:
+    """A read-only view of one event in an EDLTable
+
+    Rows have the same attributes as EDL, so they can be used wherever an
+    EDL is read, but the Timecodes are only created when they are accessed.
+    """
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table: 'EDLTable', index: int):
+        self.table = table
+        self.index = index
+
+    @property
+    def channel(self) -> int:
+        return int(self.table.channels[self.index])
+
+    @property
+    def event(self) -> int:
+        return int(self.table.events[self.index])
+
+    @property
+    def clip_name(self) -> str:
+        return self.table.clip_names[self.table.clip_ids[self.index]]
+
+    @property
+    def loop(self) -> str:
+        return self.clip_name
+
+    @property
+    def start_time(self) -> Timecode:
+        return Timecode._from_rate(int(self.table.starts[self.index]), self.table._rate)
+
+    @property
+    def end_time(self) -> Timecode:
+        return Timecode._from_rate(int(self.table.ends[self.index]), self.table._rate)
+
+    @property
+    def duration(self) -> Timecode:
+        return Timecode._from_rate(int(self.table.durations[self.index]), self.table._rate)
+
+    @property
+    def state(self) -> States:
+        return STATES_BY_BITS[int(self.table.states[self.index])]
+
+
+    def to_edl(self) -> EDL:
+        """Create a standalone EDL object from the row"""
+
+        return EDL(self.channel, self.event, self.clip_name, self.start_time, self.end_time,
+                   self.duration, self.state)
+
+
+    def __eq__(self, other):
+        if isinstance(other, (EDLRow, EDL)):
+            return (self.channel == other.channel and
+                    self.event == other.event and
+                    self.loop == other.loop and
+                    self.start_time == other.start_time and
+                    self.end_time == other.end_time and
+                    self.duration == other.duration and
+                    self.state == other.state)
+
+        return NotImplemented
+
+    def __ne__(self, other):
+        return not self == other
+
+
+class EDLTable:
+    """The events of a track or channel stored column by column
+
+    Channels, events and frame counts are int64 arrays, states are a uint8
+    bitmask and clip names are interned into a shared string table, so an
+    event costs a few dozen bytes instead of an EDL object and three
+    Timecodes.
+    """
+
+    __slots__ = ("channels", "events", "starts", "ends", "durations", "states",
+                 "clip_ids", "clip_names", "_rate")
+
+    def __init__(self, channels, events, starts, ends, durations, states, clip_ids,
+                 clip_names: list[str], rate: FrameRate):
+        """Constructor for the EDLTable class
+
+        Keyword arguments:
+        channels: array-like -- the channel of each event
+        events: array-like -- the event number of each event
+        starts: array-like -- the start time of each event in frames
+        ends: array-like -- the end time of each event in frames
+        durations: array-like -- the duration of each event in frames
+        states: array-like -- the state bits of each event
+        clip_ids: array-like -- the index of each event's clip name in clip_names
+        clip_names: list[str] -- the interned clip names
+        rate: FrameRate -- the frame rate shared by every event
+        """
+
+        self.channels = np.asarray(channels, dtype=np.int64)
+        self.events = np.asarray(events, dtype=np.int64)
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.ends = np.asarray(ends, dtype=np.int64)
+        self.durations = np.asarray(durations, dtype=np.int64)
+        self.states = np.asarray(states, dtype=np.uint8)
+        self.clip_ids = np.asarray(clip_ids, dtype=np.int32)
+        self.clip_names = clip_names
+        self._rate = rate
+
+        assert all(len(column) == len(self.channels) for column in
+                   (self.events, self.starts, self.ends, self.durations, self.states,
+                    self.clip_ids)), INVALID_LENGTHS
+
+
+    @classmethod
+    def from_edls(cls, edls: list[EDL]) -> 'EDLTable':
+        """Constructor for the EDLTable class based on a list of EDLs
+
+        Keyword arguments:
+        edls: list[EDL] -- the EDLs, all at the same frame rate
+        """
+
+        rate = edls[0].start_time._rate if len(edls) > 0 else FrameRate.get()
+        assert all(edl.start_time._rate is rate for edl in edls), INVALID_FRAME_RATE_MATCH
+
+        clip_names, clip_ids = cls.intern([edl.loop for edl in edls])
+
+        return cls([edl.channel for edl in edls],
+                   [edl.event for edl in edls],
+                   [edl.start_time.get_total_frames() for edl in edls],
+                   [edl.end_time.get_total_frames() for edl in edls],
+                   [edl.duration.get_total_frames() for edl in edls],
+                   [STATE_BITS[edl.state] for edl in edls],
+                   clip_ids, clip_names, rate)
+
+
+    @classmethod
+    def from_rows(cls, column_headers: dict, rows: Iterable[str],
+                  frame_rate: float = None) -> 'EDLTable':
+        """Constructor for the EDLTable class based on rows of Pro Tools EDL data
+
+        No EDL or Timecode objects are created; the timecode columns are
+        parsed as whole arrays.
+
+        Keyword arguments:
+        column_headers: dict -- the column headers of the EDL data
+        rows: Iterable[str] -- the lines of text containing the EDL data
+        frame_rate: float -- the frame rate of the session (default None, which
+                             uses the default rate for the timecode format)
+        """
+
+        split_row = lib.compile_row_splitter(column_headers, ColumnHeaders,
+                                             ColumnHeaders.CHANNEL, ColumnHeaders.EVENT,
+                                             ColumnHeaders.CLIP_NAME, ColumnHeaders.START_TIME,
+                                             ColumnHeaders.END_TIME, ColumnHeaders.DURATION,
+                                             ColumnHeaders.STATE)
+
+        columns = ([], [], [], [], [], [], [])
+        for row in rows:
+            for column, value in zip(columns, split_row(row)):
+                column.append(value)
+
+        channels, events, names, starts, ends, durations, states = columns
+
+        # Drop frame is taken from the delimiters of every start time, and the
+        # end times and durations must agree with it
+        start_times = TimecodeArray.from_strings(starts, frame_rate)
+        rate = start_times._rate
+        parse = lambda timecodes: TimecodeArray.from_strings(timecodes, rate.frame_rate,
+                                                             rate.drop_frame).frames
+
+        clip_names, clip_ids = cls.intern(names)
+
+        return cls(np.array(channels, dtype=np.int64), np.array(events, dtype=np.int64),
+                   start_times.frames, parse(ends), parse(durations),
+                   [STATE_BITS[States(state)] for state in states],
+                   clip_ids, clip_names, rate)
+
+
+    @staticmethod
+    def intern(names: list[str]) -> tuple[list[str], list[int]]:
+        """Get the unique names in order of appearance and the index of each name
+
+        Keyword arguments:
+        names: list[str] -- the names to intern
+        """
+
+        indices = {}
+        ids = [indices.setdefault(name, len(indices)) for name in names]
+
+        return list(indices.keys()), ids
+
+
+    def __take(self, selection) -> 'EDLTable':
+        """Create a table from a slice, mask or index array of this table"""
+
+        return EDLTable(self.channels[selection], self.events[selection], self.starts[selection],
+                        self.ends[selection], self.durations[selection], self.states[selection],
+                        self.clip_ids[selection], self.clip_names, self._rate)
+
+
+    # PROPERTIES
+
+    @property
+    def frame_rate(self) -> float:
+        return self._rate.frame_rate
+
+    @property
+    def drop_frame(self) -> bool:
+        return self._rate.drop_frame
+
+
+    def get_start_times(self) -> TimecodeArray:
+        return TimecodeArray._from_rate(self.starts, self._rate)
+
+    def get_end_times(self) -> TimecodeArray:
+        return TimecodeArray._from_rate(self.ends, self._rate)
+
+    def get_durations(self) -> TimecodeArray:
+        return TimecodeArray._from_rate(self.durations, self._rate)
+
+
+    # QUERIES
+
+    def sort(self) -> 'EDLTable':
+        """Get a copy sorted by start time, then channel, then event"""
+
+        return self.__take(np.lexsort((self.events, self.channels, self.starts)))
+
+
+    def filter_state(self, state: States) -> 'EDLTable':
+        """Get the events with a state
+
+        Keyword arguments:
+        state: States -- the state to keep
+        """
+
+        return self.__take(self.states == STATE_BITS[state])
+
+
+    def get_muted(self) -> 'EDLTable':
+        """Get the muted events"""
+
+        return self.__take((self.states & STATE_BITS[States.MUTED]) != 0)
+
+
+    def get_channel(self, channel: int) -> 'EDLTable':
+        """Get the events on one channel
+
+        Keyword arguments:
+        channel: int -- the channel number
+        """
+
+        return self.__take(self.channels == channel)
+
+
+    def split_channels(self) -> list['EDLTable']:
+        """Split the table into one table per channel, in order of appearance"""
+
+        _, first_indices = np.unique(self.channels, return_index=True)
+
+        return [self.get_channel(self.channels[index]) for index in np.sort(first_indices)]
+
+
+    def get_range(self, start: Timecode, end: Timecode) -> 'EDLTable':
+        """Get the events that overlap the range [start, end)
+
+        Keyword arguments:
+        start: Timecode -- the start of the range
+        end: Timecode -- the end of the range
+        """
+
+        return self.__take((self.starts < end.get_total_frames()) &
+                           (self.ends > start.get_total_frames()))
+
+
+    def to_edls(self) -> list[EDL]:
+        """Convert the table into a list of EDL objects"""
+
+        return [row.to_edl() for row in self]
+
+
+    def __len__(self):
+        return len(self.channels)
+
+    def __iter__(self):
+        for index in range(len(self.channels)):
+            yield EDLRow(self, index)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            if index < 0:
+                index += len(self.channels)
+            if not 0 <= index < len(self.channels):
+                raise IndexError("EDLTable index out of range")
+            return EDLRow(self, int(index))
+
+        return self.__take(index)
@@ -12,9 +12,6 @@ import ProTools.lib as lib
 # Delimiters
 ROW_DELIMITER = r"\t"
 
-# Error Messages
-INVALID_COLUMN = "Column {0} does not exist"
-
 class ColumnHeaders(Enum):
     FILENAME = "Filename"
     LOCATION = "Location"
@@ -33,21 +30,25 @@ class File:
 
     @classmethod
     def from_row(cls, header_to_index: dict, row: str):
-        """Create a new Marker object from a line of Pro Tools Marker data
+        """Create a new File object from a line of Pro Tools file data
         
         Keyword arguments:
-        column_headers: dict
-        row: str -- the line of text containing the marker data
+        header_to_index: dict -- the column headers of the file data
+        row: str -- the line of text containing the file data
         """
 
-        for header in header_to_index.keys():
-            assert header in ColumnHeaders, INVALID_COLUMN.format(header)
+        return cls.create_row_parser(header_to_index)(row)
 
-        row_values = lib.split_row(row)
+    @classmethod
+    def create_row_parser(cls, header_to_index: dict) -> callable:
+        """Create a function that constructs a File object from each row of a
+           section, checking the column headers only once
+        
+        Keyword arguments:
+        header_to_index: dict -- the column headers of the file data
+        """
 
-        get_row_value = lambda header: row_values[header_to_index[header]]
+        split_row = lib.compile_row_splitter(header_to_index, ColumnHeaders,
+                                             ColumnHeaders.FILENAME, ColumnHeaders.LOCATION)
 
-        filename = get_row_value(ColumnHeaders.FILENAME)
-        location = get_row_value(ColumnHeaders.LOCATION)
-        
-        return cls(filename, location)
\ No newline at end of file
+        return lambda row: cls(*split_row(row))
\ No newline at end of file
@@ -0,0 +1,179 @@
+import hashlib
+
+from ProTools.Session import Session, SECTION_ATTRIBUTES
+from ProTools.SessionReader import SectionHeaders, ExportFormat, index_sections, read_rows
+
+# Hashing
+CHUNK_SIZE = 1024 * 1024
+DIGEST_SIZE = 16
+
+# ----------------------------------------------------------------------
+
+def hash_range(session_file, start: int, end: int) -> bytes:
+    """Hash the bytes between two offsets of a file
+
+    Keyword arguments:
+    session_file: BinaryIO -- the file opened in binary mode
+    start: int -- the offset of the first byte
+    end: int -- the offset just past the last byte
+    """
+
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    session_file.seek(start)
+
+    while start < end:
+        chunk = session_file.read(min(CHUNK_SIZE, end - start))
+        if chunk == b"":
+            break
+        digest.update(chunk)
+        start += len(chunk)
+
+    return digest.digest()
+
+
+def get_loop_rows(header: SectionHeaders, content: list) -> dict[str, list]:
+    """Get a comparable description of every row that belongs to each loop
+
+    Markers are grouped by name and EDLs by clip name, so two parses of a
+    section can be compared loop by loop.
+
+    Keyword arguments:
+    header: SectionHeaders -- the section the content was parsed from
+    content: list -- the parsed section
+    """
+
+    rows = {}
+
+    if header == SectionHeaders.MARKERS_LISTING:
+        for marker in content:
+            rows.setdefault(marker.name, []).append(
+                (str(marker.location), marker.comments))
+
+    elif header == SectionHeaders.TRACK_LISTING:
+        for track in content:
+            for channel in track.channels:
+                for edl in channel:
+                    rows.setdefault(edl.loop, []).append(
+                        (track.name, edl.channel, str(edl.start_time), str(edl.end_time), edl.state))
+
+    for loop_rows in rows.values():
+        loop_rows.sort(key=repr)
+
+    return rows
+
+
+class SessionChanges:
+    """What changed between two exports of the same session"""
+
+    def __init__(self, changed_sections: set[SectionHeaders], changed_loops: set[str],
+                 globals_changed: bool = False):
+        """Constructor for the SessionChanges class
+
+        Keyword arguments:
+        changed_sections: set[SectionHeaders] -- the sections that were reparsed
+        changed_loops: set[str] -- the loops whose markers or EDLs were added, removed or moved
+        globals_changed: bool -- whether the global data changed, forcing a full reparse
+        """
+
+        self.changed_sections = changed_sections
+        self.changed_loops = changed_loops
+        self.globals_changed = globals_changed
+
+    def has_changes(self) -> bool:
+        return self.globals_changed or len(self.changed_sections) > 0
+
+
+class IncrementalSession:
+    """A parsed Session that can be refreshed from a new export of the same
+       session, reparsing only the sections whose bytes changed
+
+    Each section of the export is hashed. When the export is reloaded, the
+    unchanged sections are kept as they are, and the changed sections are
+    reparsed and compared loop by loop with the previous parse.
+    """
+
+    def __init__(self, filename: str, sample_accurate: bool = False, columnar: bool = False):
+        """Constructor for the IncrementalSession class
+
+        Keyword arguments:
+        filename: str -- the name of the file containing the Pro Tools session data
+        sample_accurate: bool -- whether marker locations should be SampleTimes taken
+                                 from the TIME REFERENCE column (default False)
+        columnar: bool -- whether track channels should be EDLTables (default False)
+        """
+
+        self.filename = filename
+        self.sample_accurate = sample_accurate
+        self.columnar = columnar
+        self.session = None
+        self.global_rows = None
+        self.section_hashes = {}
+
+        self.reload()
+
+
+    def reload(self, filename: str = None) -> SessionChanges:
+        """Read a new export and reparse only what changed
+
+        Keyword arguments:
+        filename: str -- the new export, or None to reread the current file (default None)
+        """
+
+        self.filename = filename if filename is not None else self.filename
+
+        with open(self.filename, "rb") as session_file:
+            export_format = ExportFormat.from_file(session_file)
+            global_rows, offsets = index_sections(session_file, export_format)
+            hashes = {header: hash_range(session_file, *offsets[header]) for header in offsets}
+
+            previous_session = self.session
+            globals_changed = global_rows != self.global_rows
+            if globals_changed:
+                self.__create_session(global_rows)
+
+            changed_sections = {header for header in SectionHeaders
+                                if globals_changed or hashes.get(header) != self.section_hashes.get(header)}
+            changed_loops = set()
+
+            parsers = Session.get_section_parsers(self.session.frame_rate, self.columnar)
+
+            for header in changed_sections:
+                attribute = SECTION_ATTRIBUTES[header]
+                previous = getattr(previous_session, attribute) if previous_session is not None else []
+
+                content = (parsers[header](read_rows(session_file, *offsets[header], export_format))
+                           if header in offsets else [])
+
+                if header == SectionHeaders.MARKERS_LISTING and self.sample_accurate:
+                    Session.use_sample_times(content, self.session.sample_rate, self.session.start)
+
+                setattr(self.session, attribute, content)
+                changed_loops |= self.compare_loops(header, previous, content)
+
+        self.global_rows = global_rows
+        self.section_hashes = hashes
+
+        return SessionChanges(changed_sections, changed_loops, globals_changed)
+
+
+    def __create_session(self, global_rows: list[str]) -> None:
+        """Start a new Session with empty sections from the global data"""
+
+        self.session = Session(*Session.parse_global_data(global_rows), [], [], [], [], [], [])
+
+
+    @staticmethod
+    def compare_loops(header: SectionHeaders, previous: list, current: list) -> set[str]:
+        """Get the loops whose rows differ between two parses of a section
+
+        Keyword arguments:
+        header: SectionHeaders -- the section that was parsed
+        previous: list -- the previous parse of the section
+        current: list -- the new parse of the section
+        """
+
+        previous_rows = get_loop_rows(header, previous)
+        current_rows = get_loop_rows(header, current)
+
+        return {loop for loop in previous_rows.keys() | current_rows.keys()
+                if previous_rows.get(loop) != current_rows.get(loop)}
@@ -0,0 +1,118 @@
+import os
+from typing import Iterable
+
+from ProTools.Session import Session
+from ProTools.SessionReader import SectionHeaders, ExportFormat, index_sections, read_rows
+
+# Error Messages
+INVALID_SECTION = "Section {0} does not exist"
+CHANGED_FILE = "Session file {0} has changed since it was opened"
+
+# ----------------------------------------------------------------------
+
+def lazy_section(header: SectionHeaders) -> property:
+    """Create a property that parses a section the first time it is read"""
+
+    def get_section(session: 'LazySession'):
+        return session.load(header)
+
+    def set_section(session: 'LazySession', value: list):
+        session._sections[header] = value
+
+    return property(get_section, set_section, doc=f"The parsed {header.name} section")
+
+
+class LazySession(Session):
+    """A Session that only parses a section the first time it is accessed
+
+    Opening the file reads the global data and records the byte offsets of
+    every section. Reading an attribute such as markers or tracks then seeks
+    straight to that section and parses only its rows. The size and
+    modification time of the file are recorded when it is opened, and a
+    section is not read if either has changed, since the recorded offsets
+    would no longer match.
+    """
+
+    online_files = lazy_section(SectionHeaders.ONLINE_FILES)
+    offline_files = lazy_section(SectionHeaders.OFFLINE_FILES)
+    online_clips = lazy_section(SectionHeaders.ONLINE_CLIPS)
+    plug_ins = lazy_section(SectionHeaders.PLUG_INS_LISTING)
+    tracks = lazy_section(SectionHeaders.TRACK_LISTING)
+    markers = lazy_section(SectionHeaders.MARKERS_LISTING)
+
+    @classmethod
+    def from_file(cls, filename: str, sample_accurate: bool = False, columnar: bool = False,
+                  prefetch: Iterable[SectionHeaders] = (), workers: int = None):
+        """Constructor for the LazySession class using a text file
+
+        Keyword arguments:
+        filename: str -- the name of the file containing the Pro Tools session data
+        sample_accurate: bool -- whether marker locations should be SampleTimes taken
+                                 from the TIME REFERENCE column (default False)
+        columnar: bool -- whether track channels should be EDLTables (default False)
+        prefetch: Iterable[SectionHeaders] -- the sections to parse straight away (default none)
+        workers: int -- the number of processes to parse tracks in (default None)
+        """
+
+        with open(filename, "rb") as session_file:
+            file_stats = os.fstat(session_file.fileno())
+            export_format = ExportFormat.from_file(session_file)
+            global_rows, offsets = index_sections(session_file, export_format)
+
+        session = cls.__new__(cls)
+        (session.name, session.sample_rate, session.bit_depth, session.start,
+         session.frame_rate, session.drop_frame, session.number_of_tracks,
+         session.number_of_clips, session.number_of_files) = cls.parse_global_data(global_rows)
+
+        session.filename = filename
+        session.sample_accurate = sample_accurate
+        session.columnar = columnar
+        session.workers = workers
+        session.export_format = export_format
+        session.offsets = offsets
+        session.file_version = (file_stats.st_size, file_stats.st_mtime_ns)
+        session._sections = {}
+
+        session.load(*prefetch)
+
+        return session
+
+
+    def is_loaded(self, header: SectionHeaders) -> bool:
+        """Check whether a section has already been parsed"""
+
+        return header in self._sections
+
+
+    def load(self, *headers: SectionHeaders) -> list:
+        """Parse any of the given sections that have not been parsed yet
+
+        Keyword arguments:
+        headers: SectionHeaders -- the sections to parse
+
+        Returns the parsed content of the last section given.
+        """
+
+        for header in headers:
+            assert header in SectionHeaders, INVALID_SECTION.format(header)
+
+        pending = [header for header in headers if header not in self._sections]
+
+        if len(pending) > 0:
+            parsers = self.get_section_parsers(self.frame_rate, self.columnar, self.workers)
+
+            with open(self.filename, "rb") as session_file:
+                file_stats = os.fstat(session_file.fileno())
+                assert (file_stats.st_size, file_stats.st_mtime_ns) == self.file_version, \
+                    CHANGED_FILE.format(self.filename)
+
+                for header in sorted(pending, key=lambda header: self.offsets.get(header, (0,))[0]):
+                    self._sections[header] = (parsers[header](read_rows(session_file, *self.offsets[header],
+                                                                        self.export_format))
+                                              if header in self.offsets else [])
+
+            if self.sample_accurate and SectionHeaders.MARKERS_LISTING in pending:
+                self.use_sample_times(self._sections[SectionHeaders.MARKERS_LISTING],
+                                      self.sample_rate, self.start)
+
+        return self._sections[headers[-1]] if len(headers) > 0 else None
@@ -17,6 +17,7 @@ EXAMPLE PRO TOOLS MARKER 2
 
 from enum import Enum
 from ProTools.Timecode import Timecode, validate_frame_rate
+from ProTools.SampleTime import SampleTime
 from Scripts.Loop import Loop
 
 import ProTools.lib as lib
@@ -31,8 +32,6 @@ ROW_DELIMITER = r"\t"
 SESSION_START = Timecode.from_string("00:00:00:00")
 
 # Error Messages
-INVALID_COLUMN = f"Column {0} does not exist"
-
 # TODO: Add in Marker ID max
 INVALID_ID = "Marker {id}: ID cannot be less than 0"
 INVALID_LOCATION = "Marker {id}: Location cannot be less than the session start time"
@@ -95,22 +94,45 @@ class Marker:
         frame_rate: float
         """
 
-        for header in column_headers.keys():
-            assert header in ColumnHeaders, INVALID_COLUMN.format(header)
+        return cls.create_row_parser(column_headers, frame_rate)(row)
+
+
+    @classmethod
+    def create_row_parser(cls, column_headers: dict, frame_rate: float) -> callable:
+        """Create a function that constructs a Marker object from each row of a
+           section, checking the column headers only once
+        
+        Keyword arguments:
+        column_headers: dict -- the column headers of the marker data
+        frame_rate: float -- the frame rate of the session
+        """
+
         validate_frame_rate(frame_rate)
 
-        row_values = lib.split_row(row)
+        split_row = lib.compile_row_splitter(column_headers, ColumnHeaders,
+                                             ColumnHeaders.ID, ColumnHeaders.LOCATION,
+                                             ColumnHeaders.TIME_REFERENCE, ColumnHeaders.UNITS,
+                                             ColumnHeaders.NAME, ColumnHeaders.COMMENTS)
+        create_timecode = Timecode.create_section_parser()
+
+        def parse_row(row: str) -> 'Marker':
+            id, location, time_reference, units, name, comments = split_row(row)
+
+            return cls(int(id), create_timecode(location, frame_rate), int(time_reference),
+                       Units(units), name, comments, frame_rate)
+
+        return parse_row
 
-        get_row_value = lambda header: row_values[column_headers[header]]
 
-        id = int(get_row_value(ColumnHeaders.ID))
-        location = Timecode.from_string(get_row_value(ColumnHeaders.LOCATION))
-        time_reference = int(get_row_value(ColumnHeaders.TIME_REFERENCE))
-        units = Units(get_row_value(ColumnHeaders.UNITS))
-        name = get_row_value(ColumnHeaders.NAME)
-        comments = get_row_value(ColumnHeaders.COMMENTS)
+    def get_sample_time(self, sample_rate: int, session_start: Timecode) -> SampleTime:
+        """Get the sample accurate position of the marker from its time reference
+
+        Keyword arguments:
+        sample_rate: int -- the sample rate of the session
+        session_start: Timecode -- the start time of the session
+        """
 
-        return cls(id, location, time_reference, units, name, frame_rate, comments)
+        return SampleTime.from_time_reference(self.time_reference, sample_rate, session_start)
 
 
     @classmethod
@@ -1,7 +1,91 @@
+"""
+EXAMPLE PLUG-IN
+
+MANUFACTURER            	PLUG-IN NAME            	VERSION         	FORMAT          	STEMS                   	NUMBER OF INSTANCES
+Avid                    	EQ3 7-Band              	22.6.0.111      	AAX Native      	Mono / Mono             	4
+"""
+
 from enum import Enum
 
+import ProTools.lib as lib
+
+# Error Messages
+INVALID_NAME = "Plug-in name cannot be empty"
+INVALID_INSTANCES = "Plug-in {name}: Number of instances cannot be less than 0"
+
 class ColumnHeaders(Enum):
-    pass
+    MANUFACTURER = "MANUFACTURER"
+    PLUG_IN_NAME = "PLUG-IN NAME"
+    VERSION = "VERSION"
+    FORMAT = "FORMAT"
+    STEMS = "STEMS"
+    NUMBER_OF_INSTANCES = "NUMBER OF INSTANCES"
 
 class Plugin:
-    pass
\ No newline at end of file
+    def __init__(self, manufacturer: str, name: str, version: str, format: str,
+                 stems: str, number_of_instances: int):
+        """Constructor for the Plugin class
+        
+        Keyword arguments:
+        manufacturer: str -- the manufacturer of the plug-in
+        name: str -- the name of the plug-in
+        version: str -- the version of the plug-in
+        format: str -- the plug-in format, such as AAX Native
+        stems: str -- the input and output stem formats, such as Mono / Mono
+        number_of_instances: int -- the number of times the plug-in is used in the session
+        """
+
+        assert name != None and name != "", INVALID_NAME
+        assert number_of_instances >= 0, INVALID_INSTANCES.format(name=name)
+
+        self.manufacturer = manufacturer
+        self.name = name
+        self.version = version
+        self.format = format
+        self.stems = stems
+        self.number_of_instances = number_of_instances
+
+    @classmethod
+    def from_row(cls, column_headers: dict, row: str):
+        """Create a new Plugin object from a line of Pro Tools plug-in data
+        
+        Keyword arguments:
+        column_headers: dict -- the column headers of the plug-in data
+        row: str -- the line of text containing the plug-in data
+        """
+
+        return cls.create_row_parser(column_headers)(row)
+
+    @classmethod
+    def create_row_parser(cls, column_headers: dict) -> callable:
+        """Create a function that constructs a Plugin object from each row of a
+           section, checking the column headers only once
+        
+        Keyword arguments:
+        column_headers: dict -- the column headers of the plug-in data
+        """
+
+        split_row = lib.compile_row_splitter(column_headers, ColumnHeaders,
+                                             ColumnHeaders.MANUFACTURER, ColumnHeaders.PLUG_IN_NAME,
+                                             ColumnHeaders.VERSION, ColumnHeaders.FORMAT,
+                                             ColumnHeaders.STEMS, ColumnHeaders.NUMBER_OF_INSTANCES)
+
+        def parse_row(row: str) -> 'Plugin':
+            manufacturer, name, version, format, stems, number_of_instances = split_row(row)
+            return cls(manufacturer, name, version, format, stems, int(number_of_instances))
+
+        return parse_row
+
+    def __eq__(self, other):
+        if isinstance(other, Plugin):
+            return (self.manufacturer == other.manufacturer and
+                    self.name == other.name and
+                    self.version == other.version and
+                    self.format == other.format and
+                    self.stems == other.stems and
+                    self.number_of_instances == other.number_of_instances)
+
+        return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
@@ -0,0 +1,217 @@
+from functools import partial
+
+from ProTools.Timecode import Timecode, OffsetType
+
+# Error Messages
+INVALID_RANGE = "Retime rule start must be before its end"
+INVALID_OFFSET_TYPE = "Offset type must be ADVANCE, DELAY or NONE"
+OVERLAPPING_RULES = "Retime rules must not overlap"
+
+# ----------------------------------------------------------------------
+
+class RetimeRule:
+    """Offset every time in the range [start, end) by the same amount
+
+    A start of None covers everything before the end, and an end of None
+    covers everything after the start.
+    """
+
+    __slots__ = ("start", "end", "offset", "offset_type")
+
+    def __init__(self, start: Timecode, end: Timecode, offset: Timecode,
+                 offset_type: OffsetType):
+        """Constructor for the RetimeRule class
+
+        Keyword arguments:
+        start: Timecode -- the first time the rule applies to, or None
+        end: Timecode -- the first time after the rule, or None
+        offset: Timecode -- the amount to offset by
+        offset_type: OffsetType -- whether to advance or delay the times
+        """
+
+        assert start is None or end is None or start < end, INVALID_RANGE
+        assert isinstance(offset_type, OffsetType), INVALID_OFFSET_TYPE
+
+        self.start = start
+        self.end = end
+        self.offset = offset
+        self.offset_type = offset_type
+
+
+    def ends_before(self, time) -> bool:
+        """Check whether the whole rule comes before a time"""
+
+        return self.end is not None and self.end <= time
+
+
+    def contains(self, time) -> bool:
+        """Check whether a time falls inside the rule"""
+
+        return ((self.start is None or self.start <= time) and
+                (self.end is None or time < self.end))
+
+
+    def apply(self, time):
+        """Offset a Timecode or SampleTime by the rule"""
+
+        if self.offset is None or self.offset_type == OffsetType.NONE:
+            return time
+        elif self.offset_type == OffsetType.ADVANCE:
+            return time - self.offset
+        elif self.offset_type == OffsetType.DELAY:
+            return time + self.offset
+
+        raise ValueError(INVALID_OFFSET_TYPE)
+
+
+class Retimer:
+    """Apply piecewise offsets to whole timelines
+
+    Times are sorted once and swept against the rules in order, so retiming
+    n times against k rules costs O(n log n + k) rather than checking every
+    rule for every time. Times outside every rule are left unchanged.
+    """
+
+    def __init__(self, rules: list[RetimeRule]):
+        """Constructor for the Retimer class
+
+        Keyword arguments:
+        rules: list[RetimeRule] -- the rules, which must not overlap
+        """
+
+        self.rules = sorted(rules, key=lambda rule: -1 if rule.start is None
+                                                    else rule.start.get_total_frames())
+
+        for previous, rule in zip(self.rules, self.rules[1:]):
+            assert previous.end is not None and rule.start is not None, OVERLAPPING_RULES
+            assert previous.end <= rule.start, OVERLAPPING_RULES
+
+
+    @classmethod
+    def from_offset(cls, offset: Timecode, offset_type: OffsetType) -> 'Retimer':
+        """Constructor for the Retimer class with one offset for the whole timeline
+
+        Keyword arguments:
+        offset: Timecode -- the amount to offset by
+        offset_type: OffsetType -- whether to advance or delay the times
+        """
+
+        return cls([RetimeRule(None, None, offset, offset_type)])
+
+
+    @classmethod
+    def from_tuples(cls, rules: list[tuple]) -> 'Retimer':
+        """Constructor for the Retimer class from (start, end, offset, offset_type) tuples
+
+        Keyword arguments:
+        rules: list[tuple] -- the rules as tuples
+        """
+
+        return cls([RetimeRule(*rule) for rule in rules])
+
+
+    def apply(self, time):
+        """Retime a single Timecode or SampleTime"""
+
+        for rule in self.rules:
+            if rule.contains(time):
+                return rule.apply(time)
+
+        return time
+
+
+    def retime(self, times: list) -> list:
+        """Retime a list of Timecodes or SampleTimes in one sorted sweep
+
+        Keyword arguments:
+        times: list -- the times to retime, in any order
+
+        Returns the retimed times in the same order as they were given.
+        """
+
+        retimed = list(times)
+        rules = self.rules
+        rule_index = 0
+
+        for index in sorted(range(len(times)), key=times.__getitem__):
+            time = times[index]
+
+            while rule_index < len(rules) and rules[rule_index].ends_before(time):
+                rule_index += 1
+
+            if rule_index == len(rules):
+                break
+
+            if rules[rule_index].contains(time):
+                retimed[index] = rules[rule_index].apply(time)
+
+        return retimed
+
+
+    def retime_attributes(self, items: list, attributes: tuple[str]) -> None:
+        """Retime the time attributes of a list of objects in place
+
+        Keyword arguments:
+        items: list -- the objects to retime
+        attributes: tuple[str] -- the names of the time attributes on each object
+        """
+
+        self.__retime_targets(self.__attribute_targets(items, attributes))
+
+
+    def retime_session(self, session) -> None:
+        """Retime the markers and track EDLs of a Session in place
+
+        Keyword arguments:
+        session: Session -- the session to retime
+        """
+
+        targets = self.__attribute_targets(session.markers, ("location",))
+
+        for track in session.tracks:
+            for channel in track.channels:
+                if isinstance(channel, list):
+                    targets.extend(self.__attribute_targets(channel, ("start_time", "end_time")))
+                else:
+                    targets.extend(self.__table_targets(channel))
+
+        self.__retime_targets(targets)
+
+
+    def retime_captions(self, captions: list) -> None:
+        """Retime the start and end times of a list of captions in place
+
+        Keyword arguments:
+        captions: list[SRT] -- the captions to retime
+        """
+
+        self.retime_attributes(captions, ("start_time", "end_time"))
+
+
+    @staticmethod
+    def __attribute_targets(items: list, attributes: tuple[str]) -> list[tuple]:
+        """Get the (time, assign) pair of every time attribute that is set"""
+
+        return [(getattr(item, attribute), partial(setattr, item, attribute))
+                for item in items for attribute in attributes
+                if getattr(item, attribute) is not None]
+
+
+    @staticmethod
+    def __table_targets(table: 'EDLTable') -> list[tuple]:
+        """Get the (time, assign) pair of every start and end time in an EDLTable"""
+
+        def assign(column, index: int, time: Timecode) -> None:
+            column[index] = time.get_total_frames()
+
+        return [(time, partial(assign, column, index))
+                for column, times in ((table.starts, table.get_start_times()),
+                                      (table.ends, table.get_end_times()))
+                for index, time in enumerate(times)]
+
+
+    def __retime_targets(self, targets: list[tuple]) -> None:
+        retimed = self.retime([time for time, _ in targets])
+
+        for (_, assign), time in zip(targets, retimed):
+            assign(time)
@@ -0,0 +1,227 @@
+from ProTools.Timecode import (Timecode, FrameRate, MILLISECONDS_FORMAT, MILLISECONDS_PER_SECOND,
+                               SECONDS_PER_MINUTE, MINUTES_PER_HOUR)
+
+# Rates
+MILLISECONDS_PER_MINUTE = MILLISECONDS_PER_SECOND * SECONDS_PER_MINUTE
+MILLISECONDS_PER_HOUR = MILLISECONDS_PER_MINUTE * MINUTES_PER_HOUR
+
+# Error Messages
+INVALID_SAMPLES = "Samples must be greater than or equal to 0"
+INVALID_SAMPLE_RATE = "Sample rate must be a whole number greater than 0"
+INVALID_SAMPLE_RATE_MATCH = "Sample times must share the same sample rate"
+
+# ----------------------------------------------------------------------
+
+def rounded_division(numerator: int, denominator: int) -> int:
+    """Divide two integers and round half up"""
+
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+class SampleTime:
+    """A position on the session timeline measured in audio samples
+
+    Samples are counted from timecode 00:00:00:00, so a Pro Tools TIME
+    REFERENCE (counted from the session start) and a Timecode can both be
+    converted without loss. Frames and milliseconds are only rounded when
+    they are asked for.
+    """
+
+    __slots__ = ("samples", "sample_rate", "_rate")
+
+    def __init__(self, samples: int, sample_rate: int, rate: FrameRate = None):
+        """Constructor for the SampleTime class
+
+        Keyword arguments:
+        samples: int -- the number of samples since 00:00:00:00
+        sample_rate: int -- the number of samples per second
+        rate: FrameRate -- the frame rate used for frame based output (default 24.0)
+        """
+
+        assert samples >= 0, INVALID_SAMPLES
+        assert sample_rate > 0 and sample_rate == int(sample_rate), INVALID_SAMPLE_RATE
+
+        self.samples = samples
+        self.sample_rate = int(sample_rate)
+        self._rate = rate if rate is not None else FrameRate.get()
+
+
+    @classmethod
+    def from_timecode(cls, timecode: Timecode, sample_rate: int) -> 'SampleTime':
+        """Constructor for the SampleTime class based on a Timecode
+
+        Keyword arguments:
+        timecode: Timecode -- the timecode to convert
+        sample_rate: int -- the number of samples per second
+        """
+
+        samples = SampleTime.frames_to_samples(timecode.get_total_frames(), sample_rate,
+                                               timecode._rate)
+
+        return cls(samples, sample_rate, timecode._rate)
+
+
+    @classmethod
+    def from_time_reference(cls, time_reference: int, sample_rate: int,
+                            session_start: Timecode) -> 'SampleTime':
+        """Constructor for the SampleTime class based on a Pro Tools TIME
+           REFERENCE, which counts samples from the session start
+
+        Keyword arguments:
+        time_reference: int -- the number of samples since the session start
+        sample_rate: int -- the number of samples per second
+        session_start: Timecode -- the start time of the session
+        """
+
+        start = SampleTime.from_timecode(session_start, sample_rate)
+
+        return start + time_reference
+
+
+    @staticmethod
+    def frames_to_samples(total_frames: int, sample_rate: int, rate: FrameRate) -> int:
+        """Convert a number of frames to the nearest number of samples
+
+        Keyword arguments:
+        total_frames: int -- the number of frames
+        sample_rate: int -- the number of samples per second
+        rate: FrameRate -- the frame rate of the frames
+        """
+
+        return rounded_division(total_frames * int(sample_rate) * rate.denominator, rate.numerator)
+
+
+    def __with_samples(self, samples: int) -> 'SampleTime':
+        return SampleTime(samples, self.sample_rate, self._rate)
+
+
+    # PROPERTIES
+
+    @property
+    def frame_rate(self) -> float:
+        return self._rate.frame_rate
+
+    @property
+    def drop_frame(self) -> bool:
+        return self._rate.drop_frame
+
+
+    def get_total_frames(self) -> int:
+        """Convert the sample position to the nearest total number of frames"""
+
+        return rounded_division(self.samples * self._rate.numerator,
+                                self.sample_rate * self._rate.denominator)
+
+
+    def get_total_milliseconds(self) -> int:
+        """Convert the sample position to the nearest real elapsed millisecond"""
+
+        return rounded_division(self.samples * MILLISECONDS_PER_SECOND, self.sample_rate)
+
+
+    def to_timecode(self) -> Timecode:
+        """Round the sample position to the nearest frame"""
+
+        return Timecode._from_rate(self.get_total_frames(), self._rate)
+
+
+    def interpolate(self, other: 'SampleTime', numerator: int, denominator: int) -> 'SampleTime':
+        """Get the sample position a fraction of the way towards another position
+
+        Keyword arguments:
+        other: SampleTime -- the position to move towards
+        numerator: int -- the numerator of the fraction
+        denominator: int -- the denominator of the fraction
+        """
+
+        samples = (self.samples * (denominator - numerator) + other.samples * numerator) // denominator
+
+        return self.__with_samples(samples)
+
+
+    def convert_to_frames_format(self) -> str:
+        """Convert the sample position to a string formatted as HH:MM:SS:FF,
+           rounded to the nearest frame"""
+
+        return self.to_timecode().convert_to_frames_format()
+
+
+    def convert_to_milliseconds_format(self) -> str:
+        """Convert the sample position to a string formatted as HH:MM:SS,mmm
+
+        The label of the nearest frame is shown the same way Timecode shows
+        it, so both share one time base, and the distance from that frame is
+        added in milliseconds instead of being rounded away. The sum is
+        rounded once.
+        """
+
+        rate = self._rate
+        frames = self.get_total_frames()
+        remainder = self.samples * rate.numerator - frames * self.sample_rate * rate.denominator
+
+        hours, minutes, seconds, frame = rate.to_components(frames)
+        label_seconds = (hours * MINUTES_PER_HOUR + minutes) * SECONDS_PER_MINUTE + seconds
+        divisor = self.sample_rate * rate.numerator
+
+        milliseconds = rounded_division(label_seconds * MILLISECONDS_PER_SECOND * divisor
+                                        + (frame * self.sample_rate * rate.denominator + remainder)
+                                        * MILLISECONDS_PER_SECOND, divisor)
+
+        hours, milliseconds = divmod(milliseconds, MILLISECONDS_PER_HOUR)
+        minutes, milliseconds = divmod(milliseconds, MILLISECONDS_PER_MINUTE)
+        seconds, milliseconds = divmod(milliseconds, MILLISECONDS_PER_SECOND)
+
+        return MILLISECONDS_FORMAT.format(hours, minutes, seconds, milliseconds)
+
+
+    def __str__(self):
+        return self.convert_to_frames_format()
+
+
+    def __other_samples(self, other) -> int:
+        if isinstance(other, SampleTime):
+            assert other.sample_rate == self.sample_rate, INVALID_SAMPLE_RATE_MATCH
+            return other.samples
+        elif isinstance(other, Timecode):
+            return SampleTime.frames_to_samples(other.get_total_frames(), self.sample_rate,
+                                                other._rate)
+        elif isinstance(other, int):
+            return other
+
+        raise TypeError("Invalid arguments for SampleTime")
+
+    # COMPARISON OPERATORS
+
+    def __eq__(self, other):
+        if isinstance(other, SampleTime):
+            return self.samples == other.samples and self.sample_rate == other.sample_rate
+
+        return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self.samples, self.sample_rate))
+
+    def __lt__(self, other):
+        return self.samples < self.__other_samples(other)
+
+    def __le__(self, other):
+        return self.samples <= self.__other_samples(other)
+
+    def __gt__(self, other):
+        return self.samples > self.__other_samples(other)
+
+    def __ge__(self, other):
+        return self.samples >= self.__other_samples(other)
+
+    # ARITHMETIC OPERATORS
+
+    def __add__(self, other):
+        """Add samples, a Timecode or another SampleTime"""
+        return self.__with_samples(self.samples + self.__other_samples(other))
+
+    def __sub__(self, other):
+        """Subtract samples, a Timecode or another SampleTime"""
+        return self.__with_samples(self.samples - self.__other_samples(other))
@@ -1,18 +1,28 @@
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
+from itertools import chain
+from typing import Iterable
 
 from ProTools.Marker import Marker, ColumnHeaders as MarkerHeaders
 from ProTools.EDL import EDL, ColumnHeaders as EDLHeaders
 from ProTools.File import File, ColumnHeaders as FileHeaders
-from ProTools.Clip import Clip, ColumnHeaders as ClipHeaders
+from ProTools.Clip import Clip, ClipIndex, ColumnHeaders as ClipHeaders
 from ProTools.Plugin import Plugin, ColumnHeaders as PluginHeaders
 from ProTools.Track import Track
 from ProTools.Timecode import Timecode
+from ProTools.SessionReader import (SectionHeaders, LineReader, read_globals, iterate_sections,
+                                    iterate_table, iterate_tracks, iterate_lines)
 import ProTools.lib as lib
 
 # Delimiters
 ROW_DELIMITER = r"\t"
 
+# Parallel Parsing
+MIN_PARALLEL_ROWS = 20000 # Below this many EDL rows a process pool costs more than it saves
+CHUNKS_PER_WORKER = 4
+
 # Indices
 NAME_INDEX = 0
 SAMPLE_RATE_INDEX = 1
@@ -23,6 +33,20 @@ NUMBER_OF_TRACKS_INDEX = 5
 NUMBER_OF_CLIPS_INDEX = 6
 NUMBER_OF_FILES_INDEX = 7
 END_GLOBAL_DATA_INDEX = 8
+FRAME_RATE_INDEX = 4 # Index of the frame rate in the parsed global data
+
+# Error Messages
+INVALID_TRACK = "Track {0} does not exist"
+
+# Section Attributes
+SECTION_ATTRIBUTES = {
+    SectionHeaders.ONLINE_FILES: "online_files",
+    SectionHeaders.OFFLINE_FILES: "offline_files",
+    SectionHeaders.ONLINE_CLIPS: "online_clips",
+    SectionHeaders.PLUG_INS_LISTING: "plug_ins",
+    SectionHeaders.TRACK_LISTING: "tracks",
+    SectionHeaders.MARKERS_LISTING: "markers",
+}
 
 class BitDepths(Enum):
     SIXTEEN = "16-bit"
@@ -36,17 +60,57 @@ class TimeFormats(Enum):
     FEET_FRAMES = "Feet+Frames"
     SAMPLES = "Samples"
 
-class SectionHeaders(Enum):
-    ONLINE_FILES = "O N L I N E  F I L E S  I N  S E S S I O N"
-    OFFLINE_FILES = "O F F L I N E  F I L E S  I N  S E S S I O N"
-    ONLINE_CLIPS = "O N L I N E  C L I P S  I N  S E S S I O N"
-    PLUG_INS_LISTING = "P L U G - I N S  L I S T I N G"
-    TRACK_LISTING = "T R A C K  L I S T I N G"
-    MARKERS_LISTING = "M A R K E R S  L I S T I N G"
+def parse_track_blocks(blocks: Iterable[tuple], frame_rate: float = 24.0,
+                       columnar: bool = False) -> list[Track]:
+    """Parse tracks from their info rows, column header row and EDL rows
+
+    This is a module level function so it can be sent to worker processes.
+
+    Keyword arguments:
+    blocks: Iterable[tuple] -- the info rows, column header row and EDL rows of each track
+    frame_rate: float -- the frame rate of the session (default 24.0)
+    columnar: bool -- whether track channels should be EDLTables (default False)
+    """
+    tracks = []
+    column_headers = None
+
+    for info, column_header_row, rows in blocks:
+        if column_header_row is not None:
+            column_headers = lib.parse_column_headers(column_header_row, EDLHeaders)
+
+        tracks.append(Track.from_stream(info, column_headers, rows, frame_rate, columnar))
+
+    return tracks
+
+
+def chunk_track_blocks(blocks: list[tuple], number_of_chunks: int) -> list[list[tuple]]:
+    """Split consecutive track blocks into chunks with similar numbers of EDL rows
+
+    Keyword arguments:
+    blocks: list[tuple] -- the info rows, column header row and EDL rows of each track
+    number_of_chunks: int -- the number of chunks to aim for
+    """
+    total_rows = sum(len(rows) for _, _, rows in blocks)
+    target = max(1, total_rows // max(1, number_of_chunks))
+
+    chunks = []
+    chunk = []
+    chunk_rows = 0
+
+    for block in blocks:
+        chunk.append(block)
+        chunk_rows += len(block[2])
+
+        if chunk_rows >= target:
+            chunks.append(chunk)
+            chunk = []
+            chunk_rows = 0
+
+    if len(chunk) > 0:
+        chunks.append(chunk)
+
+    return chunks
 
-    @classmethod
-    def header_exists(cls, header: str):
-        return header in cls._value2member_map_ 
 
 class Session:
     def __init__(self, name: str, sample_rate: float, bit_depth: BitDepths, 
@@ -92,46 +156,106 @@ class Session:
 
 
     @classmethod
-    def from_file(cls, filename: str):
+    def from_file(cls, filename: str, sample_accurate: bool = False, columnar: bool = False,
+                  workers: int = None):
         """Constructor for the Session class using a text file
+
+        The encoding and line terminator are detected from the start of the
+        file, so UTF-8, UTF-16 and Mac Roman exports can be read as they are.
         
         Keyword arguments:
         filename: str -- the name of the file containing the Pro Tools Marker data
+        sample_accurate: bool -- whether marker locations should be SampleTimes taken
+                                 from the TIME REFERENCE column (default False)
+        columnar: bool -- whether track channels should be EDLTables (default False)
+        workers: int -- the number of processes to parse tracks in (default None)
         """
-        with open(filename, 'r') as timecode_file:
-            content = timecode_file.readlines()
+        with open(filename, 'rb') as timecode_file:
+            reader = LineReader(iterate_lines(timecode_file))
 
             # Parse the global data
-            globals = cls.parse_globals(content[NAME_INDEX:END_GLOBAL_DATA_INDEX])
-
-            name = globals[NAME_INDEX]
-            sample_rate = globals[SAMPLE_RATE_INDEX]
-            bit_depth = BitDepths(globals[BIT_DEPTH_INDEX].strip())
-            start = globals[SESSION_START_INDEX]
-            timecode_format = globals[TIMECODE_FORMAT_INDEX]
-            number_of_clips = globals[NUMBER_OF_CLIPS_INDEX]
-            number_of_files = globals[NUMBER_OF_FILES_INDEX]
-            number_of_tracks = globals[NUMBER_OF_TRACKS_INDEX]
-
-            frame_rate, drop_frame = cls.get_frame_rate(timecode_format)
-
-            # Parse the rest of the file
-            sections = cls.split_sections(content[END_GLOBAL_DATA_INDEX:])
-
-            parse = lambda header, parser: parser(sections[header]) if header in sections else []
-
-            online_files = parse(SectionHeaders.ONLINE_FILES, cls.parse_files)
-            offline_files = parse(SectionHeaders.OFFLINE_FILES, cls.parse_files)
-            online_clips = parse(SectionHeaders.ONLINE_CLIPS, cls.parse_clips)
-            plug_ins = parse(SectionHeaders.PLUG_INS_LISTING, cls.parse_plugins)
-            tracks = parse(SectionHeaders.TRACK_LISTING, cls.parse_tracks)
-            markers = parse(SectionHeaders.MARKERS_LISTING, cls.parse_markers)
+            global_data = cls.parse_global_data(read_globals(reader))
+            sample_rate, start, frame_rate = (global_data[SAMPLE_RATE_INDEX],
+                                              global_data[SESSION_START_INDEX],
+                                              global_data[FRAME_RATE_INDEX])
+
+            # Parse the rest of the file in a single pass
+            parsers = cls.get_section_parsers(frame_rate, columnar, workers)
+            sections = {header: [] for header in SectionHeaders}
+
+            for header, rows in iterate_sections(reader):
+                sections[header] = parsers[header](rows)
+
+            online_files = sections[SectionHeaders.ONLINE_FILES]
+            offline_files = sections[SectionHeaders.OFFLINE_FILES]
+            online_clips = sections[SectionHeaders.ONLINE_CLIPS]
+            plug_ins = sections[SectionHeaders.PLUG_INS_LISTING]
+            tracks = sections[SectionHeaders.TRACK_LISTING]
+            markers = sections[SectionHeaders.MARKERS_LISTING]
+
+            if sample_accurate:
+                cls.use_sample_times(markers, sample_rate, start)
             
-            return cls(name, sample_rate, bit_depth, start, frame_rate, drop_frame,
-                       number_of_tracks, number_of_clips, number_of_files,
-                       online_files, offline_files, online_clips, plug_ins,
+            return cls(*global_data, online_files, offline_files, online_clips, plug_ins,
                        tracks, markers)
-                
+
+
+    @classmethod
+    def parse_global_data(cls, rows: list[str]) -> list:
+        """Get the global data in the order the constructor takes it
+        
+        Keyword arguments:
+        rows: list[str] -- the global data rows at the top of the Pro Tools session file
+        """
+        globals = cls.parse_globals(rows[NAME_INDEX:END_GLOBAL_DATA_INDEX])
+
+        name = globals[NAME_INDEX]
+        sample_rate = globals[SAMPLE_RATE_INDEX]
+        bit_depth = BitDepths(globals[BIT_DEPTH_INDEX].strip())
+        timecode_format = globals[TIMECODE_FORMAT_INDEX]
+        number_of_clips = globals[NUMBER_OF_CLIPS_INDEX]
+        number_of_files = globals[NUMBER_OF_FILES_INDEX]
+        number_of_tracks = globals[NUMBER_OF_TRACKS_INDEX]
+
+        start = globals[SESSION_START_INDEX]
+        frame_rate, drop_frame = cls.get_frame_rate(timecode_format)
+
+        return [name, sample_rate, bit_depth, start, frame_rate, drop_frame,
+                number_of_tracks, number_of_clips, number_of_files]
+
+
+    def get_track(self, name: str) -> Track:
+        """Get the first track with a name
+
+        Keyword arguments:
+        name: str -- the name of the track
+        """
+
+        tracks = [track for track in self.tracks if track.name == name]
+        assert len(tracks) > 0, INVALID_TRACK.format(name)
+
+        return tracks[0]
+
+
+    def get_clip_index(self) -> ClipIndex:
+        """Index the online clips by name and source file, resolving source
+           files against the online and offline files"""
+
+        return ClipIndex(self.online_clips, self.online_files + self.offline_files)
+
+
+    @staticmethod
+    def use_sample_times(markers: list, sample_rate: float, start: Timecode) -> None:
+        """Replace the marker locations with SampleTimes taken from their time references
+        
+        Keyword arguments:
+        markers: list -- the markers to update
+        sample_rate: float -- the sample rate of the session
+        start: Timecode -- the start time of the session
+        """
+        for marker in markers:
+            marker.location = marker.get_sample_time(sample_rate, start)
+
 
     @staticmethod
     def parse_globals(content: list) -> list:
@@ -145,8 +269,9 @@ class Session:
         name = split_global_row(NAME_INDEX)
         sample_rate = float(split_global_row(SAMPLE_RATE_INDEX))
         bit_depth = split_global_row(BIT_DEPTH_INDEX)
-        start = Timecode.from_string(split_global_row(SESSION_START_INDEX))
         timecode_format = split_global_row(TIMECODE_FORMAT_INDEX)
+        frame_rate, _ = Session.get_frame_rate(timecode_format)
+        start = Timecode.from_string(split_global_row(SESSION_START_INDEX).strip(), frame_rate)
         number_of_tracks = int(split_global_row(NUMBER_OF_TRACKS_INDEX))
         number_of_clips = int(split_global_row(NUMBER_OF_CLIPS_INDEX))
         number_of_files = int(split_global_row(NUMBER_OF_FILES_INDEX))
@@ -169,6 +294,27 @@ class Session:
         return frame_rate, drop_frame
     
 
+    @classmethod
+    def get_section_parsers(cls, frame_rate: float = 24.0,
+                            columnar: bool = False,
+                            workers: int = None) -> dict[SectionHeaders, callable]:
+        """Get the function that parses the rows of each section
+        
+        Keyword arguments:
+        frame_rate: float -- the frame rate of the session (default 24.0)
+        columnar: bool -- whether track channels should be EDLTables (default False)
+        workers: int -- the number of processes to parse tracks in (default None)
+        """
+        return {
+            SectionHeaders.ONLINE_FILES: cls.parse_files,
+            SectionHeaders.OFFLINE_FILES: cls.parse_files,
+            SectionHeaders.ONLINE_CLIPS: cls.parse_clips,
+            SectionHeaders.PLUG_INS_LISTING: cls.parse_plugins,
+            SectionHeaders.TRACK_LISTING: lambda rows: cls.parse_tracks(rows, frame_rate, columnar, workers),
+            SectionHeaders.MARKERS_LISTING: lambda rows: cls.parse_markers(rows, frame_rate),
+        }
+
+
     @staticmethod
     def split_sections(content: list) -> dict[SectionHeaders, list]:
         """Extract the sections from a Pro Tools session file
@@ -176,98 +322,106 @@ class Session:
         Keyword arguments:
         content: list -- the content of the Pro Tools session file
         """
-        sections = {}
-
-        for line_index in range(len(content)):
-            line = content[line_index].strip()
-            if SectionHeaders.header_exists(line):
-                section_header = SectionHeaders(line)
-                section_content = []
-
-                line_index += 1
-
-                while (line_index < len(content) 
-                       and not SectionHeaders.header_exists(content[line_index])):
-                    line = content[line_index].strip()
-
-                    if line != "":
-                        section_content.append(content[line_index])
-
-                    line_index += 1
-
-                sections[section_header] = section_content
-
-        return sections
+        return {header: list(rows) for header, rows in iterate_sections(LineReader(content))}
 
 
     @classmethod
-    def parse_section(cls, content: list, HeaderType: Enum, constructor: callable) -> list:
+    def parse_section(cls, content: Iterable[str], HeaderType: Enum, create_parser: callable) -> list:
         """Parse a section of a Pro Tools session file
         
         Keyword arguments:
-        sections: dict -- the sections of the Pro Tools session file
-        header: SectionHeaders -- the header of the section to parse
-        parse: callable -- the function to parse the section
+        content: Iterable[str] -- the column header row followed by the data rows
+        HeaderType: Enum -- the column headers of the section
+        create_parser: callable -- creates the function that parses each row from the
+                                   column headers of the section
         """
-        TITLE_INDEX = 0
-        COLUMN_HEADER_INDEX = 1
-        DATA_INDEX = 2
-        
-        column_headers = lib.parse_column_headers(content[COLUMN_HEADER_INDEX], HeaderType)
-        section = []
+        column_header_row, rows = iterate_table(content)
+
+        if column_header_row is None:
+            return []
 
-        for row in content[DATA_INDEX:]:
-            if row != "":
-                section.append(constructor(column_headers, row))
+        parse_row = create_parser(lib.parse_column_headers(column_header_row, HeaderType))
 
-        return section
+        return [parse_row(row) for row in rows]
 
 
     @classmethod
     def parse_files(cls, content: list) -> list:
         """Wrapper function to parse the files in a Pro Tools session file"""
-        return cls.parse_section(content, FileHeaders, File.from_row)
+        return cls.parse_section(content, FileHeaders, File.create_row_parser)
     
 
     @classmethod
     def parse_clips(cls, content: list) -> list:
         """Wrapper function to parse the clips in a Pro Tools session file"""
-        # TODO: Implement
-        return []
+        return cls.parse_section(content, ClipHeaders, Clip.create_row_parser)
     
 
     @classmethod
     def parse_plugins(cls, content: list) -> list:
         """Wrapper function to parse the plugins in a Pro Tools session file"""
-        # TODO: Implement
-        return []
+        return cls.parse_section(content, PluginHeaders, Plugin.create_row_parser)
     
 
     @classmethod
-    def parse_tracks(cls, content: list) -> list:
-        """Parse the tracks in a Pro Tools session file"""
-
-        NAME_INDEX = 0
-        COLUMN_HEADERS_INDEX = 4
+    def parse_tracks(cls, content: Iterable[str], frame_rate: float = 24.0,
+                     columnar: bool = False, workers: int = None) -> list:
+        """Parse the tracks in a Pro Tools session file
         
-        track_start_index = NAME_INDEX
-        tracks = []
+        Keyword arguments:
+        content: Iterable[str] -- the rows of the track listing
+        frame_rate: float -- the frame rate of the session (default 24.0)
+        columnar: bool -- whether track channels should be EDLTables (default False)
+        workers: int -- the number of processes to parse tracks in, capped at the number
+                        of CPUs, or None to parse them in this process (default None)
+        """
+        workers = min(workers, os.cpu_count() or 1) if workers is not None else 1
 
-        column_headers = lib.parse_column_headers(content[COLUMN_HEADERS_INDEX], EDLHeaders)
+        if workers <= 1:
+            return parse_track_blocks(iterate_tracks(content), frame_rate, columnar)
 
-        for line_index in range(NAME_INDEX+1, len(content)):
-            line = lib.split_row(content[line_index])[0]
-            if line == "TRACK NAME:":
-                tracks.append(Track.from_rows(column_headers, content[track_start_index:line_index]))
-                track_start_index = line_index
-        
-        tracks.append(Track.from_rows(column_headers, content[track_start_index:]))
+        blocks = [(info, column_header_row, list(rows))
+                  for info, column_header_row, rows in iterate_tracks(content)]
+
+        if len(blocks) < 2 or sum(len(rows) for _, _, rows in blocks) < MIN_PARALLEL_ROWS:
+            return parse_track_blocks(blocks, frame_rate, columnar)
+
+        return cls.parse_tracks_in_parallel(blocks, frame_rate, columnar, workers)
+
+
+    @staticmethod
+    def parse_tracks_in_parallel(blocks: list[tuple], frame_rate: float, columnar: bool,
+                                 workers: int) -> list:
+        """Parse track blocks in a process pool, keeping the original track order
+
+        Tracks are grouped into chunks of roughly equal row counts so one
+        long dialogue track does not leave the other workers idle.
+
+        Keyword arguments:
+        blocks: list[tuple] -- the info rows, column header row and EDL rows of each track
+        frame_rate: float -- the frame rate of the session
+        columnar: bool -- whether track channels should be EDLTables
+        workers: int -- the number of processes to use
+        """
+        # Carry column headers forward so every chunk can be parsed on its own
+        column_header_row = None
+        resolved = []
+        for info, row, rows in blocks:
+            column_header_row = row if row is not None else column_header_row
+            resolved.append((info, column_header_row, rows))
+
+        chunks = chunk_track_blocks(resolved, workers * CHUNKS_PER_WORKER)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(parse_track_blocks, chunks,
+                                   [frame_rate] * len(chunks), [columnar] * len(chunks))
 
-        return tracks
+            return list(chain.from_iterable(results))
     
     
     @classmethod
-    def parse_markers(cls, content: list) -> list:
+    def parse_markers(cls, content: list, frame_rate: float = 24.0) -> list:
         """Wrapper function to parse the markers in a Pro Tools session file"""
-        return cls.parse_section(content, MarkerHeaders, Marker.from_row)
+        create_parser = lambda column_headers: Marker.create_row_parser(column_headers, frame_rate)
+        return cls.parse_section(content, MarkerHeaders, create_parser)
     
\ No newline at end of file
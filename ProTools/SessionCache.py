@@ -0,0 +1,167 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import zlib
+
+from ProTools.LazySession import LazySession
+from ProTools.SessionReader import SectionHeaders, PARSER_VERSION
+
+# Defaults
+DEFAULT_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "Voices-Now-SRT-Generator", "sessions")
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024 # Bytes
+
+# Files
+ENTRY_EXTENSION = ".session"
+CHUNK_SIZE = 1024 * 1024
+
+# Error Messages
+INVALID_MAX_SIZE = "Maximum cache size must be greater than or equal to 0"
+
+# ----------------------------------------------------------------------
+
+class SessionCache:
+    """An on-disk cache of parsed Sessions shared between processes
+
+    Entries are keyed by a hash of the export's content, the parser version
+    and the parse options, so an edited export or a parser change is never
+    served stale data. Each entry is a compressed pickle of a LazySession
+    with every section parsed, so a cached session has the same type as one
+    from LazySession.from_file and never rereads the export.
+    When the directory grows past max_size the least recently used entries
+    are removed.
+    """
+
+    def __init__(self, directory: str = DEFAULT_DIRECTORY, max_size: int = DEFAULT_MAX_SIZE):
+        """Constructor for the SessionCache class
+
+        Keyword arguments:
+        directory: str -- the directory to store entries in
+        max_size: int -- the maximum total size of the entries in bytes (default 256 MB)
+        """
+
+        assert max_size >= 0, INVALID_MAX_SIZE
+
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(directory, exist_ok=True)
+
+
+    @staticmethod
+    def get_key(filename: str, sample_accurate: bool = False, columnar: bool = False) -> str:
+        """Hash the content of an export together with the parser version
+
+        Keyword arguments:
+        filename: str -- the name of the file containing the Pro Tools session data
+        sample_accurate: bool -- whether marker locations are SampleTimes (default False)
+        columnar: bool -- whether track channels are EDLTables (default False)
+        """
+
+        digest = hashlib.sha256(f"{PARSER_VERSION}:{sample_accurate}:{columnar}:".encode())
+
+        with open(filename, "rb") as session_file:
+            for chunk in iter(lambda: session_file.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+
+        return digest.hexdigest()
+
+
+    def get_path(self, key: str) -> str:
+        """Get the path of the entry for a key"""
+
+        return os.path.join(self.directory, key + ENTRY_EXTENSION)
+
+
+    def load(self, filename: str, sample_accurate: bool = False,
+             columnar: bool = False) -> LazySession:
+        """Get the parsed LazySession for an export, parsing and storing it on a miss
+
+        Keyword arguments:
+        filename: str -- the name of the file containing the Pro Tools session data
+        sample_accurate: bool -- whether marker locations should be SampleTimes taken
+                                 from the TIME REFERENCE column (default False)
+        columnar: bool -- whether track channels should be EDLTables (default False)
+        """
+
+        key = self.get_key(filename, sample_accurate, columnar)
+        session = self.get(key)
+
+        if session is None:
+            self.misses += 1
+            session = LazySession.from_file(filename, sample_accurate, columnar,
+                                            prefetch=SectionHeaders)
+            self.put(key, session)
+        else:
+            self.hits += 1
+
+        return session
+
+
+    def get(self, key: str) -> LazySession:
+        """Read a cached LazySession, or None if the entry is missing or unreadable"""
+
+        path = self.get_path(key)
+
+        try:
+            with open(path, "rb") as entry:
+                session = pickle.loads(zlib.decompress(entry.read()))
+            os.utime(path)
+        except (OSError, EOFError, zlib.error, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
+
+        return session
+
+
+    def put(self, key: str, session: LazySession) -> None:
+        """Store a LazySession and evict old entries if the cache is too large"""
+
+        data = zlib.compress(pickle.dumps(session, pickle.HIGHEST_PROTOCOL))
+
+        handle, temporary = tempfile.mkstemp(dir=self.directory)
+        with os.fdopen(handle, "wb") as entry:
+            entry.write(data)
+        os.replace(temporary, self.get_path(key))
+
+        self.evict()
+
+
+    def get_entries(self) -> list[os.DirEntry]:
+        """Get the cache entries from least to most recently used"""
+
+        entries = [entry for entry in os.scandir(self.directory)
+                   if entry.is_file() and entry.name.endswith(ENTRY_EXTENSION)]
+
+        return sorted(entries, key=lambda entry: entry.stat().st_mtime_ns)
+
+
+    def get_size(self) -> int:
+        """Get the total size of the cache entries in bytes"""
+
+        return sum(entry.stat().st_size for entry in self.get_entries())
+
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits in max_size"""
+
+        entries = self.get_entries()
+        size = sum(entry.stat().st_size for entry in entries)
+
+        for entry in entries:
+            if size <= self.max_size:
+                break
+
+            size -= entry.stat().st_size
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+
+    def clear(self) -> None:
+        """Remove every cache entry"""
+
+        for entry in self.get_entries():
+            os.remove(entry.path)
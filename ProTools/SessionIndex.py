@@ -0,0 +1,197 @@
+import mmap
+
+from ProTools.Session import Session, SAMPLE_RATE_INDEX, SESSION_START_INDEX, FRAME_RATE_INDEX
+from ProTools.SessionReader import SectionHeaders, ExportFormat, TRACK_NAME, ROW_DELIMITER, read_rows
+from ProTools.Track import Track
+
+# Error Messages
+EMPTY_FILE = "Session file {0} is empty"
+INVALID_TRACK = "Track {0} does not exist"
+INVALID_SECTION = "Section {0} does not exist"
+
+# ----------------------------------------------------------------------
+
+class SessionIndex:
+    """A byte offset index over a Pro Tools session text export
+
+    The export is memory mapped and searched for the section headers and
+    the TRACK NAME rows of the track listing. A single track or section can
+    then be parsed without reading the rest of the file.
+    """
+
+    def __init__(self, filename: str):
+        """Constructor for the SessionIndex class
+
+        Keyword arguments:
+        filename: str -- the name of the file containing the Pro Tools session data
+        """
+
+        self.filename = filename
+
+        with open(filename, "rb") as session_file:
+            assert session_file.seek(0, 2) > 0, EMPTY_FILE.format(filename)
+            self.__map = mmap.mmap(session_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.export_format = ExportFormat.from_file(self.__map)
+        headers = self.__find_headers()
+        self.sections = self.__find_sections(headers)
+        self.tracks = self.__find_tracks()
+
+        # The global rows end at the line of the first section header
+        first_header = headers[0][0] if len(headers) > 0 else len(self.__map)
+        global_rows = list(read_rows(self.__map, self.export_format.start, first_header,
+                                     self.export_format))
+        global_data = Session.parse_global_data(global_rows)
+
+        self.sample_rate = global_data[SAMPLE_RATE_INDEX]
+        self.start = global_data[SESSION_START_INDEX]
+        self.frame_rate = global_data[FRAME_RATE_INDEX]
+
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+    def close(self) -> None:
+        """Release the memory map"""
+
+        self.__map.close()
+
+
+    def __find_line(self, value: bytes, start: int = 0, end: int = None) -> int:
+        """Find the next line that starts with a value, or -1"""
+
+        end = len(self.__map) if end is None else end
+        position = self.__map.find(value, start, end)
+
+        while position != -1 and not self.__is_line_start(position):
+            position = self.__map.find(value, position + 1, end)
+
+        return position
+
+
+    def __is_line_start(self, position: int) -> bool:
+        """Check whether a position is the first byte of a line"""
+
+        export_format = self.export_format
+        if (position - export_format.start) % export_format.unit_size != 0:
+            return False
+
+        return (position == export_format.start or
+                self.__map[max(0, position - export_format.unit_size):position] in
+                (export_format.encode("\n"), export_format.encode("\r")))
+
+
+    def __line_end(self, position: int) -> int:
+        """Get the offset just past the line that contains a position"""
+
+        terminator = self.export_format.encoded_terminator
+        end = self.__map.find(terminator, position)
+
+        while end != -1 and (end - self.export_format.start) % self.export_format.unit_size != 0:
+            end = self.__map.find(terminator, end + 1)
+
+        return len(self.__map) if end == -1 else end + len(terminator)
+
+
+    def __find_headers(self) -> list[tuple[int, SectionHeaders]]:
+        """Get the byte offset of every section header line in file order"""
+
+        headers = []
+
+        for header in SectionHeaders:
+            position = self.__find_line(self.export_format.encode(header.value))
+            if position != -1:
+                headers.append((position, header))
+
+        return sorted(headers)
+
+
+    def __find_sections(self, headers: list[tuple[int, SectionHeaders]]
+                        ) -> dict[SectionHeaders, tuple[int, int]]:
+        """Get the byte range of the rows of every section from its header line"""
+
+        ends = [position for position, _ in headers[1:]] + [len(self.__map)]
+
+        return {header: (self.__line_end(position), end)
+                for (position, header), end in zip(headers, ends)}
+
+
+    def __find_tracks(self) -> dict[str, tuple[int, int]]:
+        """Get the byte range of every track in the track listing by name"""
+
+        if SectionHeaders.TRACK_LISTING not in self.sections:
+            return {}
+
+        start, end = self.sections[SectionHeaders.TRACK_LISTING]
+        key = self.export_format.encode(TRACK_NAME)
+
+        starts = []
+        position = self.__find_line(key, start, end)
+        while position != -1:
+            starts.append(position)
+            position = self.__find_line(key, position + len(key), end)
+
+        tracks = {}
+        for track_start, track_end in zip(starts, starts[1:] + [end]):
+            line = self.export_format.decode(self.__map[track_start:self.__line_end(track_start)])
+            name = line[len(TRACK_NAME):].strip(ROW_DELIMITER + " \r\n")
+            tracks.setdefault(name, (track_start, track_end))
+
+        return tracks
+
+
+    def get_track_names(self) -> list[str]:
+        """Get the names of the tracks in the order they appear"""
+
+        return list(self.tracks.keys())
+
+
+    def get_track(self, name: str, columnar: bool = False) -> Track:
+        """Parse a single track by name
+
+        Keyword arguments:
+        name: str -- the name of the track
+        columnar: bool -- whether the channels should be EDLTables (default False)
+        """
+
+        assert name in self.tracks, INVALID_TRACK.format(name)
+
+        return Session.parse_tracks(read_rows(self.__map, *self.tracks[name], self.export_format),
+                                    self.frame_rate, columnar)[0]
+
+
+    def get_section(self, header: SectionHeaders) -> list:
+        """Parse a single section
+
+        Keyword arguments:
+        header: SectionHeaders -- the section to parse
+        """
+
+        assert header in SectionHeaders, INVALID_SECTION.format(header)
+
+        if header not in self.sections:
+            return []
+
+        parse = Session.get_section_parsers(self.frame_rate)[header]
+
+        return parse(read_rows(self.__map, *self.sections[header], self.export_format))
+
+
+    def get_markers(self, sample_accurate: bool = False) -> list:
+        """Parse the markers listing
+
+        Keyword arguments:
+        sample_accurate: bool -- whether marker locations should be SampleTimes taken
+                                 from the TIME REFERENCE column (default False)
+        """
+
+        markers = self.get_section(SectionHeaders.MARKERS_LISTING)
+
+        if sample_accurate:
+            Session.use_sample_times(markers, self.sample_rate, self.start)
+
+        return markers
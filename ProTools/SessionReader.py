@@ -0,0 +1,489 @@
+"""
+Streaming reader for Pro Tools session text exports
+
+The reader walks the export once, one line at a time, and hands out
+generators rather than lists, so memory use does not grow with the length of
+a section or a track. Generators that are left partly consumed are drained
+before the next section or track is yielded.
+
+Exports are read as bytes. The encoding (UTF-8, UTF-16 with a byte order
+mark or Mac Roman) and the line terminator (CRLF, LF or CR) are detected from
+the first bytes. iterate_lines decodes every line, since Session.from_file
+parses every section. index_sections compares lines against the section
+headers as bytes, and read_rows decodes only the section it reads, so
+LazySession and SessionIndex decode just the sections that are accessed.
+
+EXAMPLE TRACK LISTING
+
+T R A C K  L I S T I N G
+TRACK NAME:	DIA
+COMMENTS:
+USER DELAY:	0 Samples
+STATE:
+PLUG-INS:
+CHANNEL 	EVENT   	CLIP NAME                     	START TIME    	END TIME      	DURATION      	STATE
+1       	1       	1                             	01:00:21:17   	01:00:34:07   	00:00:12:14   	Unmuted
+"""
+
+import codecs
+from enum import Enum
+from itertools import chain
+from typing import BinaryIO, Iterable, Iterator
+
+from ProTools.EDL import ColumnHeaders as EDLHeaders
+
+# Delimiters
+ROW_DELIMITER = "\t"
+NEWLINE = "\n"
+LINE_ENDINGS = "\r\n"
+
+# Encodings
+ENCODING = "utf-8"
+FALLBACK_ENCODING = "mac_roman"
+BYTE_ORDER_MARKS = ((codecs.BOM_UTF8, "utf-8"),
+                    (codecs.BOM_UTF16_LE, "utf-16-le"),
+                    (codecs.BOM_UTF16_BE, "utf-16-be"))
+TERMINATORS = ("\r\n", "\n", "\r") # In order of preference when detecting
+
+# Sizes
+DETECTION_SIZE = 64 * 1024 # Bytes read to detect the format
+CHUNK_SIZE = 1024 * 1024 # Bytes read at a time when splitting lines
+
+# Versions
+PARSER_VERSION = 2 # Increase whenever the parsed output of an export changes
+
+# Track Keys
+TRACK_NAME = "TRACK NAME:"
+
+# Error Messages
+INVALID_ENCODING = "Encoding {0} is not supported"
+INVALID_TERMINATOR = "Line terminator {0} is not supported"
+
+# ----------------------------------------------------------------------
+
+class SectionHeaders(Enum):
+    ONLINE_FILES = "O N L I N E  F I L E S  I N  S E S S I O N"
+    OFFLINE_FILES = "O F F L I N E  F I L E S  I N  S E S S I O N"
+    ONLINE_CLIPS = "O N L I N E  C L I P S  I N  S E S S I O N"
+    PLUG_INS_LISTING = "P L U G - I N S  L I S T I N G"
+    TRACK_LISTING = "T R A C K  L I S T I N G"
+    MARKERS_LISTING = "M A R K E R S  L I S T I N G"
+
+    @classmethod
+    def header_exists(cls, header: str):
+        return header in cls._value2member_map_
+
+
+class LineReader:
+    """Iterate over lines with one line of lookahead"""
+
+    def __init__(self, lines: Iterable[str]):
+        """Constructor for the LineReader class
+
+        Keyword arguments:
+        lines: Iterable[str] -- the lines to read, with or without line endings
+        """
+
+        self.__lines = iter(lines)
+        self.__next = None
+        self.__advance()
+
+
+    def __advance(self) -> None:
+        line = next(self.__lines, None)
+        self.__next = line.rstrip(NEWLINE) if line is not None else None
+
+
+    def peek(self) -> str:
+        """Get the next line without consuming it, or None at the end"""
+
+        return self.__next
+
+
+    def pop(self) -> str:
+        """Consume and return the next line, or None at the end"""
+
+        line = self.__next
+        if line is not None:
+            self.__advance()
+
+        return line
+
+
+    def take_until(self, is_boundary: callable) -> Iterator[str]:
+        """Yield the non-blank lines before the next boundary line
+
+        Keyword arguments:
+        is_boundary: callable -- whether a line starts the next block
+        """
+
+        while self.__next is not None and not is_boundary(self.__next):
+            line = self.pop()
+            if line.strip() != "":
+                yield line
+
+
+def is_section_header(line: str) -> bool:
+    """Check whether a line is one of the SectionHeaders"""
+
+    return SectionHeaders.header_exists(line.strip())
+
+
+def is_track_name(line: str) -> bool:
+    """Check whether a line starts a new track in the track listing"""
+
+    return line.startswith(TRACK_NAME)
+
+
+def is_track_column_headers(line: str) -> bool:
+    """Check whether a line holds the EDL column headers of a track"""
+
+    return line.split(ROW_DELIMITER, 1)[0].strip() == EDLHeaders.CHANNEL.value
+
+
+def read_globals(reader: LineReader) -> list[str]:
+    """Read the global data rows before the first section
+
+    Keyword arguments:
+    reader: LineReader -- the reader positioned at the start of the export
+    """
+
+    return list(reader.take_until(is_section_header))
+
+
+def iterate_sections(reader: LineReader) -> Iterator[tuple[SectionHeaders, Iterator[str]]]:
+    """Yield each section header with a generator over its non-blank rows
+
+    Keyword arguments:
+    reader: LineReader -- the reader positioned at or before a section header
+    """
+
+    for _ in reader.take_until(is_section_header):
+        pass
+
+    while reader.peek() is not None:
+        header = SectionHeaders(reader.pop().strip())
+        rows = reader.take_until(is_section_header)
+
+        yield header, rows
+
+        for _ in rows:
+            pass
+
+
+def iterate_table(rows: Iterable[str]) -> tuple[str, Iterator[str]]:
+    """Split the rows of a tabular section into its column header row and
+       a generator over its data rows
+
+    Keyword arguments:
+    rows: Iterable[str] -- the non-blank rows of the section
+    """
+
+    rows = iter(rows)
+
+    return next(rows, None), rows
+
+
+def iterate_tracks(rows: Iterable[str]) -> Iterator[tuple[list[str], str, Iterator[str]]]:
+    """Yield the info rows, the column header row and a generator over the
+       EDL rows of each track in the track listing
+
+    Keyword arguments:
+    rows: Iterable[str] -- the non-blank rows of the track listing
+    """
+
+    reader = LineReader(rows)
+
+    for _ in reader.take_until(is_track_name):
+        pass
+
+    while reader.peek() is not None:
+        info = [reader.pop()]
+        info.extend(reader.take_until(lambda line: is_track_column_headers(line) or
+                                                   is_track_name(line)))
+
+        next_line = reader.peek()
+        column_headers = (reader.pop() if next_line is not None and is_track_column_headers(next_line)
+                          else None)
+        edls = reader.take_until(is_track_name)
+
+        yield info, column_headers, edls
+
+        for _ in edls:
+            pass
+
+
+# ENCODINGS
+
+class ExportFormat:
+    """The encoding and line terminator of an export
+
+    Lines are split on the encoded terminator and left as bytes, so a caller
+    that only needs to compare a line against a known value (a section header
+    for example) does not have to decode it.
+    """
+
+    __slots__ = ("encoding", "terminator", "start", "encoded_terminator", "unit_size")
+
+    def __init__(self, encoding: str = ENCODING, terminator: str = NEWLINE, start: int = 0):
+        """Constructor for the ExportFormat class
+
+        Keyword arguments:
+        encoding: str -- the codec the export is written in (default utf-8)
+        terminator: str -- the line terminator (default "\\n")
+        start: int -- the offset of the first byte after any byte order mark (default 0)
+        """
+
+        assert codecs.lookup(encoding) is not None, INVALID_ENCODING.format(encoding)
+        assert terminator in TERMINATORS, INVALID_TERMINATOR.format(repr(terminator))
+
+        self.encoding = encoding
+        self.terminator = terminator
+        self.start = start
+        self.encoded_terminator = terminator.encode(encoding)
+        self.unit_size = len(NEWLINE.encode(encoding))
+
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'ExportFormat':
+        """Constructor for the ExportFormat class based on the first bytes of an export
+
+        A byte order mark selects UTF-8 or UTF-16. Otherwise the bytes are
+        UTF-8 if they decode as UTF-8 and Mac Roman if they do not. The line
+        terminator is the first of CRLF, LF or CR found in the sample.
+
+        Keyword arguments:
+        data: bytes -- the start of the export
+        """
+
+        encoding, start = None, 0
+        for byte_order_mark, bom_encoding in BYTE_ORDER_MARKS:
+            if data.startswith(byte_order_mark):
+                encoding, start = bom_encoding, len(byte_order_mark)
+                break
+
+        if encoding is None:
+            try:
+                codecs.getincrementaldecoder(ENCODING)().decode(data, final=False)
+                encoding = ENCODING
+            except UnicodeDecodeError:
+                encoding = FALLBACK_ENCODING
+
+        sample = data[start:]
+        terminator = next((terminator for terminator in TERMINATORS
+                           if terminator.encode(encoding) in sample), NEWLINE)
+
+        return cls(encoding, terminator, start)
+
+
+    @classmethod
+    def from_file(cls, session_file: BinaryIO) -> 'ExportFormat':
+        """Constructor for the ExportFormat class based on an open export
+
+        The file is read from the start and left positioned after any byte
+        order mark.
+
+        Keyword arguments:
+        session_file: BinaryIO -- the export opened in binary mode
+        """
+
+        session_file.seek(0)
+        export_format = cls.from_bytes(session_file.read(DETECTION_SIZE))
+        session_file.seek(export_format.start)
+
+        return export_format
+
+
+    def encode(self, text: str) -> bytes:
+        """Encode a value for comparison against raw lines"""
+
+        return text.encode(self.encoding)
+
+
+    def decode(self, line: bytes) -> str:
+        """Decode a raw line without its terminator
+
+        Lines that are not valid in the detected encoding fall back to
+        Mac Roman, which can decode any byte, since the detection sample may
+        not have contained any non-ASCII text.
+        """
+
+        try:
+            text = line.decode(self.encoding)
+        except UnicodeDecodeError:
+            text = line.decode(FALLBACK_ENCODING)
+
+        return text.rstrip(LINE_ENDINGS)
+
+
+    def is_blank(self, line: bytes) -> bool:
+        """Check whether a raw line holds only whitespace"""
+
+        return self.decode(line).strip() == "" if self.unit_size > 1 else line.strip() == b""
+
+
+    def __eq__(self, other):
+        if isinstance(other, ExportFormat):
+            return (self.encoding == other.encoding and
+                    self.terminator == other.terminator and
+                    self.start == other.start)
+
+        return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return f"ExportFormat({self.encoding!r}, {self.terminator!r}, {self.start})"
+
+
+def split_chunks(session_file: BinaryIO, export_format: ExportFormat, start: int = None,
+                 end: int = None) -> Iterator[list[bytes]]:
+    """Yield the undecoded lines of an export a chunk at a time
+
+    The file is read in large chunks and split on the encoded terminator,
+    which works for CR-only exports that readline cannot split. For UTF-16
+    only terminators aligned to a code unit are accepted. A line that runs
+    past the end of a chunk is carried over to the next one.
+
+    Keyword arguments:
+    session_file: BinaryIO -- the export opened in binary mode
+    export_format: ExportFormat -- the format of the export
+    start: int -- the offset of the first line (default the start of the content)
+    end: int -- the offset to stop reading at (default the end of the file)
+    """
+
+    start = export_format.start if start is None else start
+    terminator = export_format.encoded_terminator
+    unit_size = export_format.unit_size
+    remaining = None if end is None else max(0, end - start)
+
+    session_file.seek(start)
+    buffer = b""
+
+    while True:
+        chunk = session_file.read(CHUNK_SIZE if remaining is None else min(CHUNK_SIZE, remaining))
+        if remaining is not None:
+            remaining -= len(chunk)
+        buffer += chunk
+
+        if unit_size == 1:
+            *lines, buffer = buffer.split(terminator)
+        else:
+            lines = []
+            position = 0
+            index = buffer.find(terminator)
+            while index != -1:
+                if index % unit_size == 0:
+                    lines.append(buffer[position:index])
+                    position = index + len(terminator)
+                    index = buffer.find(terminator, position)
+                else:
+                    index = buffer.find(terminator, index + 1)
+
+            buffer = buffer[position:]
+
+        if chunk == b"" or remaining == 0:
+            yield lines + [buffer] if buffer != b"" else lines
+            return
+
+        yield lines
+
+
+def iterate_raw_lines(session_file: BinaryIO, export_format: ExportFormat, start: int = None,
+                      end: int = None) -> Iterator[tuple[int, bytes]]:
+    """Yield the byte offset and the undecoded content of every line
+
+    Keyword arguments:
+    session_file: BinaryIO -- the export opened in binary mode
+    export_format: ExportFormat -- the format of the export
+    start: int -- the offset of the first line (default the start of the content)
+    end: int -- the offset to stop reading at (default the end of the file)
+    """
+
+    position = export_format.start if start is None else start
+    terminator_length = len(export_format.encoded_terminator)
+
+    for lines in split_chunks(session_file, export_format, start, end):
+        for line in lines:
+            yield position, line
+            position += len(line) + terminator_length
+
+
+def iterate_lines(session_file: BinaryIO, export_format: ExportFormat = None) -> Iterator[str]:
+    """Yield every decoded line of an export, detecting its format if needed
+
+    Keyword arguments:
+    session_file: BinaryIO -- the export opened in binary mode
+    export_format: ExportFormat -- the format of the export (default None, which detects it)
+    """
+
+    export_format = ExportFormat.from_file(session_file) if export_format is None else export_format
+
+    yield from map(export_format.decode, chain.from_iterable(split_chunks(session_file, export_format)))
+
+
+# BYTE OFFSETS
+
+def index_sections(session_file: BinaryIO, export_format: ExportFormat = None
+                   ) -> tuple[list[str], dict[SectionHeaders, tuple[int, int]]]:
+    """Read the global data rows and record the byte range of every section
+       without parsing any of them
+
+    Only the global data rows are decoded; every other line is compared
+    against the encoded section headers as bytes.
+
+    Keyword arguments:
+    session_file: BinaryIO -- the export opened in binary mode
+    export_format: ExportFormat -- the format of the export (default None, which detects it)
+
+    Returns the global data rows and the (start, end) byte offsets of the rows
+    of each section, excluding the section header.
+    """
+
+    export_format = ExportFormat.from_file(session_file) if export_format is None else export_format
+    headers = {export_format.encode(header.value): header for header in SectionHeaders}
+    terminator_length = len(export_format.encoded_terminator)
+
+    global_rows = []
+    offsets = {}
+    current_header = None
+    section_start = 0
+
+    for position, line in iterate_raw_lines(session_file, export_format):
+        header = headers.get(line.strip() if export_format.unit_size == 1
+                             else export_format.encode(export_format.decode(line).strip()))
+
+        if header is not None:
+            if current_header is not None:
+                offsets[current_header] = (section_start, position)
+            current_header = header
+            section_start = position + len(line) + terminator_length
+        elif current_header is None and not export_format.is_blank(line):
+            global_rows.append(export_format.decode(line))
+
+    if current_header is not None:
+        end = session_file.tell()
+        offsets[current_header] = (min(section_start, end), end)
+
+    return global_rows, offsets
+
+
+def read_rows(session_file: BinaryIO, start: int, end: int,
+              export_format: ExportFormat = None) -> Iterator[str]:
+    """Yield the non-blank rows between two byte offsets
+
+    Keyword arguments:
+    session_file: BinaryIO -- the export opened in binary mode
+    start: int -- the offset of the first row
+    end: int -- the offset just past the last row
+    export_format: ExportFormat -- the format of the export (default UTF-8 with LF)
+    """
+
+    export_format = ExportFormat() if export_format is None else export_format
+
+    lines = chain.from_iterable(split_chunks(session_file, export_format, start, end))
+
+    for line in map(export_format.decode, lines):
+        if line.strip() != "":
+            yield line
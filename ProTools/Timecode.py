@@ -1,11 +1,23 @@
 import re
+from collections import OrderedDict
 from enum import Enum, IntEnum
+from fractions import Fraction
 
 # Rates
 ROUNDING_RATE = 0.5
 MILLISECONDS_PER_SECOND = 1000
 SECONDS_PER_MINUTE = 60
 MINUTES_PER_HOUR = 60
+MINUTES_PER_DROP_CYCLE = 10
+
+# Fractional Rates (23.976, 29.97, 59.94)
+NTSC_DENOMINATOR = 1001
+NTSC_TOLERANCE = 0.01
+MAX_DENOMINATOR = 1001
+
+# Drop Frame
+DROP_FRAME_BASE = 30  # Drop frame timecode is only defined for multiples of 30
+FRAMES_DROPPED_PER_BASE = 2
 
 # Delimiters
 STANDARD_TIME_DELIMITER = ":"
@@ -22,23 +34,39 @@ DROP_FRAME_FORMAT = "{0:02d}:{1:02d}:{2:02d};{3:02d}"
 FRAMES_REGEX = r"^\d{2}:\d{2}:\d{2}:\d{2}$"
 MILLISECONDS_REGEX = r"^\d{2}:\d{2}:\d{2}[,.]\d{3}$"
 DROP_FRAME_REGEX = r"^\d{2}:\d{2}:\d{2};\d{2}$"
+TIMECODE_REGEX = r"^\d{2}:\d{2}:\d{2}(?:[:;]\d{2}|[,.]\d{3})$"
+
+FRAMES_PATTERN = re.compile(FRAMES_REGEX)
+MILLISECONDS_PATTERN = re.compile(MILLISECONDS_REGEX)
+DROP_FRAME_PATTERN = re.compile(DROP_FRAME_REGEX)
+TIMECODE_PATTERN = re.compile(TIMECODE_REGEX)
 
 # Indices
 DELIMITER_INDEX = 8
+END_VALUE_INDEX = 9
+HOURS_SLICE = slice(0, 2)
+MINUTES_SLICE = slice(3, 5)
+SECONDS_SLICE = slice(6, 8)
 
 # Defaults
 DEFAULT_FRAME_RATE = 24.0
 DEFAULT_DROP_FRAME = False
+DEFAULT_DROP_FRAME_RATE = 29.97
+DEFAULT_CACHE_SIZE = 4096
 
 # Error Messages
 INVALID_HOURS = "Hours must be greater than or equal to 0"
 INVALID_MINUTES = "Minutes must be between 0 and 59"
 INVALID_SECONDS = "Seconds must be between 0 and 59"
+INVALID_FRAMES = "Frames must be between 0 and the frame rate"
 INVALID_FRAME_RATE = "Frame rate must be greater than 0"
+INVALID_DROP_FRAME_RATE = "Drop frame timecode requires a 29.97 or 59.94 frame rate"
+INVALID_DROP_FRAME_LABEL = "Frames {0} and {1} do not exist in drop frame timecode at the start of this minute"
 INVALID_MILLISECONDS = "Milliseconds must be between 0 and 999"
 INVALID_TOTAL_FRAMES = "Total frames must be greater than or equal to 0"
+INVALID_CACHE_SIZE = "Cache size must be greater than 0"
 
-INVALID_TYPE = f"Timecode must be {0}"
+INVALID_TYPE = "Timecode must be {0}"
 
 NO_MATCH = "No matching timecode format found"
 INVALID_FRAME_FORMAT = "Timecode must be formatted as HH:MM:SS:FF"
@@ -70,10 +98,268 @@ def validate_frame_rate(frame_rate: float):
 
     assert 0 < frame_rate, INVALID_FRAME_RATE
 
-# TODO: check drop frame arithmetic
-# TODO: consider reworking the class to use a single time component
+
+def get_default_frame_rate(drop_frame: bool) -> float:
+    """Get the frame rate to use when none is given
+
+    Keyword arguments:
+    drop_frame: bool -- whether the timecode uses drop frame arithmetic
+    """
+
+    return DEFAULT_DROP_FRAME_RATE if drop_frame else DEFAULT_FRAME_RATE
+
+
+class FrameRate:
+    """Shared description of a frame rate
+
+    One instance exists per (frame rate, drop frame) pair, so every Timecode
+    at the same rate points at the same object instead of carrying its own
+    copy of the rate data.
+
+    Real time is measured with an exact rational rate (30000/1001 for 29.97),
+    while timecode labels count at the nominal integer timebase (30 for 29.97).
+    Drop frame rates skip the first frame numbers of every minute except each
+    tenth minute. Non-drop rates use the same formulas with zero dropped
+    frames, so neither path needs a branch.
+    """
+
+    __slots__ = ("frame_rate", "drop_frame", "timebase", "numerator", "denominator",
+                 "frames_per_minute", "frames_per_hour", "dropped_frames",
+                 "frames_per_dropped_minute", "frames_per_drop_cycle",
+                 "milliseconds_by_frame", "frames_by_millisecond")
+
+    __rates = {}
+
+    def __init__(self, frame_rate: float, drop_frame: bool):
+        """Constructor for the FrameRate class
+
+        Keyword arguments:
+        frame_rate: float -- the number of frames per second
+        drop_frame: bool -- whether to use drop frame arithmetic
+        """
+
+        validate_frame_rate(frame_rate)
+
+        self.frame_rate = frame_rate
+        self.drop_frame = drop_frame
+        self.timebase = max(1, int(frame_rate + ROUNDING_RATE))
+        self.numerator, self.denominator = FrameRate.get_rational_rate(frame_rate)
+
+        assert not drop_frame or self.timebase % DROP_FRAME_BASE == 0, INVALID_DROP_FRAME_RATE
+
+        # Nominal label counts
+        self.frames_per_minute = self.timebase * SECONDS_PER_MINUTE
+        self.frames_per_hour = self.frames_per_minute * MINUTES_PER_HOUR
+
+        # Actual counts once frame numbers are dropped
+        self.dropped_frames = (self.timebase // DROP_FRAME_BASE * FRAMES_DROPPED_PER_BASE
+                               if drop_frame else 0)
+        self.frames_per_dropped_minute = self.frames_per_minute - self.dropped_frames
+        self.frames_per_drop_cycle = (self.frames_per_minute * MINUTES_PER_DROP_CYCLE
+                                      - self.dropped_frames * (MINUTES_PER_DROP_CYCLE - 1))
+
+        # Lookup tables between the frames and milliseconds within one second
+        self.milliseconds_by_frame = tuple(
+            int(frames / frame_rate * MILLISECONDS_PER_SECOND + ROUNDING_RATE)
+            for frames in range(self.timebase + 1))
+        self.frames_by_millisecond = tuple(
+            int(milliseconds / MILLISECONDS_PER_SECOND * frame_rate + ROUNDING_RATE)
+            for milliseconds in range(MILLISECONDS_PER_SECOND))
+
+
+    @classmethod
+    def get(cls, frame_rate: float = DEFAULT_FRAME_RATE,
+            drop_frame: bool = DEFAULT_DROP_FRAME) -> 'FrameRate':
+        """Get the shared FrameRate for a frame rate and drop frame flag
+
+        Keyword arguments:
+        frame_rate: float -- the number of frames per second (default 24.0)
+        drop_frame: bool -- whether to use drop frame arithmetic (default False)
+        """
+
+        key = (frame_rate, drop_frame)
+        rate = cls.__rates.get(key)
+
+        if rate is None:
+            rate = cls(frame_rate, drop_frame)
+            cls.__rates[key] = rate
+
+        return rate
+
+
+    def __reduce__(self):
+        """Restore pickled rates through get so they stay shared"""
+
+        return (FrameRate.get, (self.frame_rate, self.drop_frame))
+
+
+    @staticmethod
+    def get_rational_rate(frame_rate: float) -> tuple:
+        """Get the exact frame rate as a numerator and denominator
+
+        Keyword arguments:
+        frame_rate: float -- the number of frames per second
+        """
+
+        timebase = int(frame_rate + ROUNDING_RATE)
+        ntsc_rate = timebase * MILLISECONDS_PER_SECOND / NTSC_DENOMINATOR
+
+        if frame_rate != timebase and abs(frame_rate - ntsc_rate) < NTSC_TOLERANCE:
+            return timebase * MILLISECONDS_PER_SECOND, NTSC_DENOMINATOR
+
+        fraction = Fraction(frame_rate).limit_denominator(MAX_DENOMINATOR)
+
+        return fraction.numerator, fraction.denominator
+
+
+    def to_total_frames(self, hours: int, minutes: int, seconds: int,
+                        frames: int) -> int:
+        """Convert timecode label components to a total number of frames"""
+
+        total_minutes = hours * MINUTES_PER_HOUR + minutes
+        skipped_frames = self.dropped_frames * (total_minutes - total_minutes // MINUTES_PER_DROP_CYCLE)
+
+        return (hours * self.frames_per_hour + minutes * self.frames_per_minute
+                + seconds * self.timebase + frames - skipped_frames)
+
+
+    def to_label_frames(self, total_frames: int) -> int:
+        """Convert a total number of frames to the frame count shown on the
+           label, which includes the frame numbers skipped by drop frame"""
+
+        cycles, remaining_frames = divmod(total_frames, self.frames_per_drop_cycle)
+        dropped_minutes = ((remaining_frames - self.dropped_frames)
+                           * (remaining_frames >= self.dropped_frames)
+                           // self.frames_per_dropped_minute)
+
+        return (total_frames + self.dropped_frames * (MINUTES_PER_DROP_CYCLE - 1) * cycles
+                + self.dropped_frames * dropped_minutes)
+
+
+    def to_components(self, total_frames: int) -> tuple:
+        """Convert a total number of frames to hours, minutes, seconds and frames"""
+
+        hours, remaining_frames = divmod(self.to_label_frames(total_frames), self.frames_per_hour)
+        minutes, remaining_frames = divmod(remaining_frames, self.frames_per_minute)
+        seconds, frames = divmod(remaining_frames, self.timebase)
+
+        return hours, minutes, seconds, frames
+
+
+    def to_milliseconds(self, total_frames: int) -> int:
+        """Convert a total number of frames to real elapsed milliseconds"""
+
+        return ((total_frames * MILLISECONDS_PER_SECOND * self.denominator + self.numerator // 2)
+                // self.numerator)
+
+
+    def from_milliseconds(self, milliseconds: int) -> int:
+        """Convert real elapsed milliseconds to the nearest total number of frames"""
+
+        divisor = MILLISECONDS_PER_SECOND * self.denominator
+
+        return (milliseconds * self.numerator + divisor // 2) // divisor
+
+
+    def validate_label(self, minutes: int, seconds: int, frames: int) -> None:
+        """Validate that a label is not one of the frame numbers skipped by
+           drop frame timecode"""
+
+        assert (seconds != 0 or frames >= self.dropped_frames
+                or minutes % MINUTES_PER_DROP_CYCLE == 0), \
+            INVALID_DROP_FRAME_LABEL.format(0, self.dropped_frames - 1)
+
+
+class TimecodeCache:
+    """Bounded least recently used cache for parsed and formatted timecodes
+
+    Timecodes never change after they are created, so the same object can be
+    handed out every time the same string is parsed at the same rate.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE):
+        """Constructor for the TimecodeCache class
+
+        Keyword arguments:
+        max_size: int -- the maximum number of entries to keep (default 4096)
+        """
+
+        assert 0 < max_size, INVALID_CACHE_SIZE
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+
+
+    def get(self, key):
+        """Get a cached value, or None if the key is not cached"""
+
+        value = self.__entries.get(key)
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.__entries.move_to_end(key)
+
+        return value
+
+
+    def put(self, key, value) -> None:
+        """Add a value to the cache, evicting the least recently used entry
+           when the cache is full"""
+
+        self.__entries[key] = value
+
+        if len(self.__entries) > self.max_size:
+            self.__entries.popitem(last=False)
+
+
+    def clear(self) -> None:
+        """Remove every entry and reset the hit and miss counters"""
+
+        self.__entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+    def __len__(self):
+        return len(self.__entries)
+
+
+PARSE_CACHE = TimecodeCache()
+FORMAT_CACHE = TimecodeCache()
+
+cache_enabled = True
+
+def set_cache_enabled(enabled: bool) -> None:
+    """Turn the timecode parse and format caches on or off
+
+    Keyword arguments:
+    enabled: bool -- whether to use the caches
+    """
+
+    global cache_enabled
+    cache_enabled = enabled
+
+    if not enabled:
+        PARSE_CACHE.clear()
+        FORMAT_CACHE.clear()
+
+
+def get_cache_stats() -> dict:
+    """Get the size and hit and miss counters of the timecode caches"""
+
+    stats = lambda cache: {"size": len(cache), "hits": cache.hits, "misses": cache.misses}
+
+    return {"parse": stats(PARSE_CACHE), "format": stats(FORMAT_CACHE)}
+
+# ----------------------------------------------------------------------
 
 class Timecode:
+    __slots__ = ("_total_frames", "_rate")
+
     def __init__(self, hours: int = 0, minutes: int = 0, seconds: int = 0,
                  frames: int = 0, frame_rate: float = DEFAULT_FRAME_RATE,
                  drop_frame: bool = DEFAULT_DROP_FRAME):
@@ -89,54 +375,66 @@ class Timecode:
         """
         
         assert 0 <= hours, INVALID_HOURS
-        assert 0 <= minutes < MINUTES_PER_HOUR, INVALID_HOURS
+        assert 0 <= minutes < MINUTES_PER_HOUR, INVALID_MINUTES
         assert 0 <= seconds < SECONDS_PER_MINUTE, INVALID_SECONDS
-
-        # TODO: fix this assertion
-        # if not drop_frame: assert 0 <= frames < frame_rate, "Frames must be between 0 and the frame rate"
         validate_frame_rate(frame_rate)
         
-        self.hours = hours
-        self.minutes = minutes
-        self.seconds = seconds
-        self.frames = frames
-        self.frame_rate = frame_rate
-        self.drop_frame = drop_frame
+        rate = FrameRate.get(frame_rate, drop_frame)
+        assert 0 <= frames < rate.timebase, INVALID_FRAMES
+        rate.validate_label(minutes, seconds, frames)
+
+        self._total_frames = rate.to_total_frames(hours, minutes, seconds, frames)
+        self._rate = rate
+
+
+    @classmethod
+    def _from_rate(cls, total_frames: int, rate: FrameRate) -> 'Timecode':
+        """Create a Timecode from a total number of frames and a shared
+           FrameRate without re-validating the components"""
+
+        assert 0 <= total_frames, INVALID_TOTAL_FRAMES
+
+        timecode = cls.__new__(cls)
+        timecode._total_frames = total_frames
+        timecode._rate = rate
+
+        return timecode
 
 
     @classmethod
     def from_total_frames(cls, total_frames: int, 
-                          frame_rate: float = DEFAULT_FRAME_RATE,
+                          frame_rate: float = None,
                           drop_frame: bool = DEFAULT_DROP_FRAME):
         """Constructor for the Timecode class based on the total
            number of frames
            
         Keyword arguments:
-        total_frames: int -- the total number of frames
-        frame_rate: float -- the number of frames per second (default 24.0)
+        total_frames: int -- the total number of frames, or a string
+                             formatted as HH:MM:SS:FF or HH:MM:SS;FF
+        frame_rate: float -- the number of frames per second (default 24.0,
+                             or 29.97 for drop frame)
         drop_frame: bool -- whether to use drop frame arithmetic (default False)
         """
 
-        assert type(total_frames) == int, INVALID_TYPE.format("an integer")
-        assert 0 <= total_frames, INVALID_TOTAL_FRAMES
-
-        frames = int(total_frames % frame_rate)
-        remaining_frames = total_frames // frame_rate
+        if isinstance(total_frames, str):
+            assert (FRAMES_PATTERN.match(total_frames) or
+                    DROP_FRAME_PATTERN.match(total_frames)), NO_MATCH
+            return cls.from_string(total_frames, frame_rate)
 
-        seconds = int(remaining_frames % SECONDS_PER_MINUTE)
-        remaining_frames //= SECONDS_PER_MINUTE
+        if not isinstance(total_frames, int):
+            raise TypeError(INVALID_TYPE.format("an integer"))
 
-        minutes = int(remaining_frames % SECONDS_PER_MINUTE)
-        remaining_frames //= MINUTES_PER_HOUR
+        if frame_rate is None:
+            frame_rate = get_default_frame_rate(drop_frame)
 
-        hours = int(remaining_frames % MINUTES_PER_HOUR)
+        validate_frame_rate(frame_rate)
 
-        return cls(hours, minutes, seconds, frames, frame_rate, drop_frame)
+        return cls._from_rate(total_frames, FrameRate.get(frame_rate, drop_frame))
 
 
     @classmethod
     def from_string(cls, timecode: str,
-                    frame_rate: float = DEFAULT_FRAME_RATE):
+                    frame_rate: float = None):
         """Constructor for the Timecode class based on a string
         
         Keyword arguments:
@@ -144,24 +442,125 @@ class Timecode:
                             - HH:MM:SS:FF
                             - HH:MM:SS,mmm
                             - HH:MM:SS;FF
-        frame_rate: float -- the number of frames per second (default 24.0)
+        frame_rate: float -- the number of frames per second (default 24.0,
+                             or 29.97 for HH:MM:SS;FF)
         """
         
+        if not cache_enabled:
+            return cls.__parse_string(timecode, frame_rate)
+
+        key = (timecode, frame_rate, False)
+        parsed = PARSE_CACHE.get(key)
+
+        if parsed is None:
+            parsed = cls.__parse_string(timecode, frame_rate)
+            PARSE_CACHE.put(key, parsed)
+
+        return parsed
+
+
+    @classmethod
+    def __parse_string(cls, timecode: str, frame_rate: float):
+        """Validate and parse a timecode string without using the cache"""
+
         assert type(timecode) == str, INVALID_TYPE.format("a string")
+
+        if not TIMECODE_PATTERN.match(timecode):
+            raise ValueError("Invalid timecode format")
+
+        delimiter = timecode[DELIMITER_INDEX]
+        hours, minutes, seconds, end_value = Timecode.slice_string(timecode)
+
+        if frame_rate is None:
+            frame_rate = get_default_frame_rate(delimiter == DROP_FRAME_DELIMITER)
+
         validate_frame_rate(frame_rate)
 
-        if re.match(FRAMES_REGEX, timecode):
-            hours, minutes, seconds, frames = map(int, timecode.split(STANDARD_TIME_DELIMITER))
-            return cls(hours, minutes, seconds, frames, frame_rate)
+        if delimiter == STANDARD_TIME_DELIMITER:
+            return cls(hours, minutes, seconds, end_value, frame_rate)
         
-        elif re.match(MILLISECONDS_REGEX, timecode):
-            return Timecode.from_milliseconds_format(timecode, frame_rate)
+        elif delimiter == DROP_FRAME_DELIMITER:
+            return cls(hours, minutes, seconds, end_value, frame_rate, True)
         
-        elif re.match(DROP_FRAME_REGEX, timecode):
-            return Timecode.from_drop_frame_format(timecode, frame_rate)
+        return cls.__from_milliseconds(hours, minutes, seconds, end_value, frame_rate)
 
-        else:
-            raise ValueError("Invalid timecode format")
+
+    @classmethod
+    def from_trusted_string(cls, timecode: str,
+                            frame_rate: float = None):
+        """Constructor for the Timecode class based on a string that is
+           already known to be well formed, such as a Pro Tools export.
+           Only drop frame labels are checked, so use from_string for
+           anything else.
+
+        Keyword arguments:
+        timecode: str -- the timecode formatted as on of the following:
+                            - HH:MM:SS:FF
+                            - HH:MM:SS,mmm
+                            - HH:MM:SS;FF
+        frame_rate: float -- the number of frames per second (default 24.0,
+                             or 29.97 for HH:MM:SS;FF)
+        """
+
+        if not cache_enabled:
+            return cls.__parse_trusted_string(timecode, frame_rate)
+
+        key = (timecode, frame_rate, True)
+        parsed = PARSE_CACHE.get(key)
+
+        if parsed is None:
+            parsed = cls.__parse_trusted_string(timecode, frame_rate)
+            PARSE_CACHE.put(key, parsed)
+
+        return parsed
+
+
+    @classmethod
+    def create_section_parser(cls) -> callable:
+        """Create a function that parses the timecodes of one section of a
+           Pro Tools export. The first timecode is checked with from_string,
+           so a section exported as Bars|Beats or Min:Sec is rejected, and the
+           rest are parsed with from_trusted_string.
+        """
+
+        validated = False
+
+        def parse_timecode(timecode: str, frame_rate: float = None) -> 'Timecode':
+            nonlocal validated
+
+            if validated:
+                return cls.from_trusted_string(timecode, frame_rate)
+
+            parsed = cls.from_string(timecode, frame_rate)
+            validated = True
+
+            return parsed
+
+        return parse_timecode
+
+
+    @classmethod
+    def __parse_trusted_string(cls, timecode: str, frame_rate: float):
+        """Parse a trusted timecode string without using the cache"""
+
+        delimiter = timecode[DELIMITER_INDEX]
+        end_value = int(timecode[END_VALUE_INDEX:])
+
+        if frame_rate is None:
+            frame_rate = get_default_frame_rate(delimiter == DROP_FRAME_DELIMITER)
+
+        rate = FrameRate.get(frame_rate, delimiter == DROP_FRAME_DELIMITER)
+
+        minutes, seconds = int(timecode[MINUTES_SLICE]), int(timecode[SECONDS_SLICE])
+
+        if delimiter == STANDARD_MILLISECONDS_DELIMITER or delimiter == ALTERNATE_MILLISECONDS_DELIMITER:
+            end_value = rate.frames_by_millisecond[end_value]
+        elif rate.drop_frame:
+            rate.validate_label(minutes, seconds, end_value)
+
+        total_frames = rate.to_total_frames(int(timecode[HOURS_SLICE]), minutes, seconds, end_value)
+
+        return cls._from_rate(total_frames, rate)
 
 
     @classmethod
@@ -176,30 +575,30 @@ class Timecode:
         """
 
         assert type(timecode) == str, INVALID_TYPE.format("a string")
-        assert re.match(FRAMES_REGEX, timecode), INVALID_FRAME_FORMAT
+        assert FRAMES_PATTERN.match(timecode), INVALID_FRAME_FORMAT
         validate_frame_rate(frame_rate)
 
-        hours, minutes, seconds, frames = Timecode.split_string(timecode)
+        hours, minutes, seconds, frames = Timecode.slice_string(timecode)
 
         return cls(hours, minutes, seconds, frames, frame_rate)
 
 
     @classmethod
     def from_drop_frame_format(cls, timecode: str,
-                               frame_rate: float = DEFAULT_FRAME_RATE):
+                               frame_rate: float = DEFAULT_DROP_FRAME_RATE):
         """Constructor for the Timecode class based on a string
            formatted as HH:MM:SS;FF
         
         Keyword arguments:
         timecode: str -- the timecode formatted as HH:MM:SS;FF
-        frame_rate: float -- the number of frames per second (default 24.0)
+        frame_rate: float -- the number of frames per second (default 29.97)
         """
         
         assert type(timecode) == str, INVALID_TYPE.format("a string")
-        assert re.match(DROP_FRAME_REGEX, timecode), INVALID_DROP_FRAME_FORMAT
+        assert DROP_FRAME_PATTERN.match(timecode), INVALID_DROP_FRAME_FORMAT
         validate_frame_rate(frame_rate)
 
-        hours, minutes, seconds, frames = Timecode.split_string(timecode)
+        hours, minutes, seconds, frames = Timecode.slice_string(timecode)
 
         return cls(hours, minutes, seconds, frames, frame_rate, True)
 
@@ -216,12 +615,29 @@ class Timecode:
         """
         
         assert type(timecode) == str, INVALID_TYPE.format("a string")
-        assert re.match(MILLISECONDS_REGEX, timecode), INVALID_MILLISECONDS_FORMAT
+        assert MILLISECONDS_PATTERN.match(timecode), INVALID_MILLISECONDS_FORMAT
         validate_frame_rate(frame_rate)
 
-        hours, minutes, seconds, milliseconds = Timecode.split_string(timecode)
+        hours, minutes, seconds, milliseconds = Timecode.slice_string(timecode)
+
+        return cls.__from_milliseconds(hours, minutes, seconds, milliseconds, frame_rate)
+
 
-        return cls(hours, minutes, seconds, milliseconds, frame_rate)
+    @classmethod
+    def __from_milliseconds(cls, hours: int, minutes: int, seconds: int,
+                            milliseconds: int, frame_rate: float):
+        """Create a Timecode from split HH:MM:SS,mmm components"""
+
+        assert 0 <= minutes < MINUTES_PER_HOUR, INVALID_MINUTES
+        assert 0 <= seconds < SECONDS_PER_MINUTE, INVALID_SECONDS
+
+        assert 0 <= milliseconds < MILLISECONDS_PER_SECOND, INVALID_MILLISECONDS
+
+        rate = FrameRate.get(frame_rate, DEFAULT_DROP_FRAME)
+        frames = rate.frames_by_millisecond[milliseconds]
+        total_frames = rate.to_total_frames(hours, minutes, seconds, frames)
+
+        return cls._from_rate(total_frames, rate)
 
 
     @staticmethod
@@ -233,26 +649,22 @@ class Timecode:
         """
 
         assert type(timecode) == str, INVALID_TYPE.format("a string")
-        assert (re.match(FRAMES_REGEX, timecode) or
-                re.match(MILLISECONDS_REGEX, timecode) or
-                re.match(DROP_FRAME_REGEX, timecode)), NO_MATCH
+        assert TIMECODE_PATTERN.match(timecode), NO_MATCH
 
-        delimiter = timecode[DELIMITER_INDEX]
-        split_timecode = timecode.split(STANDARD_TIME_DELIMITER)
+        return Timecode.slice_string(timecode)
 
-        hours = int(split_timecode[TimecodeOrder.HOURS.value])
-        minutes = int(split_timecode[TimecodeOrder.MINUTES.value])
 
-        if delimiter == STANDARD_TIME_DELIMITER:
-            seconds = int(split_timecode[TimecodeOrder.SECONDS.value])
-            end_value = int(split_timecode[TimecodeOrder.FRAMES.value])
-        else:
-            remaining_time = split_timecode[TimecodeOrder.SECONDS.value]
-            remaining_values = remaining_time.split(delimiter)
-            seconds = int(remaining_values[0])
-            end_value = int(remaining_values[1])
+    @staticmethod
+    def slice_string(timecode: str) -> tuple:
+        """Slice an already validated fixed-width timecode string into its
+           components
         
-        return hours, minutes, seconds, end_value
+        Keyword arguments:
+        timecode: str -- the timecode formatted as HH:MM:SS:FF, HH:MM:SS;FF or HH:MM:SS,mmm
+        """
+
+        return (int(timecode[HOURS_SLICE]), int(timecode[MINUTES_SLICE]),
+                int(timecode[SECONDS_SLICE]), int(timecode[END_VALUE_INDEX:]))
 
 
     @staticmethod
@@ -270,10 +682,7 @@ class Timecode:
             milliseconds < MILLISECONDS_PER_SECOND, INVALID_MILLISECONDS
         validate_frame_rate(frame_rate)
 
-        seconds_as_decimal = milliseconds / MILLISECONDS_PER_SECOND
-        frames = int(seconds_as_decimal * frame_rate + ROUNDING_RATE)
-
-        return frames
+        return FrameRate.get(frame_rate).frames_by_millisecond[milliseconds]
 
 
     @staticmethod
@@ -289,36 +698,100 @@ class Timecode:
         assert frames >= 0, INVALID_TOTAL_FRAMES
         validate_frame_rate(frame_rate)
 
+        table = FrameRate.get(frame_rate).milliseconds_by_frame
+        if frames < len(table):
+            return table[frames]
+
         seconds_as_decimal = frames / frame_rate
         milliseconds = int(seconds_as_decimal * MILLISECONDS_PER_SECOND + ROUNDING_RATE)
 
         return milliseconds
 
 
+    # PROPERTIES
+
+    @property
+    def hours(self) -> int:
+        return self._rate.to_label_frames(self._total_frames) // self._rate.frames_per_hour
+
+    @property
+    def minutes(self) -> int:
+        label_frames = self._rate.to_label_frames(self._total_frames)
+        return label_frames % self._rate.frames_per_hour // self._rate.frames_per_minute
+
+    @property
+    def seconds(self) -> int:
+        label_frames = self._rate.to_label_frames(self._total_frames)
+        return label_frames % self._rate.frames_per_minute // self._rate.timebase
+
+    @property
+    def frames(self) -> int:
+        return self._rate.to_label_frames(self._total_frames) % self._rate.timebase
+
+    @property
+    def frame_rate(self) -> float:
+        return self._rate.frame_rate
+
+    @property
+    def drop_frame(self) -> bool:
+        return self._rate.drop_frame
+
+
     def get_total_frames(self) -> int:
         """Convert the timecode to the total number of frames"""
 
-        total_minutes = int(self.hours * MINUTES_PER_HOUR + self.minutes)
-        total_seconds = int(total_minutes * SECONDS_PER_MINUTE + self.seconds)
-        total_frames = int(total_seconds * self.frame_rate + self.frames)
+        return self._total_frames
+
+
+    def get_total_milliseconds(self) -> int:
+        """Convert the timecode to the real elapsed number of milliseconds"""
 
-        return total_frames
+        return self._rate.to_milliseconds(self._total_frames)
 
 
     def convert_to_frames_format(self) -> str:
         """Convert the timecode to a string formatted as HH:MM:SS:FF"""
 
-        timecode_format = FRAMES_FORMAT if not self.drop_frame else DROP_FRAME_FORMAT
+        if not cache_enabled:
+            return self.__format_frames()
 
-        return timecode_format.format(self.hours, self.minutes, self.seconds, self.frames)
+        key = (FRAMES_FORMAT, self._total_frames, self._rate)
+        formatted = FORMAT_CACHE.get(key)
+
+        if formatted is None:
+            formatted = self.__format_frames()
+            FORMAT_CACHE.put(key, formatted)
+
+        return formatted
+
+
+    def __format_frames(self) -> str:
+        timecode_format = FRAMES_FORMAT if not self._rate.drop_frame else DROP_FRAME_FORMAT
+
+        return timecode_format.format(*self._rate.to_components(self._total_frames))
 
 
     def convert_to_milliseconds_format(self) -> str:
         """Convert the timecode to a string formatted as HH:MM:SS,mmm"""
 
-        milliseconds = Timecode.frames_to_milliseconds(self.frames, self.frame_rate)
+        if not cache_enabled:
+            return self.__format_milliseconds()
+
+        key = (MILLISECONDS_FORMAT, self._total_frames, self._rate)
+        formatted = FORMAT_CACHE.get(key)
+
+        if formatted is None:
+            formatted = self.__format_milliseconds()
+            FORMAT_CACHE.put(key, formatted)
 
-        return MILLISECONDS_FORMAT.format(self.hours, self.minutes, self.seconds, milliseconds)
+        return formatted
+
+
+    def __format_milliseconds(self) -> str:
+        hours, minutes, seconds, frames = self._rate.to_components(self._total_frames)
+
+        return MILLISECONDS_FORMAT.format(hours, minutes, seconds,
+                                          self._rate.milliseconds_by_frame[frames])
 
 
     def __str__(self):
@@ -326,81 +799,95 @@ class Timecode:
 
 
     # COMPARISON OPERATORS
+    # Timecodes are equal when they share a frame count and frame rate, and
+    # are ordered by frame count alone.
 
     def __eq__(self, other):
         if isinstance(other, Timecode):
-            return (self.hours == other.hours and
-                    self.minutes == other.minutes and
-                    self.seconds == other.seconds and
-                    self.frames == other.frames and
-                    self.frame_rate == other.frame_rate)
+            return (self._total_frames == other._total_frames and
+                    self._rate.frame_rate == other._rate.frame_rate and
+                    self._rate.drop_frame == other._rate.drop_frame)
         
-        raise TypeError("Invalid arguments for Timecode.__eq__")
+        return NotImplemented
 
     def __ne__(self, other):
-        return not self.__eq__(other)
+        if isinstance(other, Timecode):
+            return (self._total_frames != other._total_frames or
+                    self._rate.frame_rate != other._rate.frame_rate or
+                    self._rate.drop_frame != other._rate.drop_frame)
+
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self._total_frames, self._rate.frame_rate, self._rate.drop_frame))
 
     def __lt__(self, other):
         if isinstance(other, Timecode):
-            return self.get_total_frames() < other.get_total_frames()
+            return self._total_frames < other._total_frames
         
-        raise TypeError("Invalid arguments for Timecode.__lt__")
+        return NotImplemented
 
     def __le__(self, other):    
-        return self.__lt__(other) or self.__eq__(other)
+        if isinstance(other, Timecode):
+            return self._total_frames <= other._total_frames
+
+        return NotImplemented
 
     def __gt__(self, other):    
-        return not self.__le__(other)
+        if isinstance(other, Timecode):
+            return self._total_frames > other._total_frames
+
+        return NotImplemented
 
     def __ge__(self, other):    
-        return not self.__lt__(other)
+        if isinstance(other, Timecode):
+            return self._total_frames >= other._total_frames
+
+        return NotImplemented
+
+    def sort_key(self) -> int:
+        """Get the key Timecodes are ordered by, for use with sorted and bisect"""
+
+        return self._total_frames
 
     # ARITHMETIC OPERATORS
 
     def __add__(self, other):
         if isinstance(other, Timecode):
-            total_frames = self.get_total_frames() + other.get_total_frames()
-            return Timecode.from_total_frames(total_frames, self.frame_rate)
+            return Timecode._from_rate(self._total_frames + other._total_frames, self._rate)
         elif isinstance(other, int):
-            total_frames = self.get_total_frames() + other
-            return Timecode.from_total_frames(total_frames, self.frame_rate)
+            return Timecode._from_rate(self._total_frames + other, self._rate)
         
         raise TypeError("Invalid arguments for Timecode.__add__")
 
     def __sub__(self, other):
         if isinstance(other, Timecode):
-            total_frames = self.get_total_frames() - other.get_total_frames()
-            return Timecode.from_total_frames(total_frames, self.frame_rate)
+            return Timecode._from_rate(self._total_frames - other._total_frames, self._rate)
         elif isinstance(other, int):
-            total_frames = self.get_total_frames() - other
-            return Timecode.from_total_frames(total_frames, self.frame_rate)
+            return Timecode._from_rate(self._total_frames - other, self._rate)
         
         raise TypeError("Invalid arguments for Timecode.__sub__")
 
     def __mul__(self, other):
         if isinstance(other, int):
-            total_frames = self.get_total_frames() * other
-            return Timecode.from_total_frames(total_frames, self.frame_rate)
+            return Timecode._from_rate(self._total_frames * other, self._rate)
         
         raise TypeError("Invalid arguments for Timecode.__mul__")
 
     def __truediv__(self, other):
         if isinstance(other, int):
-            total_frames = int(self.get_total_frames() / other)
-            return Timecode.from_total_frames(total_frames, self.frame_rate)
+            return Timecode._from_rate(int(self._total_frames / other), self._rate)
         
         raise TypeError("Invalid arguments for Timecode.__truediv__")
 
     def __floordiv__(self, other):
         if isinstance(other, int):
-            total_frames = self.get_total_frames() // other
-            return Timecode.from_total_frames(total_frames, self.frame_rate)
+            return Timecode._from_rate(self._total_frames // other, self._rate)
         
         raise TypeError("Invalid arguments for Timecode.__floordiv__")
 
     def __mod__(self, other):
         if isinstance(other, int):
-            total_frames = self.get_total_frames() % other
-            return Timecode.from_total_frames(total_frames, self.frame_rate)
+            return Timecode._from_rate(self._total_frames % other, self._rate)
         
         raise TypeError("Invalid arguments for Timecode.__mod__")
\ No newline at end of file
@@ -0,0 +1,343 @@
+import numpy as np
+
+from ProTools.Timecode import (Timecode, FrameRate, OffsetType, validate_frame_rate,
+                               get_default_frame_rate, DEFAULT_FRAME_RATE, DEFAULT_DROP_FRAME,
+                               DELIMITER_INDEX, MINUTES_PER_DROP_CYCLE, INVALID_DROP_FRAME_LABEL,
+                               STANDARD_TIME_DELIMITER, DROP_FRAME_DELIMITER,
+                               STANDARD_MILLISECONDS_DELIMITER, ALTERNATE_MILLISECONDS_DELIMITER)
+
+# Widths
+STRING_WIDTH = 13 # One longer than the widest format so overlong strings are caught
+DIGIT_OFFSET = ord("0")
+PADDING = 0
+
+# Digit Positions
+HOURS_DIGITS = (0, 1)
+MINUTES_DIGITS = (3, 4)
+SECONDS_DIGITS = (6, 7)
+FRAMES_DIGITS = (9, 10)
+MILLISECONDS_DIGITS = (9, 10, 11)
+SEPARATOR_INDICES = (2, 5)
+FRAMES_END_INDEX = 11
+MILLISECONDS_END_INDEX = 12
+
+# Error Messages
+INVALID_FORMAT = "Timecodes must be formatted as HH:MM:SS:FF, HH:MM:SS;FF or HH:MM:SS,mmm"
+INVALID_TOTAL_FRAMES = "Total frames must be greater than or equal to 0"
+INVALID_FRAME_RATE_MATCH = "Timecodes must share the same frame rate"
+INVALID_DELIMITER_MATCH = "Timecodes must all use ; for drop frame or : for non drop frame"
+INVALID_OFFSET_TYPE = "Offset type must be ADVANCE, DELAY or NONE"
+INVALID_SHAPE = "Timecode arrays must be one dimensional"
+
+# ----------------------------------------------------------------------
+
+class TimecodeArray:
+    """A column of timecodes stored as one int64 array of total frames
+
+    Every timecode in the column shares a single frame rate, so parsing,
+    offsetting, comparing and formatting run as whole-array operations
+    instead of one Timecode object at a time.
+    """
+
+    __slots__ = ("frames", "_rate")
+
+    def __init__(self, frames, frame_rate: float = DEFAULT_FRAME_RATE,
+                 drop_frame: bool = DEFAULT_DROP_FRAME):
+        """Constructor for the TimecodeArray class
+
+        Keyword arguments:
+        frames: array-like -- the total number of frames of each timecode
+        frame_rate: float -- the number of frames per second (default 24.0)
+        drop_frame: bool -- whether to use drop frame arithmetic (default False)
+        """
+
+        validate_frame_rate(frame_rate)
+
+        frames = np.asarray(frames, dtype=np.int64)
+        assert frames.ndim == 1, INVALID_SHAPE
+        assert not np.any(frames < 0), INVALID_TOTAL_FRAMES
+
+        self.frames = frames
+        self._rate = FrameRate.get(frame_rate, drop_frame)
+
+
+    @classmethod
+    def _from_rate(cls, frames: np.ndarray, rate: FrameRate) -> 'TimecodeArray':
+        """Create a TimecodeArray from a frame array and a shared FrameRate"""
+
+        assert not np.any(frames < 0), INVALID_TOTAL_FRAMES
+
+        array = cls.__new__(cls)
+        array.frames = frames
+        array._rate = rate
+
+        return array
+
+
+    @classmethod
+    def from_timecodes(cls, timecodes: list[Timecode]) -> 'TimecodeArray':
+        """Constructor for the TimecodeArray class based on a list of Timecodes
+
+        Keyword arguments:
+        timecodes: list[Timecode] -- the timecodes, all at the same frame rate
+        """
+
+        if len(timecodes) == 0:
+            return cls([])
+
+        rate = timecodes[0]._rate
+        assert all(timecode._rate is rate for timecode in timecodes), INVALID_FRAME_RATE_MATCH
+
+        frames = np.fromiter((timecode.get_total_frames() for timecode in timecodes),
+                             dtype=np.int64, count=len(timecodes))
+
+        return cls._from_rate(frames, rate)
+
+
+    @classmethod
+    def from_strings(cls, timecodes: list[str], frame_rate: float = None,
+                     drop_frame: bool = None) -> 'TimecodeArray':
+        """Constructor for the TimecodeArray class based on a list of strings
+
+        Keyword arguments:
+        timecodes: list[str] -- the timecodes formatted as one of the following:
+                                    - HH:MM:SS:FF
+                                    - HH:MM:SS,mmm
+                                    - HH:MM:SS;FF
+        frame_rate: float -- the number of frames per second (default None, which
+                             uses the default rate for the timecode format)
+        drop_frame: bool -- whether to use drop frame arithmetic (default None,
+                            which uses drop frame if the timecodes use ;)
+        """
+
+        if len(timecodes) == 0:
+            drop_frame = bool(drop_frame)
+            frame_rate = frame_rate if frame_rate is not None else get_default_frame_rate(drop_frame)
+            validate_frame_rate(frame_rate)
+
+            return cls._from_rate(np.zeros(0, dtype=np.int64), FrameRate.get(frame_rate, drop_frame))
+
+        characters = np.array(timecodes, dtype=f"S{STRING_WIDTH}")
+        characters = characters.view(np.uint8).reshape(len(timecodes), STRING_WIDTH)
+        digits = characters.astype(np.int64) - DIGIT_OFFSET
+
+        delimiters = characters[:, DELIMITER_INDEX]
+        is_standard = delimiters == ord(STANDARD_TIME_DELIMITER)
+        is_drop_frame = delimiters == ord(DROP_FRAME_DELIMITER)
+        is_frames = is_standard | is_drop_frame
+        is_milliseconds = ((delimiters == ord(STANDARD_MILLISECONDS_DELIMITER)) |
+                           (delimiters == ord(ALTERNATE_MILLISECONDS_DELIMITER)))
+
+        cls.validate_characters(characters, digits, is_frames, is_milliseconds)
+
+        if drop_frame is None:
+            drop_frame = bool(np.any(is_drop_frame))
+
+        assert not np.any(is_standard if drop_frame else is_drop_frame), INVALID_DELIMITER_MATCH
+
+        if frame_rate is None:
+            frame_rate = get_default_frame_rate(drop_frame)
+
+        validate_frame_rate(frame_rate)
+        rate = FrameRate.get(frame_rate, drop_frame)
+
+        read = lambda positions: sum(digits[:, position] * 10 ** (len(positions) - i - 1)
+                                     for i, position in enumerate(positions))
+
+        hours = read(HOURS_DIGITS)
+        minutes = read(MINUTES_DIGITS)
+        seconds = read(SECONDS_DIGITS)
+
+        milliseconds = np.where(is_milliseconds, read(MILLISECONDS_DIGITS), 0)
+        millisecond_frames = np.asarray(rate.frames_by_millisecond, dtype=np.int64)[milliseconds]
+        frames = np.where(is_frames, read(FRAMES_DIGITS), millisecond_frames)
+
+        if rate.drop_frame:
+            assert not np.any(is_frames & (seconds == 0) & (frames < rate.dropped_frames)
+                              & (minutes % MINUTES_PER_DROP_CYCLE != 0)), \
+                INVALID_DROP_FRAME_LABEL.format(0, rate.dropped_frames - 1)
+
+        total_frames = rate.to_total_frames(hours, minutes, seconds, frames)
+
+        return cls._from_rate(total_frames, rate)
+
+
+    @staticmethod
+    def validate_characters(characters: np.ndarray, digits: np.ndarray,
+                            is_frames: np.ndarray, is_milliseconds: np.ndarray) -> None:
+        """Validate a block of fixed-width timecode characters
+
+        Keyword arguments:
+        characters: np.ndarray -- the raw characters, one row per timecode
+        digits: np.ndarray -- the characters converted to digit values
+        is_frames: np.ndarray -- whether each row uses a frames delimiter
+        is_milliseconds: np.ndarray -- whether each row uses a milliseconds delimiter
+        """
+
+        is_digit = lambda positions: np.all((digits[:, positions] >= 0) &
+                                            (digits[:, positions] <= 9), axis=1)
+        is_separator = np.all(characters[:, list(SEPARATOR_INDICES)] == ord(STANDARD_TIME_DELIMITER), axis=1)
+
+        valid = is_separator & is_digit(list(HOURS_DIGITS + MINUTES_DIGITS + SECONDS_DIGITS))
+
+        valid_frames = (is_frames & is_digit(list(FRAMES_DIGITS))
+                        & (characters[:, FRAMES_END_INDEX] == PADDING))
+        valid_milliseconds = (is_milliseconds & is_digit(list(MILLISECONDS_DIGITS))
+                              & (characters[:, MILLISECONDS_END_INDEX] == PADDING))
+
+        assert np.all(valid & (valid_frames | valid_milliseconds)), INVALID_FORMAT
+
+
+    # PROPERTIES
+
+    @property
+    def frame_rate(self) -> float:
+        return self._rate.frame_rate
+
+    @property
+    def drop_frame(self) -> bool:
+        return self._rate.drop_frame
+
+
+    def get_total_frames(self) -> np.ndarray:
+        """Get the total number of frames of every timecode"""
+
+        return self.frames
+
+
+    def get_components(self) -> tuple:
+        """Get the hours, minutes, seconds and frames of every timecode"""
+
+        return self._rate.to_components(self.frames)
+
+
+    def offset(self, offset: Timecode, offset_type: OffsetType) -> 'TimecodeArray':
+        """Advance or delay every timecode by the same offset
+
+        Keyword arguments:
+        offset: Timecode -- the amount to offset by, or None for no offset
+        offset_type: OffsetType -- whether to advance or delay the timecodes
+        """
+
+        if offset is None or offset_type == OffsetType.NONE:
+            return self
+        elif offset_type == OffsetType.ADVANCE:
+            return TimecodeArray._from_rate(self.frames - offset.get_total_frames(), self._rate)
+        elif offset_type == OffsetType.DELAY:
+            return TimecodeArray._from_rate(self.frames + offset.get_total_frames(), self._rate)
+
+        raise ValueError(INVALID_OFFSET_TYPE)
+
+
+    def argsort(self) -> np.ndarray:
+        """Get the indices that would sort the timecodes"""
+
+        return np.argsort(self.frames, kind="stable")
+
+
+    def sort(self) -> 'TimecodeArray':
+        """Get a sorted copy of the timecodes"""
+
+        return TimecodeArray._from_rate(np.sort(self.frames, kind="stable"), self._rate)
+
+
+    def convert_to_frames_format(self) -> np.ndarray:
+        """Convert every timecode to a string formatted as HH:MM:SS:FF"""
+
+        hours, minutes, seconds, frames = self.get_components()
+        delimiter = DROP_FRAME_DELIMITER if self._rate.drop_frame else STANDARD_TIME_DELIMITER
+
+        return self.join_components(hours, minutes, seconds,
+                                    np.char.mod(delimiter + "%02d", frames))
+
+
+    def convert_to_milliseconds_format(self) -> np.ndarray:
+        """Convert every timecode to a string formatted as HH:MM:SS,mmm"""
+
+        hours, minutes, seconds, frames = self.get_components()
+        milliseconds = np.asarray(self._rate.milliseconds_by_frame, dtype=np.int64)[frames]
+
+        return self.join_components(hours, minutes, seconds,
+                                    np.char.mod(STANDARD_MILLISECONDS_DELIMITER + "%03d",
+                                                milliseconds))
+
+
+    @staticmethod
+    def join_components(hours: np.ndarray, minutes: np.ndarray, seconds: np.ndarray,
+                        end_values: np.ndarray) -> np.ndarray:
+        """Join formatted timecode components into HH:MM:SS strings followed
+           by the already formatted end values"""
+
+        joined = np.char.mod("%02d", hours)
+        joined = np.char.add(joined, np.char.mod(STANDARD_TIME_DELIMITER + "%02d", minutes))
+        joined = np.char.add(joined, np.char.mod(STANDARD_TIME_DELIMITER + "%02d", seconds))
+
+        return np.char.add(joined, end_values)
+
+
+    def to_timecodes(self) -> list[Timecode]:
+        """Convert the array back into a list of Timecode objects"""
+
+        return [Timecode._from_rate(frames, self._rate) for frames in self.frames.tolist()]
+
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __iter__(self):
+        rate = self._rate
+        for frames in self.frames.tolist():
+            yield Timecode._from_rate(frames, rate)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Timecode._from_rate(int(self.frames[index]), self._rate)
+
+        return TimecodeArray._from_rate(self.frames[index], self._rate)
+
+
+    # COMPARISON OPERATORS
+
+    def __other_frames(self, other):
+        if isinstance(other, TimecodeArray):
+            return other.frames
+        elif isinstance(other, Timecode):
+            return other.get_total_frames()
+
+        raise TypeError("Invalid arguments for TimecodeArray comparison")
+
+    def __eq__(self, other):
+        return self.frames == self.__other_frames(other)
+
+    def __ne__(self, other):
+        return self.frames != self.__other_frames(other)
+
+    def __lt__(self, other):
+        return self.frames < self.__other_frames(other)
+
+    def __le__(self, other):
+        return self.frames <= self.__other_frames(other)
+
+    def __gt__(self, other):
+        return self.frames > self.__other_frames(other)
+
+    def __ge__(self, other):
+        return self.frames >= self.__other_frames(other)
+
+    __hash__ = None
+
+    # ARITHMETIC OPERATORS
+
+    def __add__(self, other):
+        if isinstance(other, (TimecodeArray, Timecode, int)):
+            other_frames = other if isinstance(other, int) else self.__other_frames(other)
+            return TimecodeArray._from_rate(self.frames + other_frames, self._rate)
+
+        raise TypeError("Invalid arguments for TimecodeArray.__add__")
+
+    def __sub__(self, other):
+        if isinstance(other, (TimecodeArray, Timecode, int)):
+            other_frames = other if isinstance(other, int) else self.__other_frames(other)
+            return TimecodeArray._from_rate(self.frames - other_frames, self._rate)
+
+        raise TypeError("Invalid arguments for TimecodeArray.__sub__")
\ No newline at end of file
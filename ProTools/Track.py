@@ -1,8 +1,14 @@
 from enum import Enum
+from typing import Iterable
 
-from ProTools.EDL import EDL
+from ProTools.EDL import EDL, ColumnHeaders as EDLHeaders
 import ProTools.lib as lib
 
+# Info Keys
+TRACK_NAME = "TRACK NAME:"
+COMMENTS = "COMMENTS:"
+USER_DELAY = "USER DELAY:"
+
 class States(Enum):
     MUTED = "Muted"
     UNMUTED = "Unmuted"
@@ -17,7 +23,7 @@ class Track:
         comments: str -- the comments of the Pro Tools Track
         user_delay: str -- the user delay of the Pro Tools Track
         state: States -- the state of the Pro Tools Track
-        channels: list[EDL] -- the list of EDLs in the Pro Tools Track
+        channels: list -- the EDLs of each channel, as lists or EDLTables
         """
 
         self.name = name
@@ -27,42 +33,74 @@ class Track:
         self.channels = channels
 
     @classmethod
-    def from_rows(cls, column_headers: list, rows: list[str], frame_rate: float = 24.0):
+    def from_rows(cls, column_headers: dict, rows: list[str], frame_rate: float = 24.0):
         """Constructor for the Track class from a list of rows
         
         Keyword arguments:
+        column_headers: dict -- the EDL column headers of the track
         rows: list[str] -- the rows of the Pro Tools Track
         frame_rate: float -- the frame rate of the Pro Tools session (default: 24.0)
         """
 
-        NAME_INDEX = 0
-        COMMENTS_INDEX = 1
-        USER_DELAY_INDEX = 2
-        STATE_INDEX = 3
-        # PLUGINS_INDEX = 4
-        COLUMN_HEADERS_INDEX = 4
+        info = []
+        rows = iter(rows)
+
+        for row in rows:
+            if lib.split_row(row)[0] == EDLHeaders.CHANNEL.value:
+                break
+            info.append(row)
+
+        edl_rows = (row for row in rows if row.strip() != "") # Channels may be separated by blank rows
+
+        return cls.from_stream(info, column_headers, edl_rows, frame_rate)
+
 
-        name = rows[NAME_INDEX]
-        comments = rows[COMMENTS_INDEX]
-        user_delay = rows[USER_DELAY_INDEX]
+    @classmethod
+    def from_stream(cls, info: list[str], column_headers: dict, rows: Iterable[str],
+                    frame_rate: float = 24.0, columnar: bool = False):
+        """Constructor for the Track class from its info rows and a stream of EDL rows
+
+        Consecutive EDLs with the same channel number are grouped into one
+        channel, so the rows are only read once.
+
+        Keyword arguments:
+        info: list[str] -- the TRACK NAME, COMMENTS, USER DELAY, STATE and PLUG-INS rows
+        column_headers: dict -- the EDL column headers of the track
+        rows: Iterable[str] -- the EDL rows of the track
+        frame_rate: float -- the frame rate of the Pro Tools session (default: 24.0)
+        columnar: bool -- whether to store each channel as an EDLTable instead of a
+                          list of EDLs (default: False)
+        """
+
+        values = {}
+        for row in info:
+            row_values = lib.split_row(row)
+            values[row_values[0]] = row_values[1] if len(row_values) > 1 else ""
+
+        name = values.get(TRACK_NAME, "")
+        comments = values.get(COMMENTS, "")
+        user_delay = values.get(USER_DELAY, "")
         state = None
         plugins = None
 
-        # TODO: Check headers
+        if column_headers is None:
+            return cls(name, comments, user_delay, state, plugins, [])
+
+        if columnar:
+            from ProTools.EDLTable import EDLTable # Only columnar tracks need numpy
+
+            channels = EDLTable.from_rows(column_headers, rows, frame_rate).split_channels()
+            return cls(name, comments, user_delay, state, plugins, channels)
 
         channels: list[list[EDL]] = []
-        current_channel: list[EDL] = []
-
-        for line_index in range(COLUMN_HEADERS_INDEX+1, len(rows)):
-            row = rows[line_index]
-            if row == "":
-                channels.append(current_channel)
-                current_channel = []
-                line_index += 1
-                continue
-            else:
-                current_channel.append(EDL.from_row(column_headers, row))
-        
-        channels.append(current_channel)
 
-        return cls(name, comments, user_delay, state, plugins, channels)
\ No newline at end of file
+        parse_row = EDL.create_row_parser(column_headers, frame_rate)
+
+        for row in rows:
+            edl = parse_row(row)
+
+            if len(channels) == 0 or channels[-1][-1].channel != edl.channel:
+                channels.append([])
+            channels[-1].append(edl)
+
+        return cls(name, comments, user_delay, state, plugins, channels)
@@ -1,7 +1,11 @@
-import re
 from enum import Enum
+from operator import itemgetter
 
-ROW_DELIMITER = r"\t"
+ROW_DELIMITER = "\t"
+
+# Error Messages
+INVALID_COLUMN = "Column {0} does not exist"
+MISSING_COLUMN = "Column {0} is required"
 
 def split_row(row: str) -> list[str]:
     """Split a row of text into a list of values
@@ -10,7 +14,7 @@ def split_row(row: str) -> list[str]:
     row: str -- the row of text to split
     """
 
-    split_row = re.split(ROW_DELIMITER, row)
+    split_row = row.split(ROW_DELIMITER)
     row_values = [value.strip() for value in split_row] # Remove any leading or trailing whitespace
 
     return row_values
@@ -31,4 +35,26 @@ def parse_column_headers(row: str, Headers: Enum) -> dict:
         header = Headers(value)
         column_headers[header] = i
 
-    return column_headers
\ No newline at end of file
+    return column_headers
+
+def compile_row_splitter(column_headers: dict, Headers: Enum, *headers: Enum) -> callable:
+    """Check the column headers of a section once and create a function
+       that returns the stripped values of the given columns from a row
+
+    Keyword arguments:
+    column_headers: dict -- the index of each column header in the section
+    Headers: Enum -- the column headers the section may contain
+    headers: Enum -- the columns to return, in order
+    """
+
+    for header in column_headers.keys():
+        assert header in Headers, INVALID_COLUMN.format(header)
+    for header in headers:
+        assert header in column_headers, MISSING_COLUMN.format(header)
+
+    get_values = itemgetter(*[column_headers[header] for header in headers])
+
+    if len(headers) == 1:
+        return lambda row: [get_values(row.split(ROW_DELIMITER)).strip()]
+
+    return lambda row: [value.strip() for value in get_values(row.split(ROW_DELIMITER))]
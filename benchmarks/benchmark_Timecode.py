@@ -0,0 +1,235 @@
+"""
+Timecode micro-benchmarks
+
+Measures the Timecode hot paths at 24, 25 and 29.97 drop frame and compares
+the throughput against a stored baseline.
+
+The gate makes two checks. The geometric mean of every throughput is
+compared with the baseline's, with a wider tolerance, which catches a
+slowdown shared by every case such as a slower FrameRate.get. Each
+throughput is also divided by the geometric mean of its own run and
+compared with the same ratio in the baseline, which catches a single case
+falling behind the others even on a noisy machine.
+
+Run from the repository root:
+    python -m benchmarks.benchmark_Timecode                                # compare with the baseline
+    python -m benchmarks.benchmark_Timecode --update-baseline --repeat 21  # store a new baseline
+    python -m benchmarks.benchmark_Timecode --output bench_output.txt
+
+Exits with status 1 when either check fails. The overall check depends on
+the machine the baseline was taken on.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import timeit
+
+import ProTools.Timecode as timecode_module
+from ProTools.Timecode import Timecode
+
+# Defaults
+DEFAULT_TOLERANCE = 0.30
+DEFAULT_OVERALL_TOLERANCE = 0.50 # Wider, since it also absorbs changes in machine speed
+DEFAULT_REPEAT = 7
+DEFAULT_NUMBER = 20000
+MIN_RUN_TIME = 0.05 # Seconds; fast cases are called more often so timer noise stays small
+BASELINE_FILENAME = os.path.join(os.path.dirname(__file__), "timecode_baseline.json")
+
+# Rates
+RATES = {
+    "24": (24.0, False),
+    "25": (25.0, False),
+    "29.97DF": (29.97, True),
+}
+
+# Error Messages
+REGRESSION = "{name}: {percent:.0%} slower relative to the other benchmarks than in the baseline"
+OVERALL_REGRESSION = ("Overall: geometric mean of {current:,.0f} ops/s is {percent:.0%} slower "
+                      "than the baseline {baseline:,.0f} ops/s")
+MISSING_BASELINE = "No baseline found at {0}. Run with --update-baseline first."
+
+# ----------------------------------------------------------------------
+
+def create_cases(frame_rate: float, drop_frame: bool) -> dict:
+    """Create the benchmark cases for one frame rate
+
+    Keyword arguments:
+    frame_rate: float -- the number of frames per second
+    drop_frame: bool -- whether to use drop frame arithmetic
+    """
+
+    delimiter = ";" if drop_frame else ":"
+    frames_string = f"01:02:03{delimiter}04"
+    milliseconds_string = "01:02:03,167"
+
+    first = Timecode.from_string(frames_string, frame_rate)
+    second = first + 1
+    total_frames = first.get_total_frames()
+
+    return {
+        "from_string_frames": lambda: Timecode.from_string(frames_string, frame_rate),
+        "from_string_milliseconds": lambda: Timecode.from_string(milliseconds_string, frame_rate),
+        "from_trusted_string": lambda: Timecode.from_trusted_string(frames_string, frame_rate),
+        "from_total_frames": lambda: Timecode.from_total_frames(total_frames, frame_rate, drop_frame),
+        "eq": lambda: first == second,
+        "lt": lambda: first < second,
+        "add_int": lambda: first + 12,
+        "add_timecode": lambda: first + second,
+        "sub_int": lambda: first - 12,
+        "sub_timecode": lambda: second - first,
+        "convert_to_milliseconds_format": lambda: first.convert_to_milliseconds_format(),
+        "convert_to_frames_format": lambda: first.convert_to_frames_format(),
+    }
+
+
+def run_benchmarks(repeat: int = DEFAULT_REPEAT, number: int = DEFAULT_NUMBER) -> dict:
+    """Run every benchmark and return the median throughput of each in
+       operations per second
+
+    The parse and format caches are turned off so the underlying code is
+    measured rather than dictionary lookups.
+
+    Keyword arguments:
+    repeat: int -- the number of timing runs per benchmark (default 7)
+    number: int -- the minimum number of calls per timing run (default 20000)
+    """
+
+    cases = {f"{case_name}@{rate_name}": case
+             for rate_name, (frame_rate, drop_frame) in RATES.items()
+             for case_name, case in create_cases(frame_rate, drop_frame).items()}
+    times = {name: [] for name in cases}
+    timecode_module.set_cache_enabled(False)
+
+    try:
+        numbers = {name: max(number, int(number * MIN_RUN_TIME / timeit.timeit(case, number=number)))
+                   for name, case in cases.items()}
+
+        # Every case is timed once per round so a slow spell on the machine
+        # is spread over all of them instead of one group of cases
+        for _ in range(repeat):
+            for name, case in cases.items():
+                times[name].append(timeit.timeit(case, number=numbers[name]))
+    finally:
+        timecode_module.set_cache_enabled(True)
+
+    return {name: numbers[name] / statistics.median(case_times) for name, case_times in times.items()}
+
+
+def get_geometric_mean(results: dict, names: list[str]) -> float:
+    """Get the geometric mean of the throughput of the named benchmarks
+
+    Keyword arguments:
+    results: dict -- the operations per second by benchmark name
+    names: list[str] -- the benchmarks to average
+    """
+
+    return math.exp(sum(math.log(results[name]) for name in names) / len(names))
+
+
+def normalize(results: dict, names: list[str]) -> dict:
+    """Divide the throughput of each benchmark by the geometric mean of the
+       throughput of every named benchmark
+
+    Keyword arguments:
+    results: dict -- the operations per second by benchmark name
+    names: list[str] -- the benchmarks to normalize
+    """
+
+    mean = get_geometric_mean(results, names)
+
+    return {name: results[name] / mean for name in names}
+
+
+def compare_to_baseline(results: dict, baseline: dict, tolerance: float,
+                        overall_tolerance: float = DEFAULT_OVERALL_TOLERANCE) -> list[str]:
+    """Get a message if the benchmarks are slower overall than in the
+       baseline by more than overall_tolerance, and one for every benchmark
+       that is slower, relative to the other benchmarks, by more than tolerance
+
+    Keyword arguments:
+    results: dict -- the current operations per second by benchmark name
+    baseline: dict -- the baseline operations per second by benchmark name
+    tolerance: float -- the allowed slowdown of one case as a fraction of the baseline
+    overall_tolerance: float -- the allowed slowdown of the geometric mean (default 0.50)
+    """
+
+    names = sorted(name for name in results if name in baseline)
+    if len(names) == 0:
+        return []
+
+    regressions = []
+
+    current_mean = get_geometric_mean(results, names)
+    baseline_mean = get_geometric_mean(baseline, names)
+    slowdown = 1 - current_mean / baseline_mean
+    if slowdown > overall_tolerance:
+        regressions.append(OVERALL_REGRESSION.format(current=current_mean, percent=slowdown,
+                                                     baseline=baseline_mean))
+
+    current_ratios = normalize(results, names)
+    baseline_ratios = normalize(baseline, names)
+
+    for name in names:
+        slowdown = 1 - current_ratios[name] / baseline_ratios[name]
+        if slowdown > tolerance:
+            regressions.append(REGRESSION.format(name=name, percent=slowdown))
+
+    return regressions
+
+
+def main(arguments: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Timecode micro-benchmarks")
+    parser.add_argument("--baseline", default=BASELINE_FILENAME,
+                        help="the baseline JSON file to compare against")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store these results as the new baseline")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown of each case relative to the others (default 0.30)")
+    parser.add_argument("--overall-tolerance", type=float, default=DEFAULT_OVERALL_TOLERANCE,
+                        help="allowed slowdown of the geometric mean of every case (default 0.50)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--number", type=int, default=DEFAULT_NUMBER)
+    options = parser.parse_args(arguments)
+
+    results = run_benchmarks(options.repeat, options.number)
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "unit": "operations per second",
+        "results": results,
+    }
+
+    output = json.dumps(report, indent=4, sort_keys=True)
+    print(output)
+
+    if options.output:
+        with open(options.output, "w") as output_file:
+            output_file.write(output)
+
+    if options.update_baseline:
+        with open(options.baseline, "w") as baseline_file:
+            baseline_file.write(output)
+        return 0
+
+    if not os.path.exists(options.baseline):
+        print(MISSING_BASELINE.format(options.baseline), file=sys.stderr)
+        return 1
+
+    with open(options.baseline, "r") as baseline_file:
+        baseline = json.load(baseline_file)["results"]
+
+    regressions = compare_to_baseline(results, baseline, options.tolerance, options.overall_tolerance)
+    for regression in regressions:
+        print(regression, file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
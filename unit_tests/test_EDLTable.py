@@ -0,0 +1,107 @@
+import sys
+sys.path.append("~/Documents/GitHub/Voices-Now-SRT-Generator")
+
+import os
+import tempfile
+import unittest
+from ProTools.EDL import EDL, States, ColumnHeaders
+from ProTools.EDLTable import EDLTable
+from ProTools.Session import Session
+from ProTools.Timecode import Timecode, OffsetType
+from ProTools.Retime import Retimer
+import ProTools.lib as lib
+from unit_tests.test_Session import SESSION_TEXT
+
+COLUMN_HEADERS = "CHANNEL\tEVENT\tCLIP NAME\tSTART TIME\tEND TIME\tDURATION\tSTATE"
+ROWS = [
+    "1  \t1  \t101  \t01:00:05:00  \t01:00:06:00  \t00:00:01:00  \tUnmuted",
+    "1  \t2  \t102  \t01:00:01:00  \t01:00:03:12  \t00:00:02:12  \tMuted",
+    "2  \t1  \t101  \t01:00:05:00  \t01:00:06:00  \t00:00:01:00  \tUnmuted",
+]
+
+class TestEDLTable(unittest.TestCase):
+    def setUp(self):
+        self.column_headers = lib.parse_column_headers(COLUMN_HEADERS, ColumnHeaders)
+        self.table = EDLTable.from_rows(self.column_headers, ROWS, 24.0)
+        return
+
+    def test_from_rows(self):
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(self.table.clip_names, ["101", "102"])
+        self.assertEqual(self.table.clip_ids.tolist(), [0, 1, 0])
+        self.assertEqual(self.table.frame_rate, 24.0)
+
+        for row, text in zip(self.table, ROWS):
+            self.assertEqual(row, EDL.from_row(self.column_headers, text, 24.0))
+
+    def test_from_edls(self):
+        edls = [EDL.from_row(self.column_headers, row, 24.0) for row in ROWS]
+        table = EDLTable.from_edls(edls)
+
+        self.assertEqual(table.to_edls(), edls)
+        self.assertEqual(table.starts.tolist(), self.table.starts.tolist())
+
+    def test_row_view(self):
+        row = self.table[1]
+
+        self.assertEqual(row.loop, "102")
+        self.assertEqual(row.start_time, Timecode(1, 0, 1, 0))
+        self.assertEqual(row.duration, Timecode(0, 0, 2, 12))
+        self.assertEqual(row.state, States.MUTED)
+        self.assertEqual(self.table[-1].channel, 2)
+        self.assertRaises(IndexError, self.table.__getitem__, 3)
+
+    def test_sort(self):
+        table = self.table.sort()
+        self.assertEqual([(row.channel, row.event) for row in table], [(1, 2), (1, 1), (2, 1)])
+
+    def test_filter(self):
+        self.assertEqual([row.loop for row in self.table.get_muted()], ["102"])
+        self.assertEqual(len(self.table.filter_state(States.UNMUTED)), 2)
+        self.assertEqual([len(channel) for channel in self.table.split_channels()], [2, 1])
+
+    def test_range(self):
+        table = self.table.get_range(Timecode(1, 0, 3, 0), Timecode(1, 0, 5, 1))
+        self.assertEqual([row.loop for row in table], ["101", "102", "101"])
+
+        table = self.table.get_range(Timecode(1, 0, 3, 12), Timecode(1, 0, 5, 0))
+        self.assertEqual(len(table), 0)
+
+    def test_drop_frame(self):
+        table = EDLTable.from_rows(self.column_headers,
+                                   ["1\t1\ta\t01:00:00;02\t01:01:00;02\t00:00:59;28\tUnmuted"])
+        self.assertTrue(table.drop_frame)
+        self.assertEqual(table[0].start_time.convert_to_frames_format(), "01:00:00;02")
+
+    def test_mixed_drop_frame(self):
+        rows = ["1\t1\ta\t01:00:00:02\t01:01:00;02\t00:00:59;28\tUnmuted",
+                "1\t2\tb\t01:02:00;02\t01:03:00;02\t00:00:59;28\tUnmuted"]
+        self.assertRaises(AssertionError, EDLTable.from_rows, self.column_headers, rows)
+        self.assertRaises(AssertionError, EDLTable.from_rows, self.column_headers, rows[::-1])
+
+    def test_compare_with_edl(self):
+        edl = EDL.from_row(self.column_headers, ROWS[1], 24.0)
+
+        self.assertEqual(self.table[1], edl)
+        self.assertEqual(edl, self.table[1])
+        self.assertNotEqual(edl, self.table[0])
+        self.assertNotEqual(self.table[0], edl)
+        self.assertNotEqual(edl, None)
+
+    def test_columnar_session(self):
+        handle, filename = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(handle, "w") as session_file:
+            session_file.write(SESSION_TEXT)
+
+        session = Session.from_file(filename, columnar=True)
+        objects = Session.from_file(filename)
+        os.remove(filename)
+
+        self.assertEqual(len(session.tracks[1].channels), 2)
+        self.assertEqual(list(session.tracks[1].channels[1]), objects.tracks[1].channels[1])
+
+        Retimer.from_offset(Timecode(0, 0, 1, 0), OffsetType.DELAY).retime_session(session)
+        self.assertEqual(session.tracks[0].channels[0][1].start_time, Timecode(1, 0, 6, 12))
+
+if __name__ == "__main__":
+    unittest.main()
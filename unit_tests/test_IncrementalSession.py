@@ -0,0 +1,69 @@
+import sys
+sys.path.append("~/Documents/GitHub/Voices-Now-SRT-Generator")
+
+import os
+import tempfile
+import unittest
+from ProTools.IncrementalSession import IncrementalSession
+from ProTools.Session import Session, SectionHeaders
+from ProTools.Timecode import Timecode
+from unit_tests.test_Session import SESSION_TEXT
+
+class TestIncrementalSession(unittest.TestCase):
+    def setUp(self):
+        handle, self.filename = tempfile.mkstemp(suffix=".txt")
+        os.close(handle)
+        self.write(SESSION_TEXT)
+        self.incremental = IncrementalSession(self.filename)
+        return
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def write(self, text: str) -> None:
+        with open(self.filename, "w") as session_file:
+            session_file.write(text)
+
+    def test_initial_parse(self):
+        session = Session.from_file(self.filename)
+
+        self.assertEqual(self.incremental.session.markers, session.markers)
+        self.assertEqual(self.incremental.session.tracks[1].channels, session.tracks[1].channels)
+
+    def test_unchanged(self):
+        changes = self.incremental.reload()
+
+        self.assertFalse(changes.has_changes())
+        self.assertEqual(changes.changed_loops, set())
+
+    def test_marker_moved(self):
+        tracks = self.incremental.session.tracks
+        self.write(SESSION_TEXT.replace("2   \t01:00:05:12", "2   \t01:00:06:00"))
+
+        changes = self.incremental.reload()
+
+        self.assertEqual(changes.changed_sections, {SectionHeaders.MARKERS_LISTING})
+        self.assertEqual(changes.changed_loops, {"102"})
+        self.assertIs(self.incremental.session.tracks, tracks)
+        self.assertEqual(self.incremental.session.markers[1].location, Timecode(1, 0, 6, 0))
+
+    def test_edl_moved(self):
+        self.write(SESSION_TEXT.replace("\t01:00:05:12   \t01:00:07:00", "\t01:00:05:13   \t01:00:07:00"))
+
+        changes = self.incremental.reload()
+
+        self.assertEqual(changes.changed_sections, {SectionHeaders.TRACK_LISTING})
+        self.assertEqual(changes.changed_loops, {"102"})
+
+    def test_globals_changed(self):
+        self.write(SESSION_TEXT.replace("00:59:50:00", "00:59:00:00"))
+
+        changes = self.incremental.reload()
+
+        self.assertTrue(changes.globals_changed)
+        self.assertEqual(changes.changed_sections, set(SectionHeaders))
+        self.assertEqual(changes.changed_loops, set())
+        self.assertEqual(self.incremental.session.start, Timecode(0, 59, 0, 0))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import sys
+sys.path.append("~/Documents/GitHub/Voices-Now-SRT-Generator")
+
+import random
+import unittest
+from Captions.TimeFormats.IntervalIndex import IntervalIndex
+from Captions.TimeFormats.Timeline import Timeline
+from ProTools.EDL import EDL, States
+from ProTools.EDLTable import EDLTable
+from ProTools.Marker import Marker, Units
+from ProTools.Timecode import Timecode
+from ProTools.Track import Track
+
+def create_time(seconds: int, hours: int = 1) -> Timecode:
+    return Timecode(hours, seconds // 60, seconds % 60, 0)
+
+def create_edl(channel: int, name: str, start: int, end: int) -> EDL:
+    return EDL(channel, 1, name, create_time(start), create_time(end),
+               create_time(end - start, 0), States.UNMUTED)
+
+def get_names(edls: list) -> list[str]:
+    return [edl.loop for edl in edls]
+
+class TestIntervalIndex(unittest.TestCase):
+    def setUp(self):
+        self.edls = [create_edl(1, "A", 0, 10), create_edl(1, "B", 12, 20),
+                     create_edl(2, "C", 5, 15), create_edl(2, "D", 30, 40)]
+        self.index = IntervalIndex.from_edls(self.edls)
+
+    def test_stab(self):
+        self.assertEqual(get_names(self.index.stab(Timecode(1, 0, 6, 0))), ["A", "C"])
+        self.assertEqual(get_names(self.index.stab(Timecode(1, 0, 10, 0))), ["C"])
+        self.assertEqual(get_names(self.index.stab(Timecode(1, 0, 25, 0))), [])
+        self.assertEqual(get_names(self.index.stab(Timecode(0, 59, 59, 0))), [])
+
+    def test_range(self):
+        self.assertEqual(get_names(self.index.get_range(Timecode(1, 0, 14, 0), Timecode(1, 0, 30, 0))),
+                         ["C", "B"])
+        self.assertEqual(get_names(self.index.get_range(Timecode(1, 0, 20, 0), Timecode(1, 0, 30, 0))), [])
+
+        with self.assertRaises(AssertionError):
+            self.index.get_range(Timecode(1, 0, 20, 0), Timecode(1, 0, 10, 0))
+
+    def test_overlaps(self):
+        self.assertEqual([(first.loop, second.loop) for first, second in self.index.get_overlaps()],
+                         [("A", "C"), ("C", "B")])
+
+    def test_gaps(self):
+        self.assertEqual([(first.loop, second.loop) for first, second in self.index.get_gaps()],
+                         [("B", "D")])
+
+    def test_track(self):
+        track = Track("DIA", "", "", None, [], [EDLTable.from_edls(self.edls[:2]),
+                                                 EDLTable.from_edls(self.edls[2:])])
+        index = IntervalIndex.from_track(track)
+
+        self.assertEqual(len(index), 4)
+        self.assertEqual(get_names(index.stab(Timecode(1, 0, 6, 0))), ["A", "C"])
+
+    def test_markers(self):
+        timeline = Timeline("MRK")
+        timeline.append_list_to_end([Marker(id, Timecode(1, 0, seconds, 0), 0, Units.SAMPLES, str(id))
+                                     for id, seconds in ((1, 0), (2, 10), (3, 20))])
+        index = IntervalIndex.from_nodes(timeline)
+
+        self.assertEqual([node.get_loop_id() for node in index.stab(Timecode(1, 0, 12, 0))], ["2"])
+        self.assertEqual([node.get_loop_id() for node in index.stab(Timecode(2, 0, 0, 0))], ["3"])
+        self.assertEqual(index.get_overlaps(), [])
+
+    def test_matches_scan(self):
+        generator = random.Random(0)
+        edls = []
+        for number in range(300):
+            start = generator.randrange(0, 3000)
+            edls.append(create_edl(1, str(number), start, start + generator.randrange(1, 200)))
+        index = IntervalIndex.from_edls(edls)
+        ordered = sorted(edls, key=lambda edl: edl.start_time)
+
+        for seconds in range(0, 3300, 37):
+            time = create_time(seconds)
+            self.assertEqual(get_names(index.stab(time)),
+                             get_names([edl for edl in ordered if edl.start_time <= time < edl.end_time]))
+
+        overlaps = {(first.loop, second.loop) for first, second in index.get_overlaps()}
+        expected = {(first.loop, second.loop) for position, first in enumerate(ordered)
+                    for second in ordered[position + 1:]
+                    if second.start_time < first.end_time}
+        self.assertEqual(overlaps, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import sys
+sys.path.append("~/Documents/GitHub/Voices-Now-SRT-Generator")
+
+import os
+import tempfile
+import unittest
+from ProTools.Session import Session, SectionHeaders
+from ProTools.LazySession import LazySession
+from ProTools.Timecode import Timecode
+from unit_tests.test_Session import SESSION_TEXT
+
+class TestLazySession(unittest.TestCase):
+    def setUp(self):
+        handle, self.filename = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(handle, "w") as session_file:
+            session_file.write(SESSION_TEXT)
+        self.session = LazySession.from_file(self.filename)
+        return
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def test_globals(self):
+        self.assertEqual(self.session.name, "Test Session")
+        self.assertEqual(self.session.start, Timecode(0, 59, 50, 0))
+        self.assertEqual(set(self.session.offsets.keys()), {SectionHeaders.ONLINE_FILES,
+                                                            SectionHeaders.ONLINE_CLIPS,
+                                                            SectionHeaders.PLUG_INS_LISTING,
+                                                            SectionHeaders.TRACK_LISTING,
+                                                            SectionHeaders.MARKERS_LISTING})
+
+    def test_parses_on_access(self):
+        self.assertFalse(self.session.is_loaded(SectionHeaders.MARKERS_LISTING))
+        self.assertEqual([marker.name for marker in self.session.markers], ["101", "102"])
+        self.assertTrue(self.session.is_loaded(SectionHeaders.MARKERS_LISTING))
+        self.assertFalse(self.session.is_loaded(SectionHeaders.TRACK_LISTING))
+        self.assertIs(self.session.markers, self.session.markers)
+
+    def test_matches_session(self):
+        session = Session.from_file(self.filename)
+
+        self.assertEqual(self.session.markers, session.markers)
+        self.assertEqual(self.session.tracks[1].channels, session.tracks[1].channels)
+        self.assertEqual([file.filename for file in self.session.online_files],
+                         [file.filename for file in session.online_files])
+        self.assertEqual(self.session.offline_files, [])
+
+    def test_changed_file(self):
+        with open(self.filename, "w") as session_file:
+            session_file.write(SESSION_TEXT.replace("Test Session", "Other Session"))
+
+        self.assertRaises(AssertionError, self.session.load, SectionHeaders.MARKERS_LISTING)
+
+        session = LazySession.from_file(self.filename)
+        stats = os.stat(self.filename)
+        os.utime(self.filename, ns=(stats.st_atime_ns, stats.st_mtime_ns + 1000000000))
+
+        with self.assertRaises(AssertionError):
+            session.tracks
+
+    def test_prefetch(self):
+        session = LazySession.from_file(self.filename, prefetch=[SectionHeaders.TRACK_LISTING])
+
+        self.assertTrue(session.is_loaded(SectionHeaders.TRACK_LISTING))
+        self.assertFalse(session.is_loaded(SectionHeaders.MARKERS_LISTING))
+        self.assertEqual(session.tracks[0].name, "DIA")
+
+    def test_sample_accurate(self):
+        session = LazySession.from_file(self.filename, sample_accurate=True)
+        self.assertEqual(session.markers[1].location.convert_to_milliseconds_format(), "01:00:05,500")
+
+    def test_assign_section(self):
+        self.session.markers = []
+        self.assertEqual(self.session.markers, [])
+
+if __name__ == "__main__":
+    unittest.main()
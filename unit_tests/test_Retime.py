@@ -0,0 +1,67 @@
+import sys
+sys.path.append("~/Documents/GitHub/Voices-Now-SRT-Generator")
+
+import unittest
+from ProTools.Timecode import Timecode, OffsetType
+from ProTools.Retime import Retimer, RetimeRule
+from ProTools.Marker import Marker, Units
+from Captions.TextFormats.SRT import SRT
+
+class TestRetime(unittest.TestCase):
+    def setUp(self):
+        reel = lambda hours: Timecode(hours, 0, 0, 0, frame_rate=24.0)
+        self.retimer = Retimer.from_tuples([
+            (reel(2), reel(3), Timecode(1, 0, 0, 0, frame_rate=24.0), OffsetType.ADVANCE),
+            (reel(1), reel(2), Timecode(0, 0, 10, 0, frame_rate=24.0), OffsetType.DELAY),
+        ])
+        return
+
+    def test_retime_keeps_order(self):
+        times = [Timecode.from_string(timecode, 24.0) for timecode in
+                 ["02:30:00:00", "00:30:00:00", "01:00:00:00", "01:59:59:23", "03:00:00:00"]]
+        retimed = self.retimer.retime(times)
+
+        self.assertEqual([time.convert_to_frames_format() for time in retimed],
+                         ["01:30:00:00", "00:30:00:00", "01:00:10:00", "02:00:09:23", "03:00:00:00"])
+        self.assertEqual(retimed[2].frame_rate, 24.0)
+
+    def test_apply_matches_retime(self):
+        times = [Timecode.from_total_frames(frames, 24.0) for frames in range(0, 400000, 997)]
+        self.assertEqual(self.retimer.retime(times), [self.retimer.apply(time) for time in times])
+
+    def test_from_offset(self):
+        retimer = Retimer.from_offset(Timecode(0, 0, 1, 0, frame_rate=24.0), OffsetType.DELAY)
+        self.assertEqual(retimer.apply(Timecode(1, 0, 0, 0)), Timecode(1, 0, 1, 0))
+
+        retimer = Retimer.from_offset(Timecode(0, 0, 1, 0, frame_rate=24.0), OffsetType.NONE)
+        self.assertEqual(retimer.apply(Timecode(1, 0, 0, 0)), Timecode(1, 0, 0, 0))
+
+    def test_retime_captions(self):
+        captions = [SRT(1, Timecode(2, 0, 0, 0), Timecode(2, 0, 1, 0), "a"),
+                    SRT(2, Timecode(1, 0, 0, 0), Timecode(1, 0, 1, 0), "b")]
+        self.retimer.retime_captions(captions)
+
+        self.assertEqual(captions[0].start_time, Timecode(1, 0, 0, 0))
+        self.assertEqual(captions[1].end_time, Timecode(1, 0, 11, 0))
+
+    def test_retime_markers(self):
+        marker = Marker(1, Timecode(2, 0, 0, 0), 0, Units.SAMPLES, "1")
+        self.retimer.retime_attributes([marker], ("location",))
+        self.assertEqual(marker.location, Timecode(1, 0, 0, 0))
+
+    def test_invalid_rules(self):
+        reel = lambda hours: Timecode(hours, 0, 0, 0, frame_rate=24.0)
+        offset = Timecode(0, 0, 1, 0)
+
+        self.assertRaises(AssertionError, RetimeRule, reel(2), reel(1), offset, OffsetType.DELAY)
+        self.assertRaises(AssertionError, RetimeRule, None, None, offset, None)
+        self.assertRaises(AssertionError, Retimer.from_offset, offset, "DELAY")
+        self.assertRaises(AssertionError, Retimer.from_tuples,
+                          [(reel(1), reel(3), offset, OffsetType.DELAY),
+                           (reel(2), reel(4), offset, OffsetType.DELAY)])
+        self.assertRaises(AssertionError, Retimer.from_tuples,
+                          [(None, reel(3), offset, OffsetType.DELAY),
+                           (None, reel(4), offset, OffsetType.DELAY)])
+
+if __name__ == "__main__":
+    unittest.main()
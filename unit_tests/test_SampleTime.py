@@ -0,0 +1,86 @@
+import sys
+sys.path.append("~/Documents/GitHub/Voices-Now-SRT-Generator")
+
+import unittest
+from ProTools.Timecode import Timecode
+from ProTools.SampleTime import SampleTime
+from ProTools.Marker import Marker, Units
+
+class TestSampleTime(unittest.TestCase):
+    def setUp(self):
+        self.session_start = Timecode(1, 0, 0, 0, frame_rate=24.0)
+        self.sample_time = SampleTime.from_time_reference(120000, 48000, self.session_start)
+        return
+
+    def test_from_time_reference(self):
+        self.assertEqual(self.sample_time.samples, 3600 * 48000 + 120000)
+        self.assertEqual(self.sample_time.frame_rate, 24.0)
+        self.assertEqual(self.sample_time.convert_to_frames_format(), "01:00:02:12")
+        self.assertEqual(self.sample_time.convert_to_milliseconds_format(), "01:00:02,500")
+
+    def test_sub_frame_milliseconds(self):
+        sample_time = SampleTime(900, 48000)
+        self.assertEqual(sample_time.convert_to_milliseconds_format(), "00:00:00,019")
+        self.assertEqual(sample_time.get_total_frames(), 0)
+        self.assertEqual(sample_time.get_total_milliseconds(), 19)
+        self.assertEqual(SampleTime(1000, 48000).convert_to_milliseconds_format(), "00:00:00,021")
+
+    def test_matches_timecode_on_frame_boundaries(self):
+        for timecode in [Timecode.from_string("01:00:00;00"), Timecode.from_string("00:12:34;17"),
+                         Timecode.from_total_frames(89356, 24.0), Timecode.from_total_frames(5000, 23.976)]:
+            sample_time = SampleTime.from_timecode(timecode, 48000)
+            self.assertEqual(sample_time.get_total_frames(), timecode.get_total_frames())
+            self.assertEqual(sample_time.to_timecode(), timecode)
+            self.assertEqual(sample_time.convert_to_frames_format(), timecode.convert_to_frames_format())
+            self.assertEqual(sample_time.convert_to_milliseconds_format(),
+                             timecode.convert_to_milliseconds_format())
+
+    def test_same_time_base_as_timecode(self):
+        # A 23.976 marker an hour in is labelled 01:00:00 on both paths
+        timecode = Timecode(1, 0, 0, 0, frame_rate=23.976)
+        sample_time = SampleTime.from_timecode(timecode, 48000)
+        self.assertEqual(sample_time.convert_to_milliseconds_format(), "01:00:00,000")
+        self.assertEqual((sample_time + 480).convert_to_milliseconds_format(), "01:00:00,010")
+
+    def test_drop_frame_milliseconds(self):
+        # Frame 00:01:00;02 starts at sample 2882880 and is labelled 00:01:00,067
+        rate = Timecode.from_string("00:01:00;02")._rate
+        for samples, expected in [(2882879, "00:01:00,067"), (2882880, "00:01:00,067"),
+                                  (2882880 + 480, "00:01:00,077"), (2882880 - 480, "00:01:00,057")]:
+            sample_time = SampleTime(samples, 48000, rate)
+            self.assertEqual(sample_time.convert_to_frames_format(), "00:01:00;02")
+            self.assertEqual(sample_time.convert_to_milliseconds_format(), expected)
+
+    def test_offset(self):
+        offset = Timecode(0, 0, 1, 0, frame_rate=24.0)
+        self.assertEqual((self.sample_time - offset).samples, self.sample_time.samples - 48000)
+        self.assertEqual((self.sample_time + offset).samples, self.sample_time.samples + 48000)
+        self.assertEqual((self.sample_time + 10).samples, self.sample_time.samples + 10)
+        self.assertRaises(AssertionError, SampleTime(10, 48000).__sub__, offset)
+
+    def test_interpolate(self):
+        end = self.sample_time + 48000
+        middle = self.sample_time.interpolate(end, 1, 4)
+        self.assertEqual(middle.samples, self.sample_time.samples + 12000)
+
+    def test_comparators(self):
+        later = self.sample_time + 1
+        self.assertLess(self.sample_time, later)
+        self.assertGreater(later, self.sample_time)
+        self.assertEqual(self.sample_time, SampleTime(self.sample_time.samples, 48000))
+        self.assertNotEqual(self.sample_time, later)
+        self.assertGreaterEqual(self.sample_time, self.session_start)
+
+    def test_init_invalid(self):
+        self.assertRaises(AssertionError, SampleTime, -1, 48000)
+        self.assertRaises(AssertionError, SampleTime, 0, 0)
+        self.assertRaises(AssertionError, SampleTime, 0, 44100.5)
+
+    def test_marker_sample_time(self):
+        marker = Marker(1, Timecode.from_string("01:00:42:13"), 2043360, Units.SAMPLES, "1")
+        sample_time = marker.get_sample_time(48000, self.session_start)
+        self.assertEqual(sample_time.samples, 3600 * 48000 + 2043360)
+        self.assertEqual(sample_time.convert_to_milliseconds_format(), "01:00:42,570")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,231 @@
+import sys
+sys.path.append("~/Documents/GitHub/Voices-Now-SRT-Generator")
+
+import os
+import tempfile
+import unittest
+from ProTools.Session import Session, SectionHeaders, chunk_track_blocks
+from ProTools.SessionReader import LineReader, iterate_sections, iterate_tracks
+from ProTools.EDL import EDL, States, ColumnHeaders as EDLHeaders
+from ProTools.Marker import Marker, ColumnHeaders as MarkerHeaders
+from ProTools.Clip import Clip
+from ProTools.Track import Track
+import ProTools.lib as lib
+from ProTools.Timecode import Timecode
+
+SESSION_TEXT = """\
+SESSION NAME:\tTest Session
+SAMPLE RATE:\t48000.000000
+BIT DEPTH:\t24-bit
+SESSION START:\t00:59:50:00
+TIMECODE FORMAT:\t24 Frame
+# OF AUDIO TRACKS:\t2
+# OF AUDIO CLIPS:\t3
+# OF AUDIO FILES:\t2
+
+
+O N L I N E  F I L E S  I N  S E S S I O N
+Filename                                      \tLocation
+DIA_01.wav                                    \tMacintosh HD:Audio Files:
+MX_01.wav                                     \tMacintosh HD:Audio Files:
+
+
+O N L I N E  C L I P S  I N  S E S S I O N
+CLIP NAME                                   \tSource File
+101                                         \tDIA_01.wav
+102                                         \tDIA_01.wav
+MX_01.L                                     \tMX_01.wav    [1]
+MX_01.R                                     \tMX_01.wav    [2]
+
+
+P L U G - I N S  L I S T I N G
+MANUFACTURER            \tPLUG-IN NAME            \tVERSION         \tFORMAT          \tSTEMS                   \tNUMBER OF INSTANCES
+Avid                    \tEQ3 7-Band              \t22.6.0.111      \tAAX Native      \tMono / Mono             \t4
+
+
+T R A C K  L I S T I N G
+TRACK NAME:\tDIA
+COMMENTS:\t
+USER DELAY:\t0 Samples
+STATE: 
+PLUG-INS: 
+CHANNEL \tEVENT   \tCLIP NAME                     \tSTART TIME    \tEND TIME      \tDURATION      \tSTATE
+1       \t1       \t101                           \t01:00:00:00   \t01:00:02:00   \t00:00:02:00   \tUnmuted
+1       \t2       \t102                           \t01:00:05:12   \t01:00:07:00   \t00:00:01:12   \tUnmuted
+
+
+TRACK NAME:\tMX
+COMMENTS:\tStereo
+USER DELAY:\t0 Samples
+STATE: 
+PLUG-INS: 
+CHANNEL \tEVENT   \tCLIP NAME                     \tSTART TIME    \tEND TIME      \tDURATION      \tSTATE
+1       \t1       \tMX_01.L                       \t01:00:00:00   \t01:01:00:00   \t00:01:00:00   \tUnmuted
+2       \t1       \tMX_01.R                       \t01:00:00:00   \t01:01:00:00   \t00:01:00:00   \tMuted
+
+
+M A R K E R S  L I S T I N G
+#   \tLOCATION     \tTIME REFERENCE    \tUNITS    \tNAME                             \tCOMMENTS
+1   \t01:00:00:00  \t480000            \tSamples  \t101                              \t
+2   \t01:00:05:12  \t744000            \tSamples  \t102                              \tsecond loop
+"""
+
+class TestSession(unittest.TestCase):
+    def setUp(self):
+        handle, self.filename = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(handle, "w") as session_file:
+            session_file.write(SESSION_TEXT)
+        self.session = Session.from_file(self.filename)
+        return
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def test_globals(self):
+        self.assertEqual(self.session.name, "Test Session")
+        self.assertEqual(self.session.sample_rate, 48000.0)
+        self.assertEqual(self.session.start, Timecode(0, 59, 50, 0))
+        self.assertIsInstance(Session.parse_globals(SESSION_TEXT.splitlines())[3], Timecode)
+        self.assertEqual(self.session.frame_rate, 24.0)
+        self.assertFalse(self.session.drop_frame)
+
+    def test_files(self):
+        self.assertEqual([file.filename for file in self.session.online_files],
+                         ["DIA_01.wav", "MX_01.wav"])
+        self.assertEqual(self.session.offline_files, [])
+
+    def test_clips(self):
+        clips = self.session.online_clips
+
+        self.assertEqual([clip.clip_name for clip in clips], ["101", "102", "MX_01.L", "MX_01.R"])
+        self.assertEqual(clips[3].source_file, "MX_01.wav")
+        self.assertEqual([clip.channel for clip in clips], [1, 1, 1, 2])
+
+    def test_clip_index(self):
+        index = self.session.get_clip_index()
+
+        self.assertEqual(index.get_source_files("102"), ["DIA_01.wav"])
+        self.assertEqual(index.get_files("MX_01.R")[0].location, "Macintosh HD:Audio Files:")
+        self.assertEqual([clip.clip_name for clip in index.get_clips_from_file("DIA_01.wav")],
+                         ["101", "102"])
+        self.assertEqual(index.get_clips("FX"), [])
+
+    def test_split_channel(self):
+        self.assertEqual(Clip.split_channel("Andre_01.wav    [1]"), ("Andre_01.wav", 1))
+        self.assertEqual(Clip.split_channel("Andre_01.wav"), ("Andre_01.wav", 1))
+        self.assertEqual(Clip.split_channel("Take [a]"), ("Take [a]", 1))
+
+    def test_plugins(self):
+        plugin = self.session.plug_ins[0]
+
+        self.assertEqual(plugin.name, "EQ3 7-Band")
+        self.assertEqual(plugin.stems, "Mono / Mono")
+        self.assertEqual(plugin.number_of_instances, 4)
+
+    def test_tracks(self):
+        dialogue, music = self.session.tracks
+
+        self.assertEqual(dialogue.name, "DIA")
+        self.assertEqual(len(dialogue.channels), 1)
+        self.assertEqual([edl.loop for edl in dialogue.channels[0]], ["101", "102"])
+        self.assertEqual(dialogue.channels[0][1].start_time, Timecode(1, 0, 5, 12))
+
+        self.assertEqual(music.comments, "Stereo")
+        self.assertEqual(len(music.channels), 2)
+        self.assertEqual(music.channels[1][0].state, States.MUTED)
+
+    def test_track_from_rows(self):
+        column_headers = lib.parse_column_headers("CHANNEL\tEVENT\tCLIP NAME\tSTART TIME\t"
+                                                  "END TIME\tDURATION\tSTATE", EDLHeaders)
+        rows = ["TRACK NAME:\tMX",
+                "COMMENTS:\tStereo",
+                "CHANNEL\tEVENT\tCLIP NAME\tSTART TIME\tEND TIME\tDURATION\tSTATE",
+                "1\t1\tMX_01.L\t01:00:00:00\t01:01:00:00\t00:01:00:00\tUnmuted",
+                "",
+                "2\t1\tMX_01.R\t01:00:00:00\t01:01:00:00\t00:01:00:00\tMuted",
+                ""]
+
+        track = Track.from_rows(column_headers, rows, 24.0)
+
+        self.assertEqual(track.name, "MX")
+        self.assertEqual([[edl.loop for edl in channel] for channel in track.channels],
+                         [["MX_01.L"], ["MX_01.R"]])
+        self.assertEqual(track.channels, self.session.tracks[1].channels)
+
+    def test_markers(self):
+        self.assertEqual([marker.name for marker in self.session.markers], ["101", "102"])
+        self.assertEqual(self.session.markers[1].location, Timecode(1, 0, 5, 12))
+        self.assertEqual(self.session.markers[1].comments, "second loop")
+
+    def test_sample_accurate(self):
+        session = Session.from_file(self.filename, sample_accurate=True)
+        self.assertEqual(session.markers[1].location.convert_to_milliseconds_format(), "01:00:05,500")
+
+    def test_split_sections(self):
+        sections = Session.split_sections(SESSION_TEXT.splitlines(keepends=True))
+
+        self.assertEqual(list(sections.keys()), [SectionHeaders.ONLINE_FILES,
+                                                 SectionHeaders.ONLINE_CLIPS,
+                                                 SectionHeaders.PLUG_INS_LISTING,
+                                                 SectionHeaders.TRACK_LISTING,
+                                                 SectionHeaders.MARKERS_LISTING])
+        self.assertEqual(len(sections[SectionHeaders.MARKERS_LISTING]), 3)
+
+    def test_skipped_sections_are_drained(self):
+        reader = LineReader(SESSION_TEXT.splitlines())
+        headers = [header for header, rows in iterate_sections(reader)]
+        self.assertEqual(headers[-1], SectionHeaders.MARKERS_LISTING)
+
+        for header, rows in iterate_sections(LineReader(SESSION_TEXT.splitlines())):
+            if header == SectionHeaders.TRACK_LISTING:
+                names = [info[0] for info, column_headers, edls in iterate_tracks(rows)]
+        self.assertEqual(names, ["TRACK NAME:\tDIA", "TRACK NAME:\tMX"])
+
+    def test_row_parsers(self):
+        column_headers = lib.parse_column_headers("CHANNEL\tEVENT\tCLIP NAME\tSTART TIME\t"
+                                                  "END TIME\tDURATION\tSTATE", EDLHeaders)
+        row = "1  \t3  \t103   \t01:00:09:00 \t01:00:10:00 \t00:00:01:00 \tMuted"
+
+        parse_row = EDL.create_row_parser(column_headers, 24.0)
+        self.assertEqual(parse_row(row), EDL.from_row(column_headers, row, 24.0))
+        self.assertEqual(parse_row(row).duration, Timecode(0, 0, 1, 0))
+
+        del column_headers[EDLHeaders.STATE]
+        self.assertRaises(AssertionError, EDL.create_row_parser, column_headers, 24.0)
+        self.assertRaises(AssertionError, lib.compile_row_splitter, {MarkerHeaders.ID: 0}, EDLHeaders)
+
+    def test_marker_time_format(self):
+        column_headers = lib.parse_column_headers("#\tLOCATION\tTIME REFERENCE\tUNITS\tNAME\tCOMMENTS",
+                                                  MarkerHeaders)
+
+        for location in ["1| 1| 000", "1:00.500"]:
+            parse_row = Marker.create_row_parser(column_headers, 24.0)
+            self.assertRaises(ValueError, parse_row, f"1\t{location}\t480000\tSamples\t101\t")
+
+        parse_row = Marker.create_row_parser(column_headers, 24.0)
+        marker = parse_row("1\t01:00:05:12\t744000\tSamples\t102\t")
+        self.assertEqual(marker.location, Timecode(1, 0, 5, 12))
+        self.assertEqual(parse_row("2\t01:00:06:00\t768000\tSamples\t103\t").location,
+                         Timecode(1, 0, 6, 0))
+
+    def test_parallel_tracks(self):
+        sections = Session.split_sections(SESSION_TEXT.splitlines())
+        blocks = [(info, column_headers, list(edls)) for info, column_headers, edls
+                  in iterate_tracks(sections[SectionHeaders.TRACK_LISTING])]
+        blocks[1] = (blocks[1][0], None, blocks[1][2])
+
+        tracks = Session.parse_tracks_in_parallel(blocks, 24.0, False, 2)
+
+        self.assertEqual([track.name for track in tracks], ["DIA", "MX"])
+        self.assertEqual(tracks[1].channels, self.session.tracks[1].channels)
+        self.assertIs(tracks[0].channels[0][0].start_time._rate, Timecode(0, 0, 0, 0)._rate)
+
+    def test_chunk_track_blocks(self):
+        blocks = [([], None, [""] * rows) for rows in [10, 1, 1, 1, 7, 2]]
+        chunks = chunk_track_blocks(blocks, 3)
+
+        self.assertEqual([[len(rows) for _, _, rows in chunk] for chunk in chunks],
+                         [[10], [1, 1, 1, 7], [2]])
+
+if __name__ == "__main__":
+    unittest.main()
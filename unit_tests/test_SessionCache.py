@@ -0,0 +1,89 @@
+import sys
+sys.path.append("~/Documents/GitHub/Voices-Now-SRT-Generator")
+
+import os
+import shutil
+import tempfile
+import unittest
+from ProTools.EDLTable import EDLTable
+from ProTools.LazySession import LazySession
+from ProTools.Session import Session
+from ProTools.SessionCache import SessionCache
+from ProTools.SessionReader import SectionHeaders
+from ProTools.Timecode import Timecode
+from unit_tests.test_Session import SESSION_TEXT
+
+class TestSessionCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, "session.txt")
+        with open(self.filename, "w") as session_file:
+            session_file.write(SESSION_TEXT)
+        self.cache = SessionCache(os.path.join(self.directory, "cache"))
+        return
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_load(self):
+        first = self.cache.load(self.filename)
+        second = SessionCache(self.cache.directory).load(self.filename)
+
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(second.markers, Session.from_file(self.filename).markers)
+        self.assertEqual(second.tracks[1].channels, first.tracks[1].channels)
+        self.assertIs(second.start._rate, Timecode(0, 0, 0, 0)._rate)
+
+    def test_session_type(self):
+        miss = self.cache.load(self.filename)
+        hit = self.cache.load(self.filename)
+
+        for session in [miss, hit]:
+            self.assertIsInstance(session, LazySession)
+            self.assertTrue(all(session.is_loaded(header) for header in SectionHeaders))
+
+    def test_columnar(self):
+        session = self.cache.load(self.filename, columnar=True)
+
+        self.assertIsInstance(session.tracks[1].channels[0], EDLTable)
+        self.assertIsInstance(self.cache.load(self.filename).tracks[1].channels[0], list)
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_hit(self):
+        self.cache.load(self.filename)
+        self.cache.load(self.filename)
+
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_key_changes(self):
+        key = SessionCache.get_key(self.filename)
+        self.assertNotEqual(key, SessionCache.get_key(self.filename, sample_accurate=True))
+
+        with open(self.filename, "a") as session_file:
+            session_file.write("3   \t01:00:09:00  \t912000  \tSamples  \t103  \t\n")
+
+        self.assertNotEqual(key, SessionCache.get_key(self.filename))
+        self.assertEqual(len(self.cache.load(self.filename).markers), 3)
+
+    def test_corrupt_entry(self):
+        self.cache.load(self.filename)
+        with open(self.cache.get_path(SessionCache.get_key(self.filename)), "wb") as entry:
+            entry.write(b"not a session")
+
+        self.assertEqual(len(self.cache.load(self.filename).markers), 2)
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_eviction(self):
+        self.cache.load(self.filename)
+        self.cache.load(self.filename, sample_accurate=True)
+        self.assertEqual(len(self.cache.get_entries()), 2)
+
+        self.cache.max_size = self.cache.get_size() - 1
+        self.cache.evict()
+        self.assertEqual(len(self.cache.get_entries()), 1)
+
+        self.cache.clear()
+        self.assertEqual(self.cache.get_size(), 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import sys
+sys.path.append("~/Documents/GitHub/Voices-Now-SRT-Generator")
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+from ProTools.Session import Session, SectionHeaders
+from ProTools.SessionIndex import SessionIndex
+from ProTools.Timecode import Timecode
+from unit_tests.test_Session import SESSION_TEXT
+
+class TestSessionIndex(unittest.TestCase):
+    def setUp(self):
+        handle, self.filename = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(handle, "w") as session_file:
+            session_file.write(SESSION_TEXT)
+        self.index = SessionIndex(self.filename)
+        return
+
+    def tearDown(self):
+        self.index.close()
+        os.remove(self.filename)
+
+    def test_globals(self):
+        self.assertEqual(self.index.frame_rate, 24.0)
+        self.assertEqual(self.index.start, Timecode(0, 59, 50, 0))
+
+    def test_global_rows_end_at_header(self):
+        with mock.patch.object(Session, "parse_global_data",
+                               wraps=Session.parse_global_data) as parse:
+            SessionIndex(self.filename).close()
+
+        rows = parse.call_args.args[0]
+        headers = [header.value for header in SectionHeaders]
+        self.assertFalse(any(row.strip() in headers for row in rows))
+        self.assertEqual(rows[-1].split(":")[0].strip(), "# OF AUDIO FILES")
+
+    def test_track_names(self):
+        self.assertEqual(self.index.get_track_names(), ["DIA", "MX"])
+
+    def test_get_track(self):
+        music = self.index.get_track("MX")
+        session = Session.from_file(self.filename)
+
+        self.assertEqual(music.name, "MX")
+        self.assertEqual(music.channels, session.tracks[1].channels)
+        self.assertEqual(self.index.get_track("DIA").channels, session.tracks[0].channels)
+        self.assertRaises(AssertionError, self.index.get_track, "FX")
+
+    def test_get_markers(self):
+        markers = self.index.get_markers()
+        self.assertEqual([marker.location for marker in markers],
+                         [Timecode(1, 0, 0, 0), Timecode(1, 0, 5, 12)])
+
+        markers = self.index.get_markers(sample_accurate=True)
+        self.assertEqual(markers[1].location.convert_to_milliseconds_format(), "01:00:05,500")
+
+    def test_get_section(self):
+        files = self.index.get_section(SectionHeaders.ONLINE_FILES)
+        self.assertEqual([file.filename for file in files], ["DIA_01.wav", "MX_01.wav"])
+        self.assertEqual(self.index.get_section(SectionHeaders.OFFLINE_FILES), [])
+
+    def test_context_manager(self):
+        with SessionIndex(self.filename) as index:
+            self.assertEqual(len(index.get_markers()), 2)
+
+if __name__ == "__main__":
+    unittest.main()
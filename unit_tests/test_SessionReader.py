@@ -0,0 +1,119 @@
+import sys
+sys.path.append("~/Documents/GitHub/Voices-Now-SRT-Generator")
+
+import codecs
+import io
+import os
+import tempfile
+import unittest
+from ProTools.Session import Session, SectionHeaders
+from ProTools.LazySession import LazySession
+from ProTools.SessionIndex import SessionIndex
+from ProTools.SessionReader import ExportFormat, iterate_raw_lines, index_sections, read_rows
+from unit_tests.test_Session import SESSION_TEXT
+
+ACCENTED_TEXT = SESSION_TEXT.replace("Test Session", "Test Séssion")
+
+# (encoding, terminator, byte order mark)
+FORMATS = (("utf-8", "\n", b""),
+           ("utf-8", "\r\n", codecs.BOM_UTF8),
+           ("utf-16-le", "\r\n", codecs.BOM_UTF16_LE),
+           ("utf-16-be", "\n", codecs.BOM_UTF16_BE),
+           ("mac_roman", "\r", b""))
+
+class TestExportFormat(unittest.TestCase):
+    def test_detects_utf8(self):
+        self.assertEqual(ExportFormat.from_bytes("A\tB\nC".encode("utf-8")), ExportFormat("utf-8", "\n"))
+        self.assertEqual(ExportFormat.from_bytes(codecs.BOM_UTF8 + b"A\r\nB"), ExportFormat("utf-8", "\r\n", 3))
+
+    def test_detects_utf16(self):
+        self.assertEqual(ExportFormat.from_bytes(codecs.BOM_UTF16_LE + "A\r\nB".encode("utf-16-le")),
+                         ExportFormat("utf-16-le", "\r\n", 2))
+        self.assertEqual(ExportFormat.from_bytes(codecs.BOM_UTF16_BE + "A\nB".encode("utf-16-be")),
+                         ExportFormat("utf-16-be", "\n", 2))
+
+    def test_detects_mac_roman(self):
+        self.assertEqual(ExportFormat.from_bytes("Séssion\rB".encode("mac_roman")), ExportFormat("mac_roman", "\r"))
+
+    def test_truncated_utf8_sample(self):
+        data = "Séssion\n".encode("utf-8")
+        self.assertEqual(ExportFormat.from_bytes(data[:2]).encoding, "utf-8")
+
+    def test_decode_falls_back(self):
+        self.assertEqual(ExportFormat().decode("é".encode("mac_roman")), "é")
+
+    def test_utf16_lines_are_aligned(self):
+        # U+0A0D followed by U+0100 contains the bytes 0A 00 at an odd offset
+        text = "਍Ā\nB"
+        export_format = ExportFormat("utf-16-le")
+        lines = [export_format.decode(line)
+                 for _, line in iterate_raw_lines(io.BytesIO(text.encode("utf-16-le")), export_format)]
+        self.assertEqual(lines, ["਍Ā", "B"])
+
+    def test_raw_line_offsets(self):
+        data = b"AB\rC\r\rDEF"
+        export_format = ExportFormat("utf-8", "\r")
+        self.assertEqual(list(iterate_raw_lines(io.BytesIO(data), export_format)),
+                         [(0, b"AB"), (3, b"C"), (5, b""), (6, b"DEF")])
+        self.assertEqual(list(read_rows(io.BytesIO(data), 3, 6, export_format)), ["C"])
+
+
+class TestEncodedSessions(unittest.TestCase):
+    def setUp(self):
+        self.filenames = {}
+        for encoding, terminator, byte_order_mark in FORMATS:
+            handle, filename = tempfile.mkstemp(suffix=".txt")
+            with os.fdopen(handle, "wb") as session_file:
+                session_file.write(byte_order_mark + ACCENTED_TEXT.replace("\n", terminator).encode(encoding))
+            self.filenames[(encoding, terminator)] = filename
+
+    def tearDown(self):
+        for filename in self.filenames.values():
+            os.remove(filename)
+
+    def test_session(self):
+        expected = Session.from_file(self.filenames[("utf-8", "\n")])
+
+        for (encoding, terminator), filename in self.filenames.items():
+            session = Session.from_file(filename)
+            self.assertEqual(session.name, "Test Séssion", encoding)
+            self.assertEqual(session.markers, expected.markers, encoding)
+            self.assertEqual([track.channels for track in session.tracks],
+                             [track.channels for track in expected.tracks], encoding)
+            self.assertEqual([clip.clip_name for clip in session.online_clips],
+                             [clip.clip_name for clip in expected.online_clips], encoding)
+
+    def test_lazy_session(self):
+        expected = Session.from_file(self.filenames[("utf-8", "\n")])
+
+        for (encoding, terminator), filename in self.filenames.items():
+            session = LazySession.from_file(filename)
+            self.assertEqual(session.export_format.encoding, encoding)
+            self.assertEqual(session.export_format.terminator, terminator)
+            self.assertEqual(session.name, "Test Séssion")
+            self.assertEqual(session.markers, expected.markers, encoding)
+            self.assertEqual(session.tracks[1].channels, expected.tracks[1].channels, encoding)
+
+    def test_session_index(self):
+        expected = Session.from_file(self.filenames[("utf-8", "\n")])
+
+        for (encoding, terminator), filename in self.filenames.items():
+            with SessionIndex(filename) as index:
+                self.assertEqual(index.get_track_names(), ["DIA", "MX"], encoding)
+                self.assertEqual(index.get_track("MX").channels, expected.tracks[1].channels, encoding)
+                self.assertEqual(index.get_markers(), expected.markers, encoding)
+
+    def test_index_sections_matches_offsets(self):
+        for (encoding, terminator), filename in self.filenames.items():
+            with open(filename, "rb") as session_file:
+                export_format = ExportFormat.from_file(session_file)
+                global_rows, offsets = index_sections(session_file, export_format)
+                markers = list(read_rows(session_file, *offsets[SectionHeaders.MARKERS_LISTING],
+                                         export_format))
+
+            self.assertEqual(global_rows[0], "SESSION NAME:\tTest Séssion", encoding)
+            self.assertEqual(len(markers), 3, encoding)
+
+
+if __name__ == '__main__':
+    unittest.main()
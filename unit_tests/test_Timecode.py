@@ -2,7 +2,8 @@ import sys
 sys.path.append("~/Documents/GitHub/Voices-Now-SRT-Generator")
 
 import unittest
-from ProTools.Timecode import Timecode
+from ProTools.Timecode import Timecode, TimecodeCache, FrameRate
+import ProTools.Timecode as timecode_module
 
 class TestTimecode(unittest.TestCase):
     def setUp(self):
@@ -69,6 +70,36 @@ class TestTimecode(unittest.TestCase):
         self.assertGreater(self.timecode4, self.timecode2)
         self.assertGreaterEqual(self.timecode4, self.timecode2)
 
+    def test_hash(self):
+        index = {self.timecode2: "loop 1"}
+        self.assertEqual(index[Timecode.from_string("01:02:03:04", 24.0)], "loop 1")
+        self.assertNotIn(self.timecode4, index)
+        self.assertNotIn(Timecode.from_total_frames(89356, 25.0), index)
+        self.assertEqual(len({self.timecode2, Timecode.from_total_frames(89356, 24.0)}), 1)
+
+    def test_compare_drop_frame(self):
+        drop_frame = Timecode.from_total_frames(1800, 29.97, True)
+        non_drop_frame = Timecode.from_total_frames(1800, 29.97, False)
+
+        self.assertNotEqual(drop_frame, non_drop_frame)
+        self.assertFalse(drop_frame == non_drop_frame)
+        self.assertEqual(len({drop_frame, non_drop_frame}), 2)
+        self.assertEqual(drop_frame, Timecode.from_total_frames(1800, 29.97, True))
+
+    def test_compare_other_types(self):
+        self.assertFalse(self.timecode2 == "01:02:03:04")
+        self.assertTrue(self.timecode2 != None)
+        self.assertRaises(TypeError, lambda: self.timecode2 < 5)
+        self.assertRaises(TypeError, lambda: self.timecode2 >= "01:02:03:04")
+
+    def test_sort(self):
+        timecodes = [self.timecode4, self.timecode1, self.timecode2]
+        self.assertEqual(sorted(timecodes), [self.timecode1, self.timecode2, self.timecode4])
+        self.assertEqual(sorted(timecodes, key=Timecode.sort_key), sorted(timecodes))
+        self.assertLessEqual(self.timecode2, Timecode.from_total_frames(89356, 24.0))
+        self.assertGreaterEqual(self.timecode2, Timecode.from_total_frames(89356, 24.0))
+        self.assertFalse(self.timecode2 > Timecode.from_total_frames(89356, 24.0))
+
     def test_add_timecode(self):
         timecode4 = self.timecode2 + self.timecode4
         self.assertEqual(timecode4.get_total_frames(), 178713)
@@ -101,6 +132,112 @@ class TestTimecode(unittest.TestCase):
         timecode4 = self.timecode2 % 3
         self.assertEqual(timecode4.get_total_frames(), 1)
 
+    def test_ops_keep_frame_rate(self):
+        timecode = Timecode.from_total_frames(100, 30.0, True) + 5
+        self.assertEqual(timecode.frame_rate, 30.0)
+        self.assertTrue(timecode.drop_frame)
+        self.assertEqual(timecode.convert_to_frames_format(), "00:00:03;15")
+
+    def test_from_milliseconds_format(self):
+        timecode = Timecode.from_string("01:02:03,167", 24.0)
+        self.assertEqual(timecode, self.timecode2)
+
+    def test_from_string_formats(self):
+        self.assertEqual(Timecode.from_string("01:02:03:04", 24.0), self.timecode2)
+        self.assertEqual(Timecode.from_string("01:02:03.167", 24.0), self.timecode2)
+        self.assertTrue(Timecode.from_string("01:02:03;04", 30.0).drop_frame)
+        self.assertRaises(ValueError, Timecode.from_string, "01:02:03")
+        self.assertRaises(ValueError, Timecode.from_string, "01:02:03:004")
+        self.assertRaises(AssertionError, Timecode.from_string, "01:61:03:04")
+
+    def test_from_trusted_string(self):
+        for timecode in ["01:02:03:04", "01:02:03,167", "00:00:14;25"]:
+            expected = Timecode.from_string(timecode, 30.0)
+            trusted = Timecode.from_trusted_string(timecode, 30.0)
+            self.assertEqual(trusted, expected)
+            self.assertEqual(trusted.drop_frame, expected.drop_frame)
+
+    def test_trusted_drop_frame_label(self):
+        self.assertRaises(AssertionError, Timecode.from_trusted_string, "00:01:00;00")
+        self.assertEqual(Timecode.from_trusted_string("00:10:00;00").get_total_frames(), 17982)
+
+        parse_timecode = Timecode.create_section_parser()
+        parse_timecode("00:00:59;29")
+        self.assertRaises(AssertionError, parse_timecode, "00:01:00;01")
+
+    def test_drop_frame_total_frames(self):
+        self.assertEqual(Timecode.from_string("00:00:59;29").get_total_frames(), 1799)
+        self.assertEqual(Timecode.from_string("00:01:00;02").get_total_frames(), 1800)
+        self.assertEqual(Timecode.from_string("00:10:00;00").get_total_frames(), 17982)
+        self.assertEqual(Timecode.from_string("01:00:00;00").get_total_frames(), 107892)
+        self.assertEqual(Timecode.from_string("01:00:00;00", 59.94).get_total_frames(), 215784)
+
+    def test_drop_frame_round_trip(self):
+        for total_frames in [0, 1799, 1800, 17981, 17982, 107891, 107892, 215784]:
+            timecode = Timecode.from_total_frames(total_frames, 29.97, True)
+            self.assertEqual(Timecode.from_string(str(timecode)).get_total_frames(), total_frames)
+
+        self.assertEqual(str(Timecode.from_total_frames(1800, 29.97, True)), "00:01:00;02")
+        self.assertEqual(str(Timecode.from_total_frames(17982, 29.97, True)), "00:10:00;00")
+
+    def test_drop_frame_invalid(self):
+        self.assertRaises(AssertionError, Timecode.from_string, "00:01:00;00")
+        self.assertRaises(AssertionError, Timecode.from_string, "00:01:00;01")
+        self.assertRaises(AssertionError, Timecode.from_drop_frame_format, "00:00:01;00", 24.0)
+        Timecode.from_string("00:10:00;00")
+
+    def test_total_milliseconds(self):
+        self.assertEqual(Timecode.from_string("01:00:00;00").get_total_milliseconds(), 3599996)
+        self.assertEqual(Timecode.from_total_frames(24000, 23.976).get_total_milliseconds(), 1001000)
+        self.assertEqual(self.timecode2.get_total_milliseconds(), 3723167)
+
+    def test_parse_cache(self):
+        timecode_module.set_cache_enabled(True)
+        timecode_module.PARSE_CACHE.clear()
+
+        first = Timecode.from_string("02:03:04:05", 25.0)
+        second = Timecode.from_string("02:03:04:05", 25.0)
+        self.assertIs(first, second)
+        self.assertIsNot(first, Timecode.from_string("02:03:04:05", 24.0))
+
+        stats = timecode_module.get_cache_stats()["parse"]
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 2))
+
+    def test_parse_cache_disabled(self):
+        timecode_module.set_cache_enabled(False)
+        try:
+            first = Timecode.from_string("02:03:04:05", 25.0)
+            self.assertIsNot(first, Timecode.from_string("02:03:04:05", 25.0))
+            self.assertEqual(first.convert_to_milliseconds_format(), "02:03:04,200")
+            self.assertEqual(timecode_module.get_cache_stats()["format"]["misses"], 0)
+        finally:
+            timecode_module.set_cache_enabled(True)
+
+    def test_cache_eviction(self):
+        cache = TimecodeCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+
+    def test_millisecond_tables(self):
+        for frame_rate in [23.976, 24.0, 25.0, 29.97, 30.0, 59.94]:
+            rate = FrameRate.get(frame_rate)
+            for frames in range(rate.timebase):
+                expected = int(frames / frame_rate * 1000 + 0.5)
+                self.assertEqual(rate.milliseconds_by_frame[frames], expected)
+                self.assertEqual(Timecode.frames_to_milliseconds(frames, frame_rate), expected)
+            for milliseconds in range(1000):
+                expected = int(milliseconds / 1000 * frame_rate + 0.5)
+                self.assertEqual(rate.frames_by_millisecond[milliseconds], expected)
+                self.assertEqual(Timecode.milliseconds_to_frames(milliseconds, frame_rate), expected)
+
+        self.assertIs(FrameRate.get(25.0).milliseconds_by_frame, FrameRate.get(25.0).milliseconds_by_frame)
+        self.assertEqual(Timecode.frames_to_milliseconds(48, 24.0), 2000)
+
     def test_ops_invalid(self):
         self.assertRaises(TypeError, self.timecode2.__add__, "test")
         self.assertRaises(TypeError, self.timecode2.__sub__, "test")
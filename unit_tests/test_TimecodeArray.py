@@ -0,0 +1,88 @@
+import sys
+sys.path.append("~/Documents/GitHub/Voices-Now-SRT-Generator")
+
+import unittest
+from ProTools.Timecode import Timecode, OffsetType
+from ProTools.TimecodeArray import TimecodeArray
+
+class TestTimecodeArray(unittest.TestCase):
+    def setUp(self):
+        self.strings = ["01:02:03:04", "01:02:03,167", "00:00:14:05", "00:00:00.500"]
+        self.timecodes = TimecodeArray.from_strings(self.strings, 24.0)
+        return
+
+    def test_from_strings_valid(self):
+        expected = [Timecode.from_string(timecode.replace(";", ":"), 24.0).get_total_frames()
+                    for timecode in self.strings]
+        self.assertEqual(self.timecodes.frames.tolist(), expected)
+        self.assertEqual(self.timecodes.frame_rate, 24.0)
+
+    def test_from_strings_invalid(self):
+        self.assertRaises(AssertionError, TimecodeArray.from_strings, ["fdsa"])
+        self.assertRaises(AssertionError, TimecodeArray.from_strings, ["11:12:13:14:15"])
+        self.assertRaises(AssertionError, TimecodeArray.from_strings, ["11;12;13;14"])
+        self.assertRaises(AssertionError, TimecodeArray.from_strings, ["00:00:00,0001"])
+
+    def test_from_timecodes(self):
+        timecodes = [Timecode.from_total_frames(frames, 24.0) for frames in [5, 1, 3]]
+        self.assertEqual(TimecodeArray.from_timecodes(timecodes).frames.tolist(), [5, 1, 3])
+
+    def test_offset(self):
+        offset = Timecode.from_total_frames(12, 24.0)
+        self.assertEqual(self.timecodes.offset(offset, OffsetType.ADVANCE).frames.tolist(),
+                         [89344, 89344, 329, 0])
+        self.assertEqual(self.timecodes.offset(offset, OffsetType.DELAY).frames.tolist(),
+                         [89368, 89368, 353, 24])
+        self.assertIs(self.timecodes.offset(None, OffsetType.NONE), self.timecodes)
+        self.assertRaises(AssertionError, self.timecodes.offset, Timecode(0, 0, 1, 0), OffsetType.ADVANCE)
+
+    def test_comparators(self):
+        timecode = Timecode.from_total_frames(341, 24.0)
+        self.assertEqual((self.timecodes == timecode).tolist(), [False, False, True, False])
+        self.assertEqual((self.timecodes < timecode).tolist(), [False, False, False, True])
+        self.assertEqual((self.timecodes >= timecode).tolist(), [True, True, True, False])
+
+    def test_sort(self):
+        self.assertEqual(self.timecodes.sort().frames.tolist(), [12, 341, 89356, 89356])
+        self.assertEqual(self.timecodes.argsort().tolist(), [3, 2, 0, 1])
+
+    def test_convert_to_milliseconds_format(self):
+        expected = [Timecode.from_string(timecode.replace(";", ":"), 24.0).convert_to_milliseconds_format()
+                    for timecode in self.strings]
+        self.assertEqual(self.timecodes.convert_to_milliseconds_format().tolist(), expected)
+
+    def test_convert_to_frames_format(self):
+        self.assertEqual(self.timecodes.convert_to_frames_format().tolist(),
+                         ["01:02:03:04", "01:02:03:04", "00:00:14:05", "00:00:00:12"])
+
+    def test_drop_frame(self):
+        timecodes = TimecodeArray.from_strings(["00:01:00;02", "00:10:00;00"], 29.97, True)
+        self.assertEqual(timecodes.frames.tolist(), [1800, 17982])
+        self.assertEqual(timecodes.convert_to_frames_format().tolist(), ["00:01:00;02", "00:10:00;00"])
+
+    def test_drop_frame_from_delimiter(self):
+        timecodes = TimecodeArray.from_strings(["00:01:00;02", "00:00:01,000"])
+        self.assertTrue(timecodes.drop_frame)
+        self.assertEqual(timecodes.frame_rate, 29.97)
+        self.assertEqual(timecodes.frames.tolist(), [1800, 30])
+
+        self.assertFalse(TimecodeArray.from_strings(["00:01:00:02"]).drop_frame)
+
+    def test_drop_frame_mismatch(self):
+        self.assertRaises(AssertionError, TimecodeArray.from_strings, ["00:01:00;02"], 29.97, False)
+        self.assertRaises(AssertionError, TimecodeArray.from_strings, ["00:01:00:02"], 29.97, True)
+        self.assertRaises(AssertionError, TimecodeArray.from_strings, ["00:01:00;02", "00:01:00:02"])
+
+    def test_invalid_drop_frame_labels(self):
+        self.assertRaises(AssertionError, TimecodeArray.from_strings, ["00:01:00;00"])
+        self.assertRaises(AssertionError, TimecodeArray.from_strings, ["00:00:00;00", "00:09:00;01"])
+        self.assertEqual(TimecodeArray.from_strings(["00:10:00;00", "00:01:01;00"]).frames.tolist(),
+                         [17982, 1828])
+
+    def test_indexing(self):
+        self.assertEqual(self.timecodes[2], Timecode.from_total_frames(341, 24.0))
+        self.assertEqual(len(self.timecodes[1:3]), 2)
+        self.assertEqual([str(timecode) for timecode in self.timecodes][0], "01:02:03:04")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+import sys
+sys.path.append("~/Documents/GitHub/Voices-Now-SRT-Generator")
+
+import unittest
+from Captions.TimeFormats.Timeline import Timeline
+from ProTools.EDL import EDL, States
+from ProTools.Marker import Marker, Units
+from ProTools.Timecode import Timecode
+
+def create_marker(name: str, seconds: int) -> Marker:
+    return Marker(int(name), Timecode(1, 0, seconds, 0), 0, Units.SAMPLES, name)
+
+class TestTimeline(unittest.TestCase):
+    def setUp(self):
+        self.timeline = Timeline("MRK")
+        self.timeline.append_list_to_end([create_marker("1", 0), create_marker("2", 10),
+                                          create_marker("3", 20)])
+
+    def get_loop_ids(self) -> list[str]:
+        return [node.get_loop_id() for node in self.timeline]
+
+    def test_indexing(self):
+        self.assertEqual(len(self.timeline), 3)
+        self.assertEqual(self.timeline[0].get_loop_id(), "1")
+        self.assertEqual(self.timeline[-1].get_loop_id(), "3")
+        self.assertEqual([node.get_loop_id() for node in self.timeline[1:]], ["2", "3"])
+
+        with self.assertRaises(AssertionError):
+            self.timeline[3]
+
+    def test_insert_by_start_time(self):
+        self.timeline.insert(create_marker("4", 15))
+        self.timeline.insert(create_marker("5", 0))
+        self.timeline.insert(create_marker("6", 30))
+
+        self.assertEqual(self.get_loop_ids(), ["1", "5", "2", "4", "3", "6"])
+
+    def test_links(self):
+        self.timeline.insert(create_marker("4", 15))
+
+        self.assertIs(self.timeline[1]._next, self.timeline[2])
+        self.assertIs(self.timeline[2]._previous, self.timeline[1])
+        self.assertEqual(self.timeline[1].get_end_time(), Timecode(1, 0, 15, 0))
+
+        self.timeline.remove_node_at_index(2)
+        self.assertEqual(self.timeline[1].get_end_time(), Timecode(1, 0, 20, 0))
+        self.assertIsNone(self.timeline[-1].get_end_time())
+
+    def test_iterate_current_node(self):
+        loop_ids = []
+        while self.timeline.should_continue():
+            loop_ids.append(self.timeline.iterate_current_node().get_loop_id())
+
+        self.assertEqual(loop_ids, ["1", "2", "3"])
+        self.assertIsNone(self.timeline.iterate_current_node())
+
+        self.timeline.reset()
+        self.assertTrue(self.timeline.should_continue())
+
+    def test_changes_while_iterating(self):
+        self.assertEqual(self.timeline.iterate_current_node().get_loop_id(), "1")
+        self.assertEqual(self.timeline.iterate_current_node().get_loop_id(), "2")
+
+        self.timeline.remove_node_at_start()
+        self.timeline.insert(create_marker("4", 5))
+
+        self.assertEqual(self.timeline.iterate_current_node().get_loop_id(), "3")
+        self.assertFalse(self.timeline.should_continue())
+
+    def test_remove(self):
+        self.timeline.remove_node_at_end()
+        self.assertEqual(self.get_loop_ids(), ["1", "2"])
+
+        self.timeline.remove_node_with_loop_id("1")
+        self.assertEqual(self.get_loop_ids(), ["2"])
+
+        with self.assertRaises(ValueError):
+            self.timeline.get_index_from_loop_id("1")
+
+        self.timeline.remove_node_at_start()
+        with self.assertRaises(AssertionError):
+            self.timeline.remove_node_at_start()
+
+    def test_edls(self):
+        timeline = Timeline("EDL")
+        timeline.append_list_to_end([EDL(1, 2, "B", Timecode(1, 0, 10, 0), Timecode(1, 0, 12, 0),
+                                         Timecode(0, 0, 2, 0), States.UNMUTED),
+                                     EDL(1, 1, "A", Timecode(1, 0, 0, 0), Timecode(1, 0, 2, 0),
+                                         Timecode(0, 0, 2, 0), States.UNMUTED)])
+
+        self.assertEqual([node.get_loop_id() for node in timeline], ["A", "B"])
+        self.assertEqual(timeline[1].get_end_time(), Timecode(1, 0, 12, 0))
+
+    def test_loop_id_index(self):
+        self.timeline.insert(create_marker("4", 5))
+
+        self.assertEqual(self.timeline.get_index_from_loop_id("2"), 2)
+        self.assertTrue(self.timeline.has_loop_id("4"))
+
+        self.timeline.remove_node_at_index(1)
+        self.assertFalse(self.timeline.has_loop_id("4"))
+        self.assertEqual(self.timeline.get_index_from_loop_id("3"), 2)
+
+    def test_duplicate_loop_ids(self):
+        timeline = Timeline("EDL")
+        timeline.append_list_to_end([EDL(channel, 1, "A", Timecode(1, 0, seconds, 0),
+                                         Timecode(1, 0, seconds + 2, 0), Timecode(0, 0, 2, 0),
+                                         States.UNMUTED)
+                                     for channel, seconds in ((1, 10), (2, 0), (1, 0), (2, 20))])
+        timeline.insert(EDL(1, 2, "B", Timecode(1, 0, 5, 0), Timecode(1, 0, 6, 0),
+                            Timecode(0, 0, 1, 0), States.UNMUTED))
+
+        self.assertEqual(timeline.get_indices_from_loop_id("A"), [0, 1, 3, 4])
+        self.assertEqual(timeline.get_index_from_loop_id("B"), 2)
+        self.assertEqual([node.get_start_time() for node in timeline.get_nodes_with_loop_id("A")],
+                         [Timecode(1, 0, 0, 0), Timecode(1, 0, 0, 0), Timecode(1, 0, 10, 0),
+                          Timecode(1, 0, 20, 0)])
+
+        timeline.remove_node_with_loop_id("A")
+        self.assertEqual(timeline.get_indices_from_loop_id("A"), [0, 2, 3])
+
+        timeline.remove_nodes_with_loop_id("A")
+        self.assertEqual([node.get_loop_id() for node in timeline], ["B"])
+        self.assertFalse(timeline.has_loop_id("A"))
+
+    def test_loop_ids_with_same_start(self):
+        timeline = Timeline("MRK")
+        timeline.append_list_to_end([create_marker(str(id), 0) for id in range(1, 101)])
+        timeline.insert(create_marker("101", 0))
+        timeline.remove_node_at_index(0)
+
+        self.assertEqual(timeline.get_index_from_loop_id("2"), 0)
+        self.assertEqual(timeline.get_index_from_loop_id("100"), 98)
+        self.assertEqual(timeline.get_index_from_loop_id("101"), 99)
+
+    def test_finalize(self):
+        self.assertFalse(self.timeline.is_finalized())
+
+        self.timeline.finalize(Timecode(0, 0, 4, 0))
+
+        self.assertTrue(self.timeline.is_finalized())
+        self.assertEqual([node.get_end_time() for node in self.timeline],
+                         [Timecode(1, 0, 10, 0), Timecode(1, 0, 20, 0), Timecode(1, 0, 24, 0)])
+        self.assertEqual(list(self.timeline.start_frames),
+                         [Timecode(1, 0, seconds, 0).get_total_frames() for seconds in (0, 10, 20)])
+        self.assertEqual(list(self.timeline.end_frames),
+                         [Timecode(1, 0, seconds, 0).get_total_frames() for seconds in (10, 20, 24)])
+
+    def test_finalize_without_tail(self):
+        self.timeline.finalize()
+
+        self.assertIsNone(self.timeline[-1].get_end_time())
+        self.assertEqual(self.timeline.end_frames[-1], -1)
+
+    def test_changes_clear_finalized_end_times(self):
+        self.timeline.finalize(Timecode(0, 0, 4, 0))
+
+        self.timeline.insert(create_marker("4", 15))
+        self.assertFalse(self.timeline.is_finalized())
+        self.assertEqual(self.timeline[1].get_end_time(), Timecode(1, 0, 15, 0))
+
+        self.timeline.insert(create_marker("5", 30))
+        self.assertEqual(self.timeline[3].get_end_time(), Timecode(1, 0, 30, 0))
+
+        self.timeline.finalize()
+        self.timeline.remove_node_at_index(2)
+        self.assertEqual(self.timeline[1].get_end_time(), Timecode(1, 0, 20, 0))
+
+    def test_end_time_of_next_node(self):
+        timeline = Timeline("MRK")
+        timeline.append_list_to_end([create_marker("1", 0), create_marker("2", 10)])
+
+        self.assertEqual(timeline[0].get_end_time(), Timecode(1, 0, 10, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
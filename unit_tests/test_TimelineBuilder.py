@@ -0,0 +1,124 @@
+import sys
+sys.path.append("~/Documents/GitHub/Voices-Now-SRT-Generator")
+
+import os
+import tempfile
+import unittest
+from Captions.TimeFormats.TimelineBuilder import TimelineBuilder, TimelineSource, Provenance
+from ProTools.EDL import EDL, States
+from ProTools.EDLTable import EDLTable
+from ProTools.Marker import Marker, Units
+from ProTools.Session import Session
+from ProTools.Timecode import Timecode, OffsetType
+from unit_tests.test_Session import SESSION_TEXT
+
+def create_markers(*locations: tuple[str, int]) -> list[Marker]:
+    return [Marker(id, Timecode(1, 0, seconds, 0), 0, Units.SAMPLES, name)
+            for id, (name, seconds) in enumerate(locations, 1)]
+
+def create_edl(event: int, name: str, start: int, end: int) -> EDL:
+    return EDL(1, event, name, Timecode(1, 0, start, 0), Timecode(1, 0, end, 0),
+               Timecode(0, 0, end - start, 0), States.UNMUTED)
+
+class TestTimelineBuilder(unittest.TestCase):
+    def setUp(self):
+        self.first = create_markers(("101", 0), ("102", 20), ("103", 40))
+        self.second = create_markers(("201", 10), ("202", 30))
+
+    def test_merge_in_start_order(self):
+        builder = TimelineBuilder().add_items("A", self.first).add_items("B", self.second)
+        timeline = builder.build(Timecode(0, 0, 5, 0))
+
+        self.assertEqual([node.get_loop_id() for node in timeline], ["101", "201", "102", "202", "103"])
+        self.assertEqual(timeline[1].get_end_time(), Timecode(1, 0, 20, 0))
+        self.assertEqual(timeline[-1].get_end_time(), Timecode(1, 0, 45, 0))
+
+    def test_renumber_and_provenance(self):
+        builder = TimelineBuilder().add_items("A", self.first).add_items("B", self.second)
+        builder.build()
+
+        self.assertEqual(sorted(builder.provenance.keys()), [1, 2, 3, 4, 5])
+        self.assertEqual(builder.get_provenance(2), Provenance("B", 0, 1))
+        self.assertEqual(builder.get_provenance(5), Provenance("A", 2, 3))
+
+    def test_unsorted_source(self):
+        builder = (TimelineBuilder()
+                   .add_items("A", create_markers(("a1", 30), ("a2", 0)))
+                   .add_items("B", create_markers(("b1", 10))))
+        timeline = builder.build()
+
+        self.assertEqual([node.get_loop_id() for node in timeline], ["a2", "b1", "a1"])
+        self.assertEqual([builder.get_provenance(id) for id in [1, 2, 3]],
+                         [Provenance("A", 1, 2), Provenance("B", 0, 1), Provenance("A", 0, 1)])
+
+    def test_sources_are_unchanged(self):
+        builder = TimelineBuilder().add_items("A", self.first, Timecode(1, 0, 0, 0))
+        timeline = builder.build(first_id=10)
+
+        self.assertEqual(timeline[0].get_start_time(), Timecode(2, 0, 0, 0))
+        self.assertEqual([marker.id for marker in self.first], [1, 2, 3])
+        self.assertEqual(self.first[0].location, Timecode(1, 0, 0, 0))
+        self.assertEqual(list(builder.provenance.keys()), [10, 11, 12])
+
+    def test_offsets(self):
+        builder = (TimelineBuilder()
+                   .add_items("A", self.first, Timecode(0, 0, 15, 0), OffsetType.DELAY)
+                   .add_items("B", self.second, Timecode(0, 0, 10, 0), OffsetType.ADVANCE))
+        timeline = builder.build()
+
+        self.assertEqual([(node.get_loop_id(), node.get_start_time()) for node in timeline],
+                         [("201", Timecode(1, 0, 0, 0)), ("101", Timecode(1, 0, 15, 0)),
+                          ("202", Timecode(1, 0, 20, 0)), ("102", Timecode(1, 0, 35, 0)),
+                          ("103", Timecode(1, 0, 55, 0))])
+
+    def test_ties_keep_source_order(self):
+        builder = (TimelineBuilder().add_items("A", create_markers(("101", 10)))
+                   .add_items("B", create_markers(("201", 10))))
+
+        self.assertEqual([node.get_loop_id() for node in builder.build()], ["101", "201"])
+
+    def test_edl_channels(self):
+        first = [create_edl(1, "A", 0, 5), create_edl(2, "C", 20, 25)]
+        second = EDLTable.from_edls([create_edl(1, "B", 10, 15)])
+        builder = TimelineBuilder("EDL").add_items("DIA", first).add_items("MX", second)
+        timeline = builder.build()
+
+        self.assertEqual([node.get_loop_id() for node in timeline], ["A", "B", "C"])
+        self.assertEqual(timeline[1].get_end_time(), Timecode(1, 0, 15, 0))
+        self.assertEqual(builder.get_provenance(2), Provenance("MX", 0, 1))
+        self.assertEqual(first[1].event, 2)
+
+    def test_sessions(self):
+        handle, filename = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(handle, "w") as session_file:
+            session_file.write(SESSION_TEXT)
+
+        try:
+            session = Session.from_file(filename)
+        finally:
+            os.remove(filename)
+
+        builder = (TimelineBuilder().add_session("Reel 1", session)
+                   .add_session("Reel 2", session, Timecode(0, 0, 3, 0)))
+        timeline = builder.build()
+
+        self.assertEqual([node.get_loop_id() for node in timeline], ["101", "101", "102", "102"])
+        self.assertEqual([provenance.source for provenance in builder.provenance.values()],
+                         ["Reel 1", "Reel 2", "Reel 1", "Reel 2"])
+
+        builder = (TimelineBuilder("EDL").add_session("Reel 1", session, track="MX", channel=1)
+                   .add_session("Reel 2", session, Timecode(0, 0, 3, 0), track="DIA"))
+        self.assertEqual([node.get_loop_id() for node in builder.build()], ["MX_01.R", "101", "102"])
+
+        with self.assertRaises(AssertionError):
+            TimelineSource.from_session("A", session, "EDL", track="FX")
+
+    def test_invalid_data_type(self):
+        with self.assertRaises(AssertionError):
+            TimelineBuilder("CSV")
+        with self.assertRaises(ValueError):
+            TimelineSource.from_session("A", None, "CSV")
+
+
+if __name__ == '__main__':
+    unittest.main()